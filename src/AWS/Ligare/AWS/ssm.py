@@ -1,14 +1,392 @@
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from dataclasses import dataclass
 from logging import Logger
 from os import environ
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Sequence, Type, TypeVar, Union, cast
 
-from boto3.session import Session
-from Ligare.programming.collections.dict import AnyDict
+from Ligare.programming.collections.dict import AnyDict, merge
+from typing_extensions import final
+
+if TYPE_CHECKING:
+    from boto3.session import Session
 
 TConfig = TypeVar("TConfig")
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+
+def __getattr__(name: str) -> Any:
+    # `Session` used to be imported here eagerly. It is still
+    # available from this module, but boto3 is not imported
+    # until it is asked for.
+    if name == "Session":
+        from boto3.session import Session
+
+        return Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@final
+@dataclass(frozen=True)
+class _HierarchyParameter:
+    value: Any
+    version: tuple[Any, Any]
+
+    @staticmethod
+    def from_response(parameter: dict[str, Any]) -> "_HierarchyParameter":
+        value: Any = parameter["Value"]
+        if parameter.get("Type") == "StringList":
+            value = value.split(",")
+        else:
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        return _HierarchyParameter(
+            value, (parameter.get("LastModifiedDate"), parameter.get("Version"))
+        )
+
+
+def _nest_parameters(path: str, parameters: dict[str, _HierarchyParameter]) -> AnyDict:
+    nested: AnyDict = {}
+    prefix = path.rstrip("/") + "/"
+    for name, parameter in sorted(parameters.items()):
+        *parents, key = name.removeprefix(prefix).strip("/").split("/")
+        values = nested
+        for parent in parents:
+            values = values.setdefault(parent, {})
+        values[key] = parameter.value
+    return nested
+
+
+@final
+class SSMParameterCache:
+    """
+    An encrypted file that keeps loaded SSM parameters between
+    application restarts, so restarts do not wait on SSM.
+
+    The file is encrypted with a `Fernet <https://cryptography.io/en/latest/fernet/>`_
+    key, which requires the `cryptography` package. Keep the key out of
+    the file system the cache is written to, e.g. in an environment variable.
+    """
+
+    def __init__(self, filename: str | os.PathLike[str], key: str | bytes, ttl: float):
+        """
+        :param str | os.PathLike[str] filename: The cache file.
+        :param str | bytes key: A key created with `cryptography.fernet.Fernet.generate_key()`.
+        :param float ttl: Seconds after it is written that the cache is ignored.
+        """
+        super().__init__()
+        from cryptography.fernet import Fernet
+
+        self.path = Path(filename)
+        self.ttl = ttl
+        self._fernet = Fernet(key)
+        self._log = logging.getLogger(__name__)
+
+    def get(self, paths: Sequence[str]) -> dict[str, list[str]] | None:
+        """
+        Get the cached parameter values of `paths`.
+
+        :param Sequence[str] paths: The SSM parameter paths.
+        :return dict[str, list[str]] | None: The values of the parameters under each path,
+            or `None` if the cache is missing, expired, unreadable, or is for other paths.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            token = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._log.warning(
+                f"Failed to read SSM parameter cache {self.path}.", exc_info=e
+            )
+            return None
+
+        try:
+            # Fernet tokens include the time they were created,
+            # and `ttl` rejects tokens older than that.
+            cached = json.loads(self._fernet.decrypt(token, ttl=int(self.ttl)))
+        except (InvalidToken, ValueError):
+            return None
+
+        if cached.get("paths") != list(paths):
+            return None
+        return cached["parameters"]
+
+    def set(self, paths: Sequence[str], parameters: dict[str, list[str]]) -> None:
+        """
+        Write the parameter values of `paths` to the cache.
+
+        Failing to write the cache is logged and otherwise ignored.
+
+        :param Sequence[str] paths: The SSM parameter paths.
+        :param dict[str, list[str]] parameters: The values of the parameters under each path.
+        """
+        token = self._fernet.encrypt(
+            json.dumps({"paths": list(paths), "parameters": parameters}).encode()
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as file:
+                _ = file.write(token)
+            os.chmod(file.name, 0o600)
+            os.replace(file.name, self.path)
+        except OSError as e:
+            self._log.warning(
+                f"Failed to write SSM parameter cache {self.path}.", exc_info=e
+            )
+
+
+@final
+class SSMParameterLoader:
+    """
+    Loads the parameters under SSM parameter paths.
+
+    A loader creates one SSM client, which is shared by every load
+    and by the threads that load multiple paths concurrently. Use
+    :func:`get_ssm_parameter_loader` to share loaders in a process.
+    """
+
+    def __init__(
+        self,
+        profile_name: str | None = None,
+        region_name: str | None = None,
+        ttl: float = 0,
+        cache: SSMParameterCache | None = None,
+        max_workers: int = 8,
+        _session: "Type[Session] | None" = None,
+    ) -> None:
+        """
+        :param str | None profile_name: The AWS profile.
+        :param str | None region_name: The AWS region.
+        :param float ttl: Seconds that loaded parameters are reused by later loads
+            in the same process. If 0, every load gets the parameters from SSM or `cache`.
+        :param SSMParameterCache | None cache: A file cache used when parameters are not
+            loaded in this process yet.
+        :param int max_workers: The most paths loaded at the same time.
+        """
+        super().__init__()
+        self._profile_name = profile_name
+        self._region_name = region_name
+        self._ttl = ttl
+        self._cache = cache
+        self._max_workers = max_workers
+        self._session = _session
+        self._client: Any = None
+        self._loaded: dict[tuple[str, ...], tuple[float, dict[str, list[str]]]] = {}
+        self._hierarchies: dict[str, dict[str, _HierarchyParameter]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """
+        The SSM client.
+        """
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    session_type = self._session
+                    if session_type is None:
+                        # boto3 takes a noticeable amount of time to import,
+                        # so it is not imported until SSM is actually used.
+                        from boto3.session import Session
+
+                        session_type = Session
+
+                    # boto3 sessions are not thread-safe, but their clients are
+                    session = session_type(
+                        profile_name=self._profile_name, region_name=self._region_name
+                    )
+                    self._client = session.client("ssm")  # pyright: ignore[reportUnknownMemberType]
+        return self._client
+
+    def _load_path(self, path: str) -> list[str]:
+        values: list[str] = []
+        paginator = self.client.get_paginator("get_parameters_by_path")
+        for page in paginator.paginate(Path=path, WithDecryption=True):
+            values.extend(
+                parameter["Value"]
+                for parameter in sorted(
+                    page.get("Parameters", []), key=lambda parameter: parameter["Name"]
+                )
+            )
+        return values
+
+    def load(self, paths: Sequence[str]) -> dict[str, list[str]]:
+        """
+        Get the values of the parameters directly under each path, decrypted.
+
+        :param Sequence[str] paths: The SSM parameter paths.
+        :return dict[str, list[str]]: The values under each path, ordered by parameter name.
+        """
+        key = tuple(paths)
+        if self._ttl > 0:
+            loaded = self._loaded.get(key)
+            if loaded is not None and loaded[0] > time.monotonic():
+                return loaded[1]
+
+        parameters = self._cache.get(paths) if self._cache is not None else None
+
+        if parameters is None:
+            parameters = dict(zip(paths, self._map(self._load_path, paths)))
+
+            if self._cache is not None:
+                self._cache.set(paths, parameters)
+
+        if self._ttl > 0:
+            self._loaded[key] = (time.monotonic() + self._ttl, parameters)
+
+        return parameters
+
+    def _map(
+        self, function: Callable[[TItem], TResult], items: Sequence[TItem]
+    ) -> list[TResult]:
+        if len(items) < 2:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(items))
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def _get_hierarchy(self, path: str) -> dict[str, _HierarchyParameter]:
+        parameters: dict[str, _HierarchyParameter] = {}
+        paginator = self.client.get_paginator("get_parameters_by_path")
+        for page in paginator.paginate(Path=path, Recursive=True, WithDecryption=True):
+            for parameter in page.get("Parameters", []):
+                parameters[parameter["Name"]] = _HierarchyParameter.from_response(
+                    parameter
+                )
+        return parameters
+
+    def _update_hierarchy(
+        self, path: str, parameters: dict[str, _HierarchyParameter]
+    ) -> dict[str, _HierarchyParameter]:
+        # `describe_parameters` gets when each parameter last changed
+        # without getting or decrypting its value, so only the values
+        # of the parameters that changed are requested.
+        versions: dict[str, tuple[Any, Any]] = {}
+        paginator = self.client.get_paginator("describe_parameters")
+        for page in paginator.paginate(
+            ParameterFilters=[{"Key": "Path", "Option": "Recursive", "Values": [path]}]
+        ):
+            for parameter in page.get("Parameters", []):
+                versions[parameter["Name"]] = (
+                    parameter.get("LastModifiedDate"),
+                    parameter.get("Version"),
+                )
+
+        changed = [
+            name
+            for name, version in versions.items()
+            if name not in parameters or parameters[name].version != version
+        ]
+        updated = {name: parameters[name] for name in versions if name not in changed}
+
+        def get_parameters(names: list[str]) -> list[dict[str, Any]]:
+            return self.client.get_parameters(Names=names, WithDecryption=True).get(
+                "Parameters", []
+            )
+
+        # `get_parameters` accepts at most 10 names
+        batches = [changed[i : i + 10] for i in range(0, len(changed), 10)]
+        for batch in self._map(get_parameters, batches):
+            for parameter in batch:
+                updated[parameter["Name"]] = _HierarchyParameter.from_response(
+                    parameter
+                )
+
+        return updated
+
+    def load_hierarchy(self, paths: Sequence[str]) -> list[AnyDict]:
+        """
+        Get the parameters under each path, and every path below it,
+        as dictionaries nested by the parameters' names.
+
+        A parameter named `/app/flask/session/cookie/name` under the path `/app`
+        becomes `{"flask": {"session": {"cookie": {"name": value}}}}`. Values that
+        are valid JSON, like `true` or `5`, are parsed, and `StringList` values are
+        split into lists.
+
+        The first load of a path gets every parameter under it. Later loads
+        by the same loader only get the values of parameters that changed
+        since, and otherwise reuse the values they already have.
+
+        :param Sequence[str] paths: The SSM parameter paths.
+        :return list[AnyDict]: The parameters under each path, in the order of `paths`.
+        """
+
+        def load(path: str) -> dict[str, _HierarchyParameter]:
+            parameters = self._hierarchies.get(path)
+            if parameters is None:
+                parameters = self._get_hierarchy(path)
+            else:
+                parameters = self._update_hierarchy(path, parameters)
+            self._hierarchies[path] = parameters
+            return parameters
+
+        hierarchies = self._map(load, paths)
+        return [
+            _nest_parameters(path, parameters)
+            for path, parameters in zip(paths, hierarchies)
+        ]
+
+
+_ssm_parameter_loaders: dict[tuple[Any, ...], SSMParameterLoader] = {}
+_ssm_parameter_loaders_lock = threading.Lock()
+
+
+def get_ssm_parameter_loader(
+    profile_name: str | None = None,
+    region_name: str | None = None,
+    ttl: float = 0,
+    cache: SSMParameterCache | None = None,
+    _session: "Type[Session] | None" = None,
+) -> SSMParameterLoader:
+    """
+    Get the process's `SSMParameterLoader` for an AWS profile and region,
+    creating it the first time it is requested.
+
+    :param str | None profile_name: The AWS profile.
+    :param str | None region_name: The AWS region.
+    :param float ttl: Passed to a new `SSMParameterLoader`.
+    :param SSMParameterCache | None cache: Passed to a new `SSMParameterLoader`.
+    :return SSMParameterLoader:
+    """
+    key = (
+        profile_name,
+        region_name,
+        ttl,
+        None if cache is None else (cache.path, cache.ttl),
+        _session,
+    )
+    with _ssm_parameter_loaders_lock:
+        loader = _ssm_parameter_loaders.get(key)
+        if loader is None:
+            loader = _ssm_parameter_loaders[key] = SSMParameterLoader(
+                profile_name, region_name, ttl, cache, _session=_session
+            )
+    return loader
+
+
+def clear_ssm_parameter_loaders() -> None:
+    """
+    Forget the loaders created by `get_ssm_parameter_loader`,
+    along with their clients and loaded parameters.
+    """
+    with _ssm_parameter_loaders_lock:
+        _ssm_parameter_loaders.clear()
 
 
 class SSMParameters:
@@ -50,8 +428,58 @@ class SSMParameters:
             or None
         )
 
+    def _get_parameter_cache(self) -> SSMParameterCache | None:
+        filename = self._config_safe_get("SSM", "CacheFilename")
+        if not filename:
+            return None
+
+        key_variable = (
+            self._config_safe_get("SSM", "CacheKeyEnvironmentVariable")
+            or "LIGARE_SSM_CACHE_KEY"
+        )
+        key = environ.get(key_variable)
+        if not key:
+            self._log.warning(
+                f"SSM CacheFilename is set, but the cache key variable {key_variable} is not. Not caching SSM parameters."
+            )
+            return None
+
+        try:
+            return SSMParameterCache(
+                filename,
+                key,
+                float(self._config_safe_get("SSM", "CacheFileTTL") or 3600),
+            )
+        except ImportError:
+            self._log.warning(
+                "SSM CacheFilename is set, but `cryptography` is not installed. Not caching SSM parameters."
+            )
+            return None
+
+    def _decode_json_parameters(self, path: str, values: list[str]) -> list[AnyDict]:
+        """
+        Decode the parameter values under `path` that are JSON objects of
+        application settings. Other parameters can share the path, so values
+        that are not JSON objects are logged and skipped.
+        """
+        settings: list[AnyDict] = []
+        for value in values:
+            if not value:
+                continue
+            try:
+                decoded = json.loads(value)
+            except ValueError:
+                decoded = None
+            if not isinstance(decoded, dict):
+                self._log.warning(
+                    f"Skipping an SSM parameter under {path} that is not a JSON object."
+                )
+                continue
+            settings.append(cast(AnyDict, decoded))
+        return settings
+
     def load_ssm_application_parameters(
-        self, _session: Type[Session] = Session
+        self, _session: "Type[Session] | None" = None
     ) -> AnyDict | None:
         _ = self._config.read("aws-ssm.ini")
 
@@ -88,35 +516,43 @@ class SSMParameters:
 
         SSM_PARAMETERS_EMPTY_MSG = f"No SSM parameters were found to start the application with. Ensure {SSM_PARAMETERS_PATH} is not empty."
 
-        parameters: Optional[List[Dict[str, str]]]
+        parameter_paths = [
+            path.strip() for path in SSM_PARAMETERS_PATH.split(",") if path.strip()
+        ]
+        hierarchical = (
+            self._config_safe_get("SSM", "ParameterFormat") or "JSON"
+        ).lower() == "hierarchical"
         try:
-            session = _session(
-                profile_name=AWS_PROFILE_NAME, region_name=AWS_REGION_NAME
-            )
-            client = cast(Any, session.client("ssm"))  # pyright: ignore[reportUnknownMemberType]
-            parameters = cast(
-                list[dict[Any, Any]],
-                client.get_parameters_by_path(
-                    Path=SSM_PARAMETERS_PATH, WithDecryption=True, MaxResults=1
-                ).get("Parameters"),
+            loader = get_ssm_parameter_loader(
+                AWS_PROFILE_NAME,
+                AWS_REGION_NAME,
+                ttl=float(self._config_safe_get("SSM", "CacheTTL") or 0),
+                cache=self._get_parameter_cache(),
+                _session=_session,
             )
+            if hierarchical:
+                path_settings = loader.load_hierarchy(parameter_paths)
+            else:
+                parameters = loader.load(parameter_paths)
+                path_settings = [
+                    settings
+                    for path in parameter_paths
+                    for settings in self._decode_json_parameters(
+                        path, parameters.get(path, [])
+                    )
+                ]
         except Exception as _:
             return self._log_and_conditionally_fail(
                 f"Skipping SSM parameter lookup.", logging.WARNING
             )
 
-        if not parameters:
-            return self._log_and_conditionally_fail(SSM_PARAMETERS_EMPTY_MSG)
-
-        application_settings_json = parameters[0].get("Value")
+        # settings from later paths override those from earlier paths.
+        application_settings: AnyDict = {}
+        for settings in path_settings:
+            _ = merge(application_settings, settings)
 
         # the application doesn't need to provide any settings
         # through SSM, so do something else instead
-        if not application_settings_json:
-            return self._log_and_conditionally_fail(SSM_PARAMETERS_EMPTY_MSG)
-
-        application_settings = json.loads(application_settings_json)
-
         if not application_settings:
             return self._log_and_conditionally_fail(SSM_PARAMETERS_EMPTY_MSG)
 
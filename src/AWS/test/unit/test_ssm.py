@@ -0,0 +1,285 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Generator
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from cryptography.fernet import Fernet
+from Ligare.AWS.ssm import (
+    SSMParameterCache,
+    SSMParameterLoader,
+    SSMParameters,
+    clear_ssm_parameter_loaders,
+)
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture(autouse=True)
+def _clear_ssm_parameter_loaders() -> Generator[None, None, None]:
+    yield
+    clear_ssm_parameter_loaders()
+
+
+@pytest.fixture
+def ssm_client() -> Any:
+    return boto3.session.Session(
+        region_name="us-west-2",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    ).client("ssm")
+
+
+def _session_type(client: Any) -> Any:
+    class Session:
+        created = 0
+
+        def __init__(self, profile_name: str | None, region_name: str | None):
+            Session.created += 1
+
+        def client(self, service_name: str) -> Any:
+            return client
+
+    return Session
+
+
+def _parameter(name: str, value: Any) -> dict[str, Any]:
+    return {"Name": name, "Value": json.dumps(value), "Type": "SecureString"}
+
+
+def _add_response(
+    stubber: Stubber,
+    path: str,
+    parameters: list[dict[str, Any]],
+    next_token: str | None = None,
+    token: str | None = None,
+) -> None:
+    response: dict[str, Any] = {"Parameters": parameters}
+    expected_params: dict[str, Any] = {"Path": path, "WithDecryption": True}
+    if next_token:
+        response["NextToken"] = next_token
+    if token:
+        expected_params["NextToken"] = token
+    stubber.add_response("get_parameters_by_path", response, expected_params)
+
+
+def test__SSMParameterLoader__load__gets_every_page(ssm_client: Any):
+    with Stubber(ssm_client) as stubber:
+        _add_response(stubber, "/app", [_parameter("/app/a", {"a": 1})], "next")
+        _add_response(stubber, "/app", [_parameter("/app/b", {"b": 2})], token="next")
+
+        loader = SSMParameterLoader(_session=_session_type(ssm_client))
+        parameters = loader.load(["/app"])
+
+        stubber.assert_no_pending_responses()
+
+    assert parameters == {"/app": ['{"a": 1}', '{"b": 2}']}
+
+
+def test__SSMParameterLoader__load__gets_paths_with_one_client(mocker: MockerFixture):
+    client = mocker.MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = lambda Path, **_: [  # pyright: ignore[reportUnknownLambdaType]
+        {"Parameters": [{"Name": f"{Path}/x", "Value": Path}]}
+    ]
+    session_type = _session_type(client)
+
+    loader = SSMParameterLoader(_session=session_type)
+    parameters = loader.load(["/a", "/b", "/c"])
+
+    assert parameters == {"/a": ["/a"], "/b": ["/b"], "/c": ["/c"]}
+    assert session_type.created == 1
+
+
+def test__SSMParameterLoader__load__reuses_parameters_within_ttl(ssm_client: Any):
+    with Stubber(ssm_client) as stubber:
+        _add_response(stubber, "/app", [_parameter("/app/a", {"a": 1})])
+
+        loader = SSMParameterLoader(ttl=60, _session=_session_type(ssm_client))
+        first = loader.load(["/app"])
+        second = loader.load(["/app"])
+
+    assert first is second
+
+
+def test__SSMParameterCache__get__returns_set_parameters(tmp_path: Path):
+    cache = SSMParameterCache(tmp_path / "ssm", Fernet.generate_key(), ttl=60)
+    cache.set(["/app"], {"/app": ["value"]})
+
+    assert cache.get(["/app"]) == {"/app": ["value"]}
+    assert cache.get(["/other"]) is None
+    assert b"value" not in (tmp_path / "ssm").read_bytes()
+
+
+def test__SSMParameterCache__get__ignores_expired_cache(
+    tmp_path: Path, mocker: MockerFixture
+):
+    cache = SSMParameterCache(tmp_path / "ssm", Fernet.generate_key(), ttl=60)
+    cache.set(["/app"], {"/app": ["value"]})
+
+    _ = mocker.patch("cryptography.fernet.time.time", return_value=time.time() + 120)
+
+    assert cache.get(["/app"]) is None
+
+
+def test__SSMParameterLoader__load__uses_file_cache(
+    tmp_path: Path, mocker: MockerFixture
+):
+    cache = SSMParameterCache(tmp_path / "ssm", Fernet.generate_key(), ttl=60)
+    cache.set(["/app"], {"/app": ["value"]})
+    client = mocker.MagicMock()
+
+    loader = SSMParameterLoader(cache=cache, _session=_session_type(client))
+
+    assert loader.load(["/app"]) == {"/app": ["value"]}
+    client.get_paginator.assert_not_called()
+
+
+def test__SSMParameters__load_ssm_application_parameters__merges_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+):
+    _ = (tmp_path / "aws-ssm.ini").write_text(
+        "[DEFAULT]\n"
+        "UseSSMConfigParameters = True\n"
+        "[SSM]\n"
+        "EnvironmentParametersPath = /shared, /app\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    responses = {
+        "/shared": [_parameter("/shared/a", {"a": {"x": 1, "y": 1}})],
+        "/app": [_parameter("/app/a", {"a": {"y": 2}, "b": 3})],
+    }
+    client = mocker.MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = lambda Path, **_: [  # pyright: ignore[reportUnknownLambdaType]
+        {"Parameters": responses[Path]}
+    ]
+
+    parameters = SSMParameters().load_ssm_application_parameters(_session_type(client))
+
+    assert parameters == {"a": {"x": 1, "y": 2}, "b": 3}
+
+
+def test__SSMParameters__load_ssm_application_parameters__skips_parameters_that_are_not_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+):
+    _ = (tmp_path / "aws-ssm.ini").write_text(
+        "[DEFAULT]\n"
+        "UseSSMConfigParameters = True\n"
+        "[SSM]\n"
+        "EnvironmentParametersPath = /app\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    client = mocker.MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                _parameter("/app/config", {"a": 1}),
+                {"Name": "/app/token", "Value": "not json", "Type": "SecureString"},
+            ]
+        }
+    ]
+
+    parameters = SSMParameters().load_ssm_application_parameters(_session_type(client))
+
+    assert parameters == {"a": 1}
+
+
+class FakeSSMClient:
+    def __init__(self, parameters: dict[str, tuple[str, str]]) -> None:
+        self.parameters = parameters
+        self.versions = dict.fromkeys(parameters, 1)
+        self.requested_names: list[str] = []
+
+    def change(self, name: str, value: str, type: str = "String") -> None:
+        self.parameters[name] = (value, type)
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def _response(self, name: str, with_value: bool) -> dict[str, Any]:
+        value, type = self.parameters[name]
+        response = {
+            "Name": name,
+            "Type": type,
+            "Version": self.versions[name],
+            "LastModifiedDate": self.versions[name],
+        }
+        if with_value:
+            response["Value"] = value
+        return response
+
+    def get_paginator(self, operation_name: str) -> Any:
+        client = self
+
+        class Paginator:
+            def paginate(self, **kwargs: Any) -> list[dict[str, Any]]:
+                if operation_name == "get_parameters_by_path":
+                    path = kwargs["Path"]
+                    with_value = True
+                else:
+                    path = kwargs["ParameterFilters"][0]["Values"][0]
+                    with_value = False
+                names = [name for name in client.parameters if name.startswith(path)]
+                client.requested_names.extend(names if with_value else [])
+                # one parameter per page
+                return [
+                    {"Parameters": [client._response(name, with_value)]}
+                    for name in names
+                ]
+
+        return Paginator()
+
+    def get_parameters(self, Names: list[str], WithDecryption: bool) -> dict[str, Any]:
+        assert len(Names) <= 10
+        self.requested_names.extend(Names)
+        return {"Parameters": [self._response(name, True) for name in Names]}
+
+
+def test__SSMParameterLoader__load_hierarchy__nests_parameters():
+    client = FakeSSMClient({
+        "/app/flask/app_name": ("test", "String"),
+        "/app/flask/session/permanent": ("true", "String"),
+        "/app/web/security/cors/origins": ("a,b", "StringList"),
+    })
+    loader = SSMParameterLoader(_session=_session_type(client))
+
+    assert loader.load_hierarchy(["/app"]) == [
+        {
+            "flask": {"app_name": "test", "session": {"permanent": True}},
+            "web": {"security": {"cors": {"origins": ["a", "b"]}}},
+        }
+    ]
+
+
+def test__SSMParameterLoader__load_hierarchy__reloads_changed_parameters():
+    client = FakeSSMClient({f"/app/values/{i}": (str(i), "String") for i in range(15)})
+    loader = SSMParameterLoader(_session=_session_type(client))
+    _ = loader.load_hierarchy(["/app"])
+    client.requested_names.clear()
+
+    client.change("/app/values/3", "changed")
+    client.change("/app/new", "new")
+    del client.parameters["/app/values/0"]
+    [values] = loader.load_hierarchy(["/app"])
+
+    assert sorted(client.requested_names) == ["/app/new", "/app/values/3"]
+    assert values["new"] == "new"
+    assert values["values"]["3"] == "changed"
+    assert "0" not in values["values"]
+    assert values["values"]["14"] == 14
+
+
+def test__SSMParameters__load_ssm_application_parameters__loads_hierarchy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    _ = (tmp_path / "aws-ssm.ini").write_text(
+        "[DEFAULT]\n"
+        "UseSSMConfigParameters = True\n"
+        "[SSM]\n"
+        "EnvironmentParametersPath = /app\n"
+        "ParameterFormat = Hierarchical\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    client = FakeSSMClient({"/app/flask/app_name": ("test", "String")})
+
+    parameters = SSMParameters().load_ssm_application_parameters(_session_type(client))
+
+    assert parameters == {"flask": {"app_name": "test"}}
@@ -2,7 +2,7 @@
 :ref:`Ligare.database`'s integration with :ref:`Ligare.programming.config`.
 """
 
-from typing import Any
+from typing import Any, ClassVar, Literal
 
 from Ligare.programming.config import AbstractConfig
 from pydantic import BaseModel
@@ -27,9 +27,174 @@ class PostgreSQLDatabaseConnectArgsConfig(DatabaseConnectArgsConfig):
     options: str = ""
 
 
+class SQLitePerformanceConfig(BaseModel):
+    """
+    The PRAGMAs, statement cache, and connection pool of SQLite engines.
+
+    The `performance` profile suits a database file used by one node: it
+    writes through a write-ahead log, syncs less often, memory-maps the file,
+    keeps a larger page cache and temporary tables in memory, and pools
+    connections to database files so they are reused across threads. Options
+    that are set override the profile's.
+    """
+
+    profile: Literal["default", "performance"] = "default"
+    """`default` leaves SQLite's and SQLAlchemy's defaults in place."""
+    journal_mode: (
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] | None
+    ) = None
+    """`PRAGMA journal_mode`. The `performance` profile uses `WAL`."""
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] | None = None
+    """`PRAGMA synchronous`. The `performance` profile uses `NORMAL`."""
+    mmap_size: int | None = None
+    """`PRAGMA mmap_size`, in bytes. The `performance` profile uses 256 MiB."""
+    cache_size: int | None = None
+    """`PRAGMA cache_size`, in pages, or in KiB if negative. The `performance` profile uses 64 MiB."""
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] | None = None
+    """`PRAGMA temp_store`. The `performance` profile uses `MEMORY`."""
+    cached_statements: int | None = None
+    """The number of prepared statements each connection keeps. The `performance` profile keeps 256."""
+    queue_pool: bool | None = None
+    """
+    Whether connections to database files are kept in a `QueuePool`, which any thread can check
+    connections out of, rather than opened for every checkout. The `performance` profile pools them.
+    """
+
+    _PROFILES: ClassVar[dict[str, dict[str, Any]]] = {
+        "default": {},
+        "performance": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 256 * 1024 * 1024,
+            "cache_size": -64 * 1024,
+            "temp_store": "MEMORY",
+            "cached_statements": 256,
+            "queue_pool": True,
+        },
+    }
+
+    def options(self) -> dict[str, Any]:
+        """
+        Get the options of the profile, overridden by the options that are set.
+
+        :return dict[str, Any]:
+        """
+        return {
+            **SQLitePerformanceConfig._PROFILES[self.profile],
+            **self.model_dump(exclude={"profile"}, exclude_none=True),
+        }
+
+    def pragmas(self) -> list[str]:
+        """
+        Get the PRAGMA statements to run on every new connection.
+
+        :return list[str]:
+        """
+        options = self.options()
+        return [
+            f"PRAGMA {name}={options[name]}"
+            for name in (
+                "journal_mode",
+                "synchronous",
+                "mmap_size",
+                "cache_size",
+                "temp_store",
+            )
+            if name in options
+        ]
+
+
 class SQLiteDatabaseConnectArgsConfig(DatabaseConnectArgsConfig):
     model_config = ConfigDict(extra="ignore")
 
+    # this is not an argument for `sqlite3.connect`,
+    # and is left out of the arguments passed to it.
+    performance: SQLitePerformanceConfig = SQLitePerformanceConfig()
+
+
+class DatabasePoolConfig(BaseModel):
+    """
+    The engine's connection pool.
+
+    Options left unset use SQLAlchemy's defaults. `size`, `max_overflow`,
+    `timeout`, and `use_lifo` only apply to engines whose pool is a `QueuePool`,
+    which is what PostgreSQL engines use. SQLite engines ignore them unless
+    `SQLitePerformanceConfig.queue_pool` is set.
+    """
+
+    size: int | None = None
+    """The number of connections kept open."""
+    max_overflow: int | None = None
+    """The number of connections opened beyond `size` when every pooled connection is in use."""
+    timeout: float | None = None
+    """Seconds to wait for a connection before raising an error."""
+    recycle: int | None = None
+    """Seconds after which a connection is replaced when it is next checked out."""
+    pre_ping: bool = False
+    """Whether to test that connections are still open when they are checked out."""
+    use_lifo: bool = False
+    """Whether to reuse the most recently used connection, letting idle connections time out server-side."""
+
+    def engine_kwargs(self, queue_pool: bool = True) -> dict[str, Any]:
+        """
+        Get the `create_engine` arguments for these options.
+
+        :param bool queue_pool: Whether the engine's pool is a `QueuePool`.
+        :return dict[str, Any]:
+        """
+        # only options that are set are passed, so SQLAlchemy's defaults apply otherwise
+        kwargs: dict[str, Any] = {}
+        if self.pre_ping:
+            kwargs["pool_pre_ping"] = True
+        if self.recycle is not None:
+            kwargs["pool_recycle"] = self.recycle
+
+        if queue_pool:
+            if self.use_lifo:
+                kwargs["pool_use_lifo"] = True
+            if self.size is not None:
+                kwargs["pool_size"] = self.size
+            if self.max_overflow is not None:
+                kwargs["max_overflow"] = self.max_overflow
+            if self.timeout is not None:
+                kwargs["pool_timeout"] = self.timeout
+
+        return kwargs
+
+
+class DatabaseReplicaConfig(BaseModel):
+    """
+    Read replicas of the database.
+
+    Reads are sent to the replicas, and writes, and any reads in a session
+    after it writes, are sent to the primary database at `connection_string`.
+    Replicas use the same engine options as the primary database.
+    """
+
+    connection_strings: list[str] = []
+    """The connection strings of the replicas. If empty, every query is sent to the primary database."""
+    selection: Literal["round_robin", "least_connections"] = "round_robin"
+    """How a replica is chosen for each read: in turn, or the replica with the fewest connections in use."""
+    max_lag: float | None = None
+    """Seconds a replica can lag behind the primary database before reads are sent elsewhere. If unset, lag is not checked."""
+    lag_check_interval: float = 5.0
+    """Seconds for which a replica's measured lag is reused before it is measured again."""
+
+
+class DatabaseInstrumentationConfig(BaseModel):
+    """
+    Logging of slow and repeated queries.
+
+    Repeated queries are only counted within a scope, like a web request.
+    """
+
+    enabled: bool = False
+    """Whether the engines' queries are timed and logged."""
+    slow_query_threshold: float | None = 0.5
+    """Seconds after which a query is logged as slow. If unset, slow queries are not logged."""
+    repeated_statement_threshold: int | None = 10
+    """The number of times the same statement can run in a scope before a warning is logged. If unset, repeated statements are not reported."""
+
 
 class DatabaseConfig(AbstractConfig):
     def __init__(self, **data: Any):
@@ -50,6 +215,13 @@ class DatabaseConfig(AbstractConfig):
     # the static field allows Pydantic to store
     # values from a dictionary
     connect_args: DatabaseConnectArgsConfig | None = None
+    pool: DatabasePoolConfig = DatabasePoolConfig()
+    replicas: DatabaseReplicaConfig = DatabaseReplicaConfig()
+    # whether to reflect the tables the models declare, or refer to,
+    # when an engine is created. This is not needed when every table
+    # the application uses is declared by its models.
+    reflect_tables: bool = True
+    instrumentation: DatabaseInstrumentationConfig = DatabaseInstrumentationConfig()
 
 
 class Config(AbstractConfig):
@@ -2,9 +2,13 @@
 `Injector <https://pypi.org/project/injector/>`_ dependency injection modules for database connection objects.
 """
 
+from typing import TYPE_CHECKING, Any, Callable
+
 from injector import Binder, CallableProvider, Injector, inject, singleton
 from Ligare.database.config import Config, DatabaseConfig
 from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.instrumentation import QueryInstrumentation
+from Ligare.database.engine.metrics import PoolMetricsHook
 from Ligare.database.types import MetaBase
 from Ligare.programming.config import AbstractConfig
 from Ligare.programming.dependency_injection import ConfigModule
@@ -15,6 +19,10 @@ from typing_extensions import override
 
 from .config import DatabaseConfig
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+
 
 class ScopedSessionModule(ConfigurableModule):
     """
@@ -31,8 +39,9 @@ class ScopedSessionModule(ConfigurableModule):
     @override
     def configure(self, binder: Binder) -> None:
         # Any ScopedSession dependency should be the same for the lifetime of the application.
-        # ScopeSession is a factory that creates a Session per thread.
-        # The Session returned is the same for the lifetime of the thread.
+        # ScopeSession is a factory that creates a Session per thread,
+        # or per scope if the module is given a `scopefunc`.
+        # The Session returned is the same for the lifetime of the thread or scope.
         binder.bind(
             ScopedSession,
             to=CallableProvider(self._get_scoped_session),
@@ -46,12 +55,59 @@ class ScopedSessionModule(ConfigurableModule):
         # It is safe for this method to be called multiple times.
         binder.bind(Session, to=CallableProvider(self._get_session))
 
-    def __init__(self, bases: list[MetaBase | type[MetaBase]] | None = None) -> None:
+        # Times and logs the queries of the engines, if it is enabled.
+        # Web applications use it to report the queries of each request.
+        binder.bind(
+            QueryInstrumentation,
+            to=CallableProvider(self._get_query_instrumentation),
+            scope=singleton,
+        )
+
+        # The async equivalents, for the same database. The engine is not
+        # created unless one of these is injected. `async_scoped_session`
+        # creates an AsyncSession per `asyncio` task, so AsyncSession must
+        # be injected from within a task.
+        # `sqlalchemy.ext.asyncio` is not imported until the module is configured.
+        from sqlalchemy.ext.asyncio import AsyncSession
+        from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+
+        binder.bind(
+            async_scoped_session,
+            to=CallableProvider(self._get_async_scoped_session),
+            scope=singleton,
+        )
+        binder.bind(AsyncSession, to=CallableProvider(self._get_async_session))
+
+    def __init__(
+        self,
+        bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+        scopefunc: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        :param list[MetaBase | type[MetaBase]] | None bases: The bases of the application's tables.
+        :param PoolMetricsHook | None pool_metrics: Called with the engine's connection pool events.
+        :param Callable[[], Any] | None scopefunc: Identifies the scope each `Session` belongs to.
+            Use `Ligare.database.engine.session_scope.get_session_scope` to scope sessions to web
+            requests. By default, each thread has its own `Session`.
+        """
         super().__init__()
         self._bases = bases
+        self._pool_metrics = pool_metrics
+        self._scopefunc = scopefunc
 
     @inject
-    def _get_scoped_session(self, database_config: DatabaseConfig) -> ScopedSession:
+    def _get_query_instrumentation(
+        self, database_config: DatabaseConfig
+    ) -> QueryInstrumentation:
+        return QueryInstrumentation(database_config.instrumentation)
+
+    @inject
+    def _get_scoped_session(
+        self,
+        database_config: DatabaseConfig,
+        query_instrumentation: QueryInstrumentation,
+    ) -> ScopedSession:
         """
         Returns a ScopedSession instance configured with
         the correct engine and connection string.
@@ -63,8 +119,44 @@ class ScopedSessionModule(ConfigurableModule):
             {},
             database_config.connect_args,
             bases=self._bases,
+            pool=database_config.pool,
+            pool_metrics=self._pool_metrics,
+            replicas=database_config.replicas,
+            reflect=database_config.reflect_tables,
+            query_instrumentation=query_instrumentation
+            if database_config.instrumentation.enabled
+            else None,
+            scopefunc=self._scopefunc,
         )
 
+    @inject
+    def _get_async_scoped_session(
+        self, database_config: DatabaseConfig
+    ) -> "async_scoped_session":
+        """
+        Returns an async_scoped_session instance configured with
+        the async driver for the configured connection string.
+        """
+        return DatabaseEngine.get_async_session_from_connection_string(
+            database_config.connection_string,
+            database_config.sqlalchemy_echo,
+            {},
+            database_config.connect_args,
+            bases=self._bases,
+            pool=database_config.pool,
+            pool_metrics=self._pool_metrics,
+        )
+
+    @inject
+    def _get_async_session(self, injector: Injector) -> "AsyncSession":
+        """
+        Returns the current task's AsyncSession from the injected async_scoped_session instance.
+        """
+        from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+
+        session_factory = injector.get(async_scoped_session)
+        return session_factory()
+
     @inject
     def _get_session(self, session_factory: ScopedSession) -> Session:
         """
@@ -2,12 +2,60 @@
 Integrations with SQLAlchemy's `engine <https://docs.sqlalchemy.org/en/14/core/engines_connections.html>`_ API.
 """
 
-from Ligare.database.config import DatabaseConnectArgsConfig
+from typing import TYPE_CHECKING, Any, Callable
+
+from Ligare.database.config import (
+    DatabaseConnectArgsConfig,
+    DatabasePoolConfig,
+    DatabaseReplicaConfig,
+)
 from Ligare.database.types import MetaBase
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import sessionmaker
 
+from .instrumentation import QueryInstrumentation, QueryStats
+from .metrics import PoolEvent, PoolMetricsHook, instrument_pool
 from .postgresql import PostgreSQLScopedSession
+from .reflection import clear_reflection_cache, reflect_tables
+from .registry import EngineRegistry, engine_registry
+from .replica import ReplicaSet, RoutingSession
+from .session_scope import (
+    SessionScope,
+    get_session_scope,
+    is_session_scoped,
+    remove_ended_sessions,
+    remove_scoped_session,
+    session_scope,
+)
 from .sqlite import SQLiteScopedSession
 
+if TYPE_CHECKING:
+    from .async_postgresql import AsyncPostgreSQLScopedSession
+    from .async_sqlite import AsyncSQLiteScopedSession
+
+__all__ = (
+    "DatabaseEngine",
+    "PostgreSQLScopedSession",
+    "SQLiteScopedSession",
+    "EngineRegistry",
+    "engine_registry",
+    "ReplicaSet",
+    "RoutingSession",
+    "reflect_tables",
+    "clear_reflection_cache",
+    "QueryInstrumentation",
+    "QueryStats",
+    "SessionScope",
+    "get_session_scope",
+    "is_session_scoped",
+    "remove_ended_sessions",
+    "remove_scoped_session",
+    "session_scope",
+    "PoolEvent",
+    "PoolMetricsHook",
+    "instrument_pool",
+)
+
 
 class DatabaseEngine:
     _session_type_map = {
@@ -22,7 +70,34 @@ class DatabaseEngine:
         execution_options: dict[str, str] | None = None,
         connect_args: DatabaseConnectArgsConfig | None = None,
         bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+        registry: EngineRegistry | None = engine_registry,
+        replicas: DatabaseReplicaConfig | None = None,
+        reflect: bool = True,
+        query_instrumentation: QueryInstrumentation | None = None,
+        scopefunc: Callable[[], Any] | None = None,
     ) -> SQLiteScopedSession | PostgreSQLScopedSession:
+        """
+        Create a session factory for a connection string.
+
+        By default, the engine is shared through `engine_registry` with every
+        other session factory for the same connection string and options.
+        Set `registry` to `None` to create an engine that is not shared.
+
+        If `replicas` has connection strings, the sessions are `RoutingSession`s
+        that send reads to the replicas, which use the same options as the
+        primary database.
+
+        Set `reflect` to `False` to skip reflecting tables from the database
+        when every table the application uses is declared by its models.
+
+        If `query_instrumentation` is set, it times the queries of the primary
+        database's and the replicas' engines.
+
+        `scopefunc` identifies the scope each session belongs to, like
+        `get_session_scope`. By default, each thread has its own session.
+        """
         schema_rindex = connection_string.find(":") if connection_string else -1
         if schema_rindex == -1 or schema_rindex == 0:
             raise ValueError(
@@ -43,6 +118,99 @@ class DatabaseEngine:
             execution_options=execution_options,
             connect_args=connect_args,
             bases=bases,
+            pool=pool,
+            pool_metrics=pool_metrics,
+            registry=registry,
+            reflect=reflect,
         )
+        if query_instrumentation is not None:
+            query_instrumentation.instrument(scoped_session.session_factory.kw["bind"])
+
+        if replicas is not None and replicas.connection_strings:
+            replica_engines: list[Engine] = []
+            for replica_connection_string in replicas.connection_strings:
+                if not replica_connection_string.startswith(f"{engine_name}:"):
+                    raise ValueError(
+                        f"Replica connection strings must use the same database engine as the primary database. {replica_connection_string=}"
+                    )
+
+                replica_scoped_session = session_type.create(
+                    replica_connection_string,
+                    echo,
+                    execution_options=execution_options,
+                    connect_args=connect_args,
+                    bases=bases,
+                    pool=pool,
+                    pool_metrics=pool_metrics,
+                    registry=registry,
+                    reflect=reflect,
+                )
+                replica_engine = replica_scoped_session.session_factory.kw["bind"]
+                if query_instrumentation is not None:
+                    query_instrumentation.instrument(replica_engine)
+                replica_engines.append(replica_engine)
+
+            scoped_session = session_type(
+                sessionmaker(
+                    class_=RoutingSession,
+                    autocommit=False,
+                    autoflush=False,
+                    bind=scoped_session.session_factory.kw["bind"],
+                    replicas=ReplicaSet(replica_engines, replicas),
+                ),
+                scopefunc,
+            )
+        elif scopefunc is not None:
+            scoped_session = session_type(scoped_session.session_factory, scopefunc)
 
         return scoped_session
+
+    @staticmethod
+    def get_async_session_from_connection_string(
+        connection_string: str,
+        echo: bool = False,
+        execution_options: dict[str, str] | None = None,
+        connect_args: DatabaseConnectArgsConfig | None = None,
+        bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+    ) -> "AsyncSQLiteScopedSession | AsyncPostgreSQLScopedSession":
+        """
+        Create an async session factory for a connection string.
+
+        `sqlite` and `postgresql` connection strings use the aiosqlite
+        and asyncpg drivers, so the same connection string can be used
+        for both sync and async sessions.
+        """
+        schema_rindex = connection_string.find(":") if connection_string else -1
+        if schema_rindex == -1 or schema_rindex == 0:
+            raise ValueError(
+                f"Invalid connection string used for database engine. URL is missing scheme. {connection_string=}"
+            )
+
+        # the async engines are imported when they are used because
+        # SQLAlchemy's asyncio extension is not needed otherwise.
+        engine_name = connection_string[:schema_rindex]
+        session_type: "type[AsyncSQLiteScopedSession | AsyncPostgreSQLScopedSession]"
+        if engine_name in ("sqlite", "sqlite+aiosqlite"):
+            from .async_sqlite import AsyncSQLiteScopedSession
+
+            session_type = AsyncSQLiteScopedSession
+        elif engine_name in ("postgresql", "postgresql+asyncpg"):
+            from .async_postgresql import AsyncPostgreSQLScopedSession
+
+            session_type = AsyncPostgreSQLScopedSession
+        else:
+            raise ValueError(
+                f"Unsupported connection string used for async database engine. {connection_string=}"
+            )
+
+        return session_type.create(
+            connection_string,
+            echo,
+            execution_options=execution_options,
+            connect_args=connect_args,
+            bases=bases,
+            pool=pool,
+            pool_metrics=pool_metrics,
+        )
@@ -0,0 +1,129 @@
+"""
+Integrations with SQLAlchemy's `asyncio <https://docs.sqlalchemy.org/en/14/orm/extensions/asyncio.html>`_
+extension for PostgreSQL, through `asyncpg <https://pypi.org/project/asyncpg/>`_.
+"""
+
+import asyncio
+import shlex
+from importlib.util import find_spec
+from typing import Any, Callable
+
+from Ligare.database.config import DatabaseConnectArgsConfig, DatabasePoolConfig
+from Ligare.database.types import MetaBase
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+from sqlalchemy.orm.session import sessionmaker
+
+from .metrics import PoolMetricsHook, instrument_pool
+from .postgresql import PostgreSQLScopedSession
+
+
+def get_async_postgresql_connection_string(connection_string: str) -> str:
+    """
+    Get the asyncpg connection string of a PostgreSQL connection string.
+
+    :param str connection_string: e.g., `postgresql://user@host/db`
+    :return str: e.g., `postgresql+asyncpg://user@host/db`
+    """
+    if connection_string.startswith("postgresql://"):
+        return f"postgresql+asyncpg://{connection_string.removeprefix('postgresql://')}"
+    return connection_string
+
+
+def get_asyncpg_connect_args(
+    connect_args: DatabaseConnectArgsConfig | None,
+) -> dict[str, Any]:
+    """
+    Convert the psycopg2 `connect_args` of `PostgreSQLDatabaseConnectArgsConfig`
+    to their asyncpg equivalents.
+
+    `sslmode` becomes `ssl`, and the `-c name=value` settings in `options`
+    become `server_settings`. Empty values are left out.
+
+    :param DatabaseConnectArgsConfig | None connect_args:
+    :return dict[str, Any]:
+    """
+    args = {
+        key: value
+        for key, value in (connect_args.model_dump() if connect_args else {}).items()
+        if value not in ("", None)
+    }
+
+    if sslmode := args.pop("sslmode", None):
+        args["ssl"] = sslmode
+
+    if options := args.pop("options", None):
+        server_settings: dict[str, str] = dict(args.get("server_settings") or {})
+        words = iter(shlex.split(options))
+        for word in words:
+            setting = next(words, "") if word == "-c" else word.removeprefix("-c")
+            name, _, value = setting.partition("=")
+            if name and value:
+                server_settings[name] = value
+        args["server_settings"] = server_settings
+
+    return args
+
+
+class AsyncPostgreSQLScopedSession(async_scoped_session):
+    """
+    An `async_scoped_session` for PostgreSQL, scoped to the current `asyncio` task.
+
+    Each task's session is kept until `remove` is awaited.
+    Use :func:`Ligare.database.engine.async_scoping.scoped_async_session`
+    to remove it when the task is done with it.
+
+    Tables are named the same way as `PostgreSQLScopedSession` names them.
+    """
+
+    @staticmethod
+    def create(
+        connection_string: str,
+        echo: bool = False,
+        execution_options: dict[str, Any] | None = None,
+        connect_args: DatabaseConnectArgsConfig | None = None,
+        bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+    ) -> "AsyncPostgreSQLScopedSession":
+        """
+        Create a new async session factory for PostgreSQL.
+
+        Unlike `PostgreSQLScopedSession`, the database is not reflected to rename
+        the tables of `bases`, because that cannot be done without awaiting.
+        Only the tables declared on `bases` are renamed.
+
+        :param str connection_string: A `postgresql://` or `postgresql+asyncpg://` connection string.
+        """
+        if find_spec("asyncpg") is None:
+            raise ModuleNotFoundError(
+                "No module named 'asyncpg'. Install async PostgreSQL support through `Ligare.database[postgres-async]`."
+            )
+
+        engine = create_async_engine(
+            get_async_postgresql_connection_string(connection_string),
+            echo=echo,
+            execution_options=execution_options or {},
+            connect_args=get_asyncpg_connect_args(connect_args),
+            **(pool or DatabasePoolConfig()).engine_kwargs(),
+        )
+
+        if pool_metrics is not None:
+            instrument_pool(engine.sync_engine, pool_metrics)
+
+        if bases:
+            PostgreSQLScopedSession._alter_base_schemas(None, bases)  # pyright: ignore[reportPrivateUsage]
+
+        return AsyncPostgreSQLScopedSession(
+            sessionmaker(
+                autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
+            )
+        )
+
+    def __init__(
+        self,
+        session_factory: Callable[..., Any] | "sessionmaker[Any]",
+        scopefunc: Callable[[], Any] = asyncio.current_task,
+    ) -> None:
+        super().__init__(session_factory, scopefunc)
+        self.engine: AsyncEngine = session_factory.kw["bind"]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
@@ -0,0 +1,31 @@
+"""
+Use the sessions of an `async_scoped_session` without keeping them after they are used.
+
+An `async_scoped_session` keeps each task's session, and the task, in its
+registry until `remove` is awaited. `async with scoped_session() as session`
+only closes the session, so a server that does this for every request keeps
+a registry entry for every request it has served.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+
+
+@asynccontextmanager
+async def scoped_async_session(
+    scoped_session: async_scoped_session,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Use the current task's session, then close it and remove it from `scoped_session`'s registry.
+
+    :param async_scoped_session scoped_session:
+    :return AsyncIterator[AsyncSession]:
+    """
+    try:
+        async with scoped_session() as session:
+            yield session
+    finally:
+        await scoped_session.remove()
@@ -0,0 +1,146 @@
+"""
+Integrations with SQLAlchemy's `asyncio <https://docs.sqlalchemy.org/en/14/orm/extensions/asyncio.html>`_
+extension for SQLite, through `aiosqlite <https://pypi.org/project/aiosqlite/>`_.
+"""
+
+import asyncio
+from importlib.util import find_spec
+from typing import Any, Callable
+
+from Ligare.database.config import (
+    DatabaseConnectArgsConfig,
+    DatabasePoolConfig,
+    SQLitePerformanceConfig,
+)
+from Ligare.database.types import MetaBase
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
+from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.pool import Pool, StaticPool
+
+from .metrics import PoolMetricsHook, instrument_pool
+from .sqlite import _get_pragmas_on_connect  # pyright: ignore[reportPrivateUsage]
+from .sqlite import SQLiteScopedSession
+
+
+def get_async_sqlite_connection_string(connection_string: str) -> str:
+    """
+    Get the aiosqlite connection string of an SQLite connection string.
+
+    :param str connection_string: e.g., `sqlite:///foo.db`
+    :return str: e.g., `sqlite+aiosqlite:///foo.db`
+    """
+    if connection_string.startswith("sqlite://"):
+        return f"sqlite+aiosqlite://{connection_string.removeprefix('sqlite://')}"
+    return connection_string
+
+
+class AsyncSQLiteScopedSession(async_scoped_session):
+    """
+    An `async_scoped_session` for SQLite, scoped to the current `asyncio` task.
+
+    Each task's session is kept until `remove` is awaited.
+    Use :func:`Ligare.database.engine.async_scoping.scoped_async_session`
+    to remove it when the task is done with it.
+
+    Tables are named the same way as `SQLiteScopedSession` names them.
+    """
+
+    @staticmethod
+    def create(
+        connection_string: str,
+        echo: bool = False,
+        execution_options: dict[str, Any] | None = None,
+        connect_args: DatabaseConnectArgsConfig | None = None,
+        bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+    ) -> "AsyncSQLiteScopedSession":
+        """
+        Create a new async session factory for SQLite.
+
+        Unlike `SQLiteScopedSession`, the database is not reflected to rename
+        the tables of `bases`, because that cannot be done without awaiting.
+        Only the tables declared on `bases` are renamed. The PRAGMAs of
+        `connect_args.performance` are applied, but connections are not pooled
+        in a `QueuePool`, and its statement cache is not used.
+
+        :param str connection_string: An `sqlite://` or `sqlite+aiosqlite://` connection string.
+        """
+        if find_spec("aiosqlite") is None:
+            raise ModuleNotFoundError(
+                "No module named 'aiosqlite'. Install async SQLite support through `Ligare.database[sqlite-async]`."
+            )
+
+        connection_string = get_async_sqlite_connection_string(connection_string)
+
+        poolclass: type[Pool] | None = None
+        # keep in-memory databases for the lifetime of the engine,
+        # as `SQLiteScopedSession` does.
+        if ":memory:" in connection_string:
+            poolclass = StaticPool
+
+        execution_options = dict(execution_options or {})
+        if bases:
+            schema_translate_map = SQLiteScopedSession._get_schema_translate_map(  # pyright: ignore[reportPrivateUsage]
+                bases
+            )
+            if schema_translate_map:
+                execution_options["schema_translate_map"] = schema_translate_map
+
+        engine = create_async_engine(
+            connection_string,
+            echo=echo,
+            execution_options=execution_options,
+            connect_args=connect_args.model_dump(exclude={"performance"})
+            if connect_args is not None
+            else {},
+            poolclass=poolclass,
+            **(pool or DatabasePoolConfig()).engine_kwargs(queue_pool=False),
+        )
+
+        pragmas = SQLitePerformanceConfig.model_validate(
+            getattr(connect_args, "performance", None) or {}
+        ).pragmas()
+        if pragmas:
+            event.listen(
+                engine.sync_engine, "connect", _get_pragmas_on_connect(pragmas)
+            )
+
+        if pool_metrics is not None:
+            instrument_pool(engine.sync_engine, pool_metrics)
+
+        if bases:
+            SQLiteScopedSession._alter_base_schemas(None, bases)  # pyright: ignore[reportPrivateUsage]
+
+        return AsyncSQLiteScopedSession(
+            sessionmaker(
+                autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
+            )
+        )
+
+    def __init__(
+        self,
+        session_factory: Callable[..., Any] | "sessionmaker[Any]",
+        scopefunc: Callable[[], Any] = asyncio.current_task,
+    ) -> None:
+        super().__init__(session_factory, scopefunc)
+        self.engine: AsyncEngine = session_factory.kw["bind"]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+
+        # engines shared through an `EngineRegistry` are used by
+        # more than one session factory, but only need one listener.
+        if not event.contains(
+            self.engine.sync_engine, "connect", _fk_pragma_on_connect
+        ):
+            event.listen(self.engine.sync_engine, "connect", _fk_pragma_on_connect)
+
+
+def _fk_pragma_on_connect(dbapi_con: Any, con_record: Any):
+    """
+    Make SQLite respect foreign key constraints,
+    as `SQLiteScopedSession` does.
+    """
+    cursor = dbapi_con.cursor()
+    _ = cursor.execute("pragma foreign_keys=ON")
+    cursor.close()
@@ -0,0 +1,164 @@
+"""
+Query instrumentation for SQLAlchemy engines.
+
+:class:`QueryInstrumentation` times every statement an instrumented engine
+executes. Statements slower than a threshold are logged. Within a
+:meth:`QueryInstrumentation.scope`, like a web request, it also counts the
+statements and how long they took, and warns when the same statement runs
+many times, which usually means a relationship is loaded one row at a time
+(an "N+1" query).
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+from Ligare.database.config import DatabaseInstrumentationConfig
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# set on the execution context of each statement
+_QUERY_START_ATTRIBUTE = "_ligare_query_start"
+
+
+@dataclass
+class QueryStats:
+    """
+    The statements executed within a :meth:`QueryInstrumentation.scope`.
+    """
+
+    get_tag: Callable[[], Any] | None = None
+    """Gets the value that identifies the scope in log messages, like a request's trace ID."""
+    count: int = 0
+    """The number of statements executed."""
+    duration: float = 0.0
+    """Seconds spent executing statements."""
+    statements: Counter[str] = field(default_factory=Counter)
+    """How many times each statement was executed."""
+    repeated: set[str] = field(default_factory=set)
+    """The statements that have been reported as repeated."""
+
+    @property
+    def tag(self) -> Any:
+        return None if self.get_tag is None else self.get_tag()
+
+
+class QueryInstrumentation:
+    """
+    Times, counts, and logs the statements executed by instrumented engines.
+    """
+
+    def __init__(
+        self,
+        config: DatabaseInstrumentationConfig | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """
+        :param DatabaseInstrumentationConfig | None config: The thresholds at which statements are reported.
+        :param logging.Logger | None logger: Where slow and repeated statements are reported.
+        """
+        self._config = config or DatabaseInstrumentationConfig()
+        self._log = logger or logging.getLogger(__name__)
+        self._stats: ContextVar[QueryStats | None] = ContextVar(
+            f"ligare_query_stats_{id(self)}", default=None
+        )
+        # the listeners are created once so `event.contains`
+        # can tell whether an engine is already instrumented.
+        self._before_cursor_execute = self._on_before_cursor_execute
+        self._after_cursor_execute = self._on_after_cursor_execute
+
+    @property
+    def current(self) -> QueryStats | None:
+        """
+        The statistics of the current scope, or `None` outside of a scope.
+        """
+        return self._stats.get()
+
+    def instrument(self, engine: Engine) -> None:
+        """
+        Time the statements `engine` executes. Instrumenting an engine more than once has no effect.
+
+        :param Engine engine:
+        """
+        if event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @contextmanager
+    def scope(self, get_tag: Callable[[], Any] | None = None) -> Iterator[QueryStats]:
+        """
+        Count the statements executed until the context exits.
+
+        Statements are counted in the context they are executed in, including
+        threads that run in a copy of it, as WSGI applications served by an ASGI
+        server do. A summary is logged at `DEBUG` level when the context exits.
+
+        :param Callable[[], Any] | None get_tag: Gets the value that identifies the scope in
+            log messages. It is called when a message is logged, so it can return values set
+            after the scope is entered.
+        :return Iterator[QueryStats]: The scope's statistics.
+        """
+        stats = QueryStats(get_tag)
+        token = self._stats.set(stats)
+        try:
+            yield stats
+        finally:
+            self._stats.reset(token)
+            if stats.count:
+                self._log.debug(
+                    f"{stats.count} queries took {stats.duration * 1000:.3f}ms. {stats.tag}"
+                )
+
+    def _on_before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        setattr(context, _QUERY_START_ATTRIBUTE, perf_counter())
+
+    def _on_after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        start: float | None = getattr(context, _QUERY_START_ATTRIBUTE, None)
+        if start is None:
+            return
+        duration = perf_counter() - start
+
+        stats = self._stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+            threshold = self._config.repeated_statement_threshold
+            if (
+                threshold is not None
+                and stats.statements[statement] >= threshold
+                and statement not in stats.repeated
+            ):
+                stats.repeated.add(statement)
+                self._log.warning(
+                    f"The same query ran {stats.statements[statement]} times. Consider loading its rows in one query. {stats.tag} {statement}"
+                )
+
+        threshold = self._config.slow_query_threshold
+        if threshold is not None and duration >= threshold:
+            tag = None if stats is None else stats.tag
+            self._log.warning(
+                f"Slow query took {duration * 1000:.3f}ms. {tag} {statement}"
+            )
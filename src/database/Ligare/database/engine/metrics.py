@@ -0,0 +1,114 @@
+"""
+Connection pool metrics for SQLAlchemy engines.
+
+:func:`instrument_pool` reports every connection checkout and checkin of an
+engine's pool to a hook, with how long the checkout waited for a connection
+and how many connections were checked out, so pool exhaustion is visible
+before requests start failing with pool timeouts.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+PoolEventName = Literal["checkout", "checkin", "overflow", "timeout"]
+
+
+@dataclass(frozen=True)
+class PoolEvent:
+    """
+    A change to the connections checked out from a pool.
+    """
+
+    name: PoolEventName
+    """
+    * `checkout`: a connection was checked out.
+    * `checkin`: a connection was returned.
+    * `overflow`: a checkout opened a connection beyond the pool's size. It is
+      not reported again for checkouts of connections that are already open.
+    * `timeout`: no connection became available before the pool's timeout.
+    """
+    engine: str
+    """The engine's URL, without its password."""
+    checked_out: int
+    """The number of connections checked out after the event."""
+    overflow: int
+    """The number of connections open beyond the pool's size, for pools that have a size. A `checkin` event still counts the connection being returned."""
+    wait_time: float | None = None
+    """Seconds spent waiting for a connection, for `checkout`, `overflow`, and `timeout`."""
+
+
+PoolMetricsHook = Callable[[PoolEvent], Any]
+
+
+def instrument_pool(engine: Engine, hook: PoolMetricsHook) -> None:
+    """
+    Report `engine`'s connection pool events to `hook`.
+
+    `hook` is called on the thread that checks out or returns
+    the connection, so it should be fast and must not block.
+
+    :param Engine engine:
+    :param PoolMetricsHook hook:
+    """
+    engine_name = engine.url.render_as_string(hide_password=True)
+    lock = threading.Lock()
+    checked_out = 0
+
+    def get_overflow(pool: Pool) -> int:
+        overflow = getattr(pool, "overflow", None)
+        return max(overflow(), 0) if overflow is not None else 0
+
+    def emit(name: PoolEventName, pool: Pool, wait_time: float | None = None) -> None:
+        hook(PoolEvent(name, engine_name, checked_out, get_overflow(pool), wait_time))
+
+    def instrument(pool: Pool) -> None:
+        # pools do not have an event for when a checkout starts,
+        # so the time spent waiting is measured around `connect`,
+        # which the engine calls to check out every connection.
+        connect = pool.connect
+
+        def timed_connect() -> Any:
+            nonlocal checked_out
+            overflow = get_overflow(pool)
+            start = time.perf_counter()
+            try:
+                connection = connect()
+            except exc.TimeoutError:
+                emit("timeout", pool, time.perf_counter() - start)
+                raise
+
+            wait_time = time.perf_counter() - start
+            with lock:
+                checked_out += 1
+            emit("checkout", pool, wait_time)
+            # overflow connections are kept while the pool is not full, so
+            # later checkouts can reuse one without the overflow growing.
+            if get_overflow(pool) > overflow:
+                emit("overflow", pool, wait_time)
+            return connection
+
+        pool.connect = timed_connect  # pyright: ignore[reportAttributeAccessIssue]
+
+    def on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        nonlocal checked_out
+        with lock:
+            checked_out = max(checked_out - 1, 0)
+        emit("checkin", engine.pool)
+
+    def on_engine_disposed(engine: Engine) -> None:
+        # `dispose` replaces the pool. Event listeners are kept by
+        # the new pool, but `connect` has to be instrumented again.
+        nonlocal checked_out
+        with lock:
+            checked_out = 0
+        instrument(engine.pool)
+
+    instrument(engine.pool)
+    event.listen(engine.pool, "checkin", on_checkin)
+    event.listen(engine, "engine_disposed", on_engine_disposed)
@@ -5,7 +5,7 @@ Integrations with SQLAlchemy's `PostgreSQL <https://docs.sqlalchemy.org/en/14/co
 from importlib.util import find_spec
 from typing import Any, Callable, Union
 
-from Ligare.database.config import DatabaseConnectArgsConfig
+from Ligare.database.config import DatabaseConnectArgsConfig, DatabasePoolConfig
 from Ligare.database.types import IScopedSessionFactory, MetaBase
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -13,6 +13,10 @@ from sqlalchemy.orm.scoping import ScopedSession
 from sqlalchemy.orm.session import sessionmaker
 from typing_extensions import override
 
+from .metrics import PoolMetricsHook, instrument_pool
+from .reflection import reflect_tables
+from .registry import EngineRegistry, get_engine_key
+
 
 class PostgreSQLScopedSession(
     ScopedSession, IScopedSessionFactory["PostgreSQLScopedSession"]
@@ -25,32 +29,72 @@ class PostgreSQLScopedSession(
         execution_options: dict[str, Any] | None = None,
         connect_args: DatabaseConnectArgsConfig | None = None,
         bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+        registry: EngineRegistry | None = None,
+        reflect: bool = True,
     ) -> "PostgreSQLScopedSession":
+        """
+        Create a new session factory for PostgreSQL.
+
+        If `registry` is set, the engine is shared with every other session factory
+        created from the registry with the same connection string and options.
+
+        If `reflect` is set, the tables that `bases` declare, or refer to,
+        are reflected from the database the first time it is used.
+        """
         if find_spec("psycopg2") is None:
             raise ModuleNotFoundError(
                 "No module named 'psycopg2'. Install PostgreSQL support through `Ligare.database[postgres]` or `Ligare.database[postgres-binary]`."
             )
 
-        engine = create_engine(
-            connection_string,
-            echo=echo,
-            execution_options=execution_options or {},
-            connect_args=connect_args.model_dump() if connect_args is not None else {},
-        )
+        engine_kwargs: dict[str, Any] = {
+            "echo": echo,
+            "execution_options": execution_options or {},
+            "connect_args": connect_args.model_dump()
+            if connect_args is not None
+            else {},
+            **(pool or DatabasePoolConfig()).engine_kwargs(),
+        }
+
+        def create_postgresql_engine() -> Engine:
+            engine = create_engine(connection_string, **engine_kwargs)
+
+            if pool_metrics is not None:
+                instrument_pool(engine, pool_metrics)
+
+            return engine
+
+        if registry is None:
+            engine = create_postgresql_engine()
+        else:
+            engine = registry.get(
+                get_engine_key(
+                    connection_string, pool_metrics=pool_metrics, **engine_kwargs
+                ),
+                create_postgresql_engine,
+            )
 
         if bases:
-            PostgreSQLScopedSession._alter_base_schemas(engine, bases)
+            PostgreSQLScopedSession._alter_base_schemas(
+                engine if reflect else None, bases
+            )
 
         return PostgreSQLScopedSession(
             sessionmaker(autocommit=False, autoflush=False, bind=engine)
         )
 
     @staticmethod
-    def _alter_base_schemas(engine: Engine, bases: list[MetaBase | type[MetaBase]]):
+    def _alter_base_schemas(
+        engine: Engine | None, bases: list[MetaBase | type[MetaBase]]
+    ):
         # This renames all tables to undo any renaming that previously happened
         # from, e.g., our SQLite engine.
+        # Without an engine, only the tables declared on
+        # the bases are renamed, and the database is not reflected.
         for metadata_base in bases:
-            metadata_base.metadata.reflect(bind=engine)
+            if engine is not None:
+                reflect_tables(engine, metadata_base.metadata)
             for table_subclass in type(metadata_base).__subclasses__(metadata_base):
                 schema: str | None = None
                 if hasattr(metadata_base, "__table_args__") and isinstance(
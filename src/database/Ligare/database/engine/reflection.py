@@ -0,0 +1,81 @@
+"""
+Reflection of the tables that an application's models use.
+
+Reflecting a whole database queries the definition of every table in it,
+which is slow for large PostgreSQL databases. :func:`reflect_tables` only
+reflects the tables that the models declare or refer to through foreign
+keys, and only once for each database and metadata in a process.
+"""
+
+import threading
+import weakref
+from typing import Any
+
+from sqlalchemy import MetaData
+from sqlalchemy.engine import Engine
+
+_reflected_lock = threading.Lock()
+# the URLs of the databases each metadata has been reflected from
+_reflected: "weakref.WeakKeyDictionary[MetaData, set[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_table_names(metadata: MetaData) -> set[str]:
+    """
+    Get the names of the tables that `metadata` declares, and that its tables refer to through foreign keys.
+
+    Names are included both with and without their schema.
+
+    :param MetaData metadata:
+    :return set[str]:
+    """
+    names: set[str] = set()
+    for table in metadata.tables.values():
+        names.add(table.name)
+        names.add(table.fullname)
+        for foreign_key in table.foreign_keys:
+            # `target_fullname` is `[schema.]table.column`
+            target_table = foreign_key.target_fullname.rsplit(".", 1)[0]
+            names.add(target_table)
+            names.add(target_table.rsplit(".", 1)[-1])
+
+    return names
+
+
+def reflect_tables(engine: Engine, metadata: MetaData) -> None:
+    """
+    Reflect the tables of `metadata` from the database of `engine`.
+
+    Only the tables named by :func:`get_table_names` are reflected, and only the first time
+    this is called for the same database and metadata. In-memory SQLite databases
+    are reflected every time, because every engine has its own database.
+
+    :param Engine engine:
+    :param MetaData metadata:
+    """
+    url: str | None = None
+    if engine.url.database not in (None, "", ":memory:"):
+        url = engine.url.render_as_string(hide_password=True)
+        with _reflected_lock:
+            if url in _reflected.get(metadata, ()):
+                return
+
+    names = get_table_names(metadata)
+
+    def only(name: str, _: Any) -> bool:
+        return name in names
+
+    metadata.reflect(bind=engine, only=only)
+
+    if url is not None:
+        with _reflected_lock:
+            _reflected.setdefault(metadata, set()).add(url)
+
+
+def clear_reflection_cache() -> None:
+    """
+    Reflect tables again the next time :func:`reflect_tables` is called.
+    """
+    with _reflected_lock:
+        _reflected.clear()
@@ -0,0 +1,114 @@
+"""
+A registry of SQLAlchemy engines shared within a process.
+
+Every `ScopedSessionModule`, and every call to
+:meth:`Ligare.database.engine.DatabaseEngine.get_session_from_connection_string`,
+would otherwise create its own engine, and so its own connection pool,
+even when they connect to the same database with the same options.
+:data:`engine_registry` hands out one engine for each connection string
+and set of options.
+
+Engines are kept for the lifetime of the process, and disposed of when it
+exits. Session factories do not have a point at which they stop being used,
+so engines are not disposed of when a session factory is. In processes forked
+from one that already has engines, like gunicorn workers, the pools are replaced
+without closing the connections, which still belong to the parent process.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from typing import Any, Callable, Hashable, TypeVar
+
+from sqlalchemy.engine import Engine
+
+TEngine = TypeVar("TEngine", bound=Engine)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())  # pyright: ignore[reportUnknownArgumentType,reportUnknownVariableType]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)  # pyright: ignore[reportUnknownArgumentType,reportUnknownVariableType]
+    return value
+
+
+def get_engine_key(connection_string: str, **options: Any) -> Hashable:
+    """
+    Get the registry key of an engine for `connection_string` created with `options`.
+
+    :param str connection_string: The engine's connection string.
+    :param Any options: The keyword arguments the engine is created with.
+    :return Hashable: A key that is equal for equal connection strings and options.
+    """
+    return (connection_string, _freeze(options))
+
+
+class EngineRegistry:
+    """
+    Engines, keyed on their connection string and options, that are kept until they are disposed of.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._engines: dict[Hashable, Engine] = {}
+        self._log = logging.getLogger(__name__)
+
+    def get(self, key: Hashable, create: Callable[[], TEngine]) -> TEngine:
+        """
+        Get the engine for `key`, calling `create` to create it if there is none.
+
+        The engine is kept until :meth:`dispose_all` is called, which happens when the process exits.
+
+        :param Hashable key: The engine's key, from :func:`get_engine_key`.
+        :param Callable[[], TEngine] create: Creates the engine. Anything that must only
+            happen once per engine, like registering event listeners, should happen here.
+        :return TEngine: The shared engine.
+        """
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = create()
+                self._engines[key] = engine
+                self._log.debug(
+                    f"Created engine for {engine.url.render_as_string(hide_password=True)}."
+                )
+            return engine  # pyright: ignore[reportReturnType]
+
+    def dispose_all(self) -> None:
+        """
+        Dispose of every engine and empty the registry.
+        """
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+
+        for engine in engines:
+            engine.dispose()
+
+    def dispose_after_fork(self) -> None:
+        """
+        Replace the pools of every engine without closing their connections.
+
+        This must run in a child process after it is forked. The pooled connections
+        are shared with the parent process, which still uses them, so they are
+        left open, and the child opens its own connections when it needs them.
+        """
+        # a lock held by another thread when the process
+        # was forked is never released in the child.
+        self._lock = threading.Lock()
+
+        for engine in list(self._engines.values()):
+            engine.dispose(close=False)
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+
+engine_registry = EngineRegistry()
+"""The process's engine registry."""
+
+atexit.register(engine_registry.dispose_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=engine_registry.dispose_after_fork)
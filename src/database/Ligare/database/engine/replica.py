@@ -0,0 +1,236 @@
+"""
+Read replica routing for SQLAlchemy sessions.
+
+A :class:`RoutingSession` sends reads to the replicas in a :class:`ReplicaSet`,
+and writes to the primary database the session is bound to. After a session
+writes, it reads from the primary database until it is closed, so it always
+reads its own writes.
+"""
+
+import logging
+import threading
+import time
+from itertools import count
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from Ligare.database.config import DatabaseReplicaConfig
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.selectable import Select
+from typing_extensions import override
+
+ReplicaLagCheck = Callable[[Connection], float | None]
+
+
+def get_replica_lag(connection: Connection) -> float | None:
+    """
+    Get how many seconds a replica lags behind its primary database.
+
+    PostgreSQL replicas report the time since the last transaction they replayed,
+    which also grows while the primary database is idle. Other databases are not
+    checked, and are considered not to lag.
+
+    :param Connection connection: A connection to the replica.
+    :return float | None: The lag in seconds, or `None` if the database has not replayed
+        any transactions or is not a replica, which is considered not to lag.
+    """
+    if connection.dialect.name != "postgresql":
+        return 0.0
+
+    return connection.execute(
+        text(
+            "SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) WHERE pg_is_in_recovery()"
+        )
+    ).scalar()
+
+
+class _ConnectionCount:
+    """
+    The number of an engine's connections that are in use.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections = 0
+
+    def on_checkout(self, *args: Any) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def on_checkin(self, *args: Any) -> None:
+        with self._lock:
+            self.connections = max(self.connections - 1, 0)
+
+
+# engines are shared through `engine_registry`, so every `ReplicaSet`
+# of an engine shares one count, and its listeners are added once.
+_connection_counts_lock = threading.Lock()
+_connection_counts: "WeakKeyDictionary[Engine, _ConnectionCount]" = WeakKeyDictionary()
+
+
+def _get_connection_count(engine: Engine) -> _ConnectionCount:
+    with _connection_counts_lock:
+        connection_count = _connection_counts.get(engine)
+        if connection_count is None:
+            connection_count = _connection_counts[engine] = _ConnectionCount()
+            event.listen(engine, "checkout", connection_count.on_checkout)
+            event.listen(engine, "checkin", connection_count.on_checkin)
+        return connection_count
+
+
+class ReplicaSet:
+    """
+    Chooses the replica that a read is sent to.
+    """
+
+    def __init__(
+        self,
+        engines: list[Engine],
+        config: DatabaseReplicaConfig | None = None,
+        lag_check: ReplicaLagCheck = get_replica_lag,
+    ) -> None:
+        """
+        :param list[Engine] engines: The replicas' engines.
+        :param DatabaseReplicaConfig | None config: How replicas are chosen.
+        :param ReplicaLagCheck lag_check: Measures a replica's lag, in seconds, through a connection to it.
+        """
+        self._engines = engines
+        self._config = config or DatabaseReplicaConfig()
+        self._lag_check = lag_check
+        self._log = logging.getLogger(__name__)
+        self._turn = count()
+        self._connection_counts = {
+            id(engine): _get_connection_count(engine) for engine in engines
+        }
+        self._lags: dict[int, tuple[float, float | None]] = {}
+
+    @property
+    def engines(self) -> list[Engine]:
+        return list(self._engines)
+
+    def connections(self, engine: Engine) -> int:
+        """
+        Get the number of connections to a replica that are in use.
+
+        This counts every connection checked out from the engine,
+        including those of other `ReplicaSet`s that share it.
+
+        :param Engine engine: One of the replicas' engines.
+        :return int:
+        """
+        return self._connection_counts[id(engine)].connections
+
+    def select(self) -> Engine | None:
+        """
+        Choose the replica to send a read to.
+
+        :return Engine | None: The replica's engine, or `None` if no replica is
+            available and the read should be sent to the primary database.
+        """
+        replicas = [engine for engine in self._engines if self._is_available(engine)]
+        if not replicas:
+            return None
+
+        # start from the next replica in turn, so replicas
+        # with the same number of connections take turns.
+        turn = next(self._turn) % len(replicas)
+        replicas = replicas[turn:] + replicas[:turn]
+
+        if self._config.selection == "least_connections":
+            return min(replicas, key=self.connections)
+
+        return replicas[0]
+
+    def _is_available(self, engine: Engine) -> bool:
+        if self._config.max_lag is None:
+            return True
+
+        now = time.monotonic()
+        checked_at, lag = self._lags.get(id(engine), (None, None))
+        if checked_at is None or now - checked_at >= self._config.lag_check_interval:
+            lag = self._measure_lag(engine)
+            self._lags[id(engine)] = (now, lag)
+
+        return lag is not None and lag <= self._config.max_lag
+
+    def _measure_lag(self, engine: Engine) -> float | None:
+        try:
+            with engine.connect() as connection:
+                lag = self._lag_check(connection)
+        except Exception:
+            self._log.warning(
+                f"Could not measure the lag of replica {engine.url.render_as_string(hide_password=True)}. Reads are not sent to it.",
+                exc_info=True,
+            )
+            return None
+
+        # a replica that has not replayed any transactions has no lag to report
+        return 0.0 if lag is None else float(lag)
+
+
+class RoutingSession(Session):
+    """
+    A session that sends reads to replicas, and everything else to its primary database.
+
+    Queries that are not `SELECT` statements, `SELECT ... FOR UPDATE`, and
+    every query after the session flushes or writes, are sent to the primary
+    database, which is the session's `bind`. Commits are sent to every
+    database the session used.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kwargs: Any):
+        """
+        :param ReplicaSet | None replicas: The replicas to send reads to. If `None`, every query is sent to the primary database.
+        """
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._use_primary = False
+
+    @property
+    def reads_from_primary(self) -> bool:
+        """
+        Whether reads are sent to the primary database until the session is closed.
+        """
+        return self._replicas is None or self._use_primary
+
+    def use_primary(self) -> None:
+        """
+        Send every query to the primary database until the session is closed.
+        Use this before reading data that is about to be changed.
+        """
+        self._use_primary = True
+
+    @override
+    def get_bind(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        mapper: Any = None,
+        clause: Any = None,
+        bind: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        if bind is None and not self.reads_from_primary:
+            if self._is_read(clause):
+                replica = self._replicas.select() if self._replicas else None
+                if replica is not None:
+                    return replica
+            else:
+                # reads after a write go to the primary database,
+                # because the replicas might not have the write yet.
+                self._use_primary = True
+
+        return super().get_bind(mapper, clause, bind, **kwargs)
+
+    def _is_read(self, clause: Any) -> bool:
+        if self._flushing:
+            return False
+
+        return (
+            isinstance(clause, Select) and clause._for_update_arg is None  # pyright: ignore[reportPrivateUsage]
+        )
+
+    @override
+    def close(self) -> None:
+        super().close()
+        self._use_primary = False
@@ -0,0 +1,146 @@
+"""
+Session scopes that end with a unit of work, like a web request, rather than with a thread.
+
+A `ScopedSession` keeps one session per thread by default, so a thread
+that serves many requests keeps the same session, and its identity map and
+connection, between them. With :func:`get_session_scope` as its `scopefunc`,
+a `ScopedSession` keeps one session per :func:`session_scope` instead, and
+:func:`remove_scoped_session` closes it when the scope's work is done.
+Outside of a scope, sessions are kept per thread, as they are by default.
+
+Scopes are kept in a context variable, so code run in a copy of the scope's
+context, like a WSGI application served by an ASGI server, shares its session.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Hashable, Iterator
+
+from sqlalchemy.orm.scoping import ScopedSession
+
+_session_scope: ContextVar["SessionScope | None"] = ContextVar(
+    "ligare_session_scope", default=None
+)
+
+
+class SessionScope:
+    """
+    Identifies the sessions of one unit of work.
+    """
+
+    __slots__ = ("name", "ended")
+
+    def __init__(self, name: Any = None) -> None:
+        """
+        :param Any name: Identifies the scope in log messages, like a request's trace ID.
+        """
+        self.name = name
+        self.ended = False
+
+    def __repr__(self) -> str:
+        return f"<SessionScope {self.name}{' (ended)' if self.ended else ''}>"
+
+
+def get_session_scope() -> Hashable:
+    """
+    Get the key of the current session scope. Use this as a `ScopedSession`'s `scopefunc`.
+
+    :return Hashable: The current :class:`SessionScope`, or the current thread's ID outside of a scope.
+    """
+    scope = _session_scope.get()
+    return threading.get_ident() if scope is None else scope
+
+
+@contextmanager
+def session_scope(name: Any = None) -> Iterator[SessionScope]:
+    """
+    Use a new session scope until the context exits.
+
+    The scope's sessions are not closed when it exits. Use
+    :func:`remove_scoped_session` and :func:`remove_ended_sessions`.
+
+    :param Any name: Identifies the scope in log messages.
+    :return Iterator[SessionScope]:
+    """
+    scope = SessionScope(name)
+    token = _session_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        scope.ended = True
+        _session_scope.reset(token)
+
+
+def is_session_scoped(scoped_session: ScopedSession) -> bool:
+    """
+    Whether `scoped_session` keeps its sessions per :func:`session_scope`.
+
+    :param ScopedSession scoped_session:
+    :return bool: `True` if its `scopefunc` is :func:`get_session_scope`.
+    """
+    # `ThreadLocalRegistry`, the default, is a `ScopedRegistry` without a `scopefunc`
+    return getattr(scoped_session.registry, "scopefunc", None) is get_session_scope
+
+
+def remove_scoped_session(
+    scoped_session: ScopedSession, log: logging.Logger | None = None
+) -> bool:
+    """
+    Close the current scope's session, if it has one, returning its connection to the pool.
+
+    Changes the session has not flushed or committed are discarded, and logged as a warning.
+
+    :param ScopedSession scoped_session:
+    :param logging.Logger | None log: Where discarded changes are reported.
+    :return bool: Whether the scope had a session.
+    """
+    if not scoped_session.registry.has():
+        return False
+
+    _close(scoped_session.registry(), _session_scope.get(), log)
+    scoped_session.registry.clear()
+    return True
+
+
+def remove_ended_sessions(
+    scoped_session: ScopedSession, log: logging.Logger | None = None
+) -> int:
+    """
+    Close the sessions of scopes that have ended.
+
+    A session is only kept for an ended scope if it was created after
+    its scope's session was removed, like by a thread that outlived the scope.
+    These sessions are leaked, and each is logged as a warning.
+
+    :param ScopedSession scoped_session: A `ScopedSession` whose `scopefunc` is :func:`get_session_scope`.
+    :param logging.Logger | None log: Where leaked sessions are reported.
+    :return int: The number of sessions closed.
+    """
+    log = log or logging.getLogger(__name__)
+    sessions: dict[Hashable, Any] = scoped_session.registry.registry  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+    closed = 0
+    for scope in list(sessions):
+        if not isinstance(scope, SessionScope) or not scope.ended:
+            continue
+        session = sessions.pop(scope, None)
+        if session is None:
+            continue
+        log.warning(
+            f"A session was used after its scope ended, and was not removed. It has been closed. {scope}"
+        )
+        _close(session, scope, log)
+        closed += 1
+
+    return closed
+
+
+def _close(
+    session: Any, scope: SessionScope | None, log: logging.Logger | None
+) -> None:
+    if session.new or session.dirty or session.deleted:
+        (log or logging.getLogger(__name__)).warning(
+            f"A session was removed with changes that were not committed. The changes were discarded. {scope}"
+        )
+    session.close()
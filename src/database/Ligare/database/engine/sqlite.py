@@ -5,18 +5,26 @@ Integrations with SQLAlchemy's `SQLite <https://docs.sqlalchemy.org/en/14/core/e
 from sqlite3 import Connection
 from typing import Any, Callable
 
-from Ligare.database.config import DatabaseConnectArgsConfig
+from Ligare.database.config import (
+    DatabaseConnectArgsConfig,
+    DatabasePoolConfig,
+    SQLitePerformanceConfig,
+)
 from Ligare.database.types import IScopedSessionFactory, MetaBase
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm.scoping import ScopedSession
 from sqlalchemy.orm.session import sessionmaker
-from sqlalchemy.pool import Pool, StaticPool
+from sqlalchemy.pool import Pool, QueuePool, StaticPool
 from sqlalchemy.pool.base import (
     _ConnectionRecord,  # pyright: ignore[reportPrivateUsage]
 )
 from typing_extensions import override
 
+from .metrics import PoolMetricsHook, instrument_pool
+from .reflection import reflect_tables
+from .registry import EngineRegistry, get_engine_key
+
 
 class SQLiteScopedSession(ScopedSession, IScopedSessionFactory["SQLiteScopedSession"]):
     @override
@@ -27,10 +35,38 @@ class SQLiteScopedSession(ScopedSession, IScopedSessionFactory["SQLiteScopedSess
         execution_options: dict[str, Any] | None = None,
         connect_args: DatabaseConnectArgsConfig | None = None,
         bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: PoolMetricsHook | None = None,
+        registry: EngineRegistry | None = None,
+        reflect: bool = True,
     ) -> "SQLiteScopedSession":
         """
         Create a new session factory for SQLite.
+
+        If `registry` is set, the engine is shared with every other session factory
+        created from the registry with the same connection string and options.
+        In-memory databases are never shared, because each engine has its own.
+
+        If `reflect` is set, the tables that `bases` declare, or refer to,
+        are reflected from the database the first time it is used.
+
+        The PRAGMAs, statement cache, and pool of the engine are set
+        by `connect_args.performance`, if `connect_args` is an
+        `SQLiteDatabaseConnectArgsConfig`.
         """
+        performance_config = SQLitePerformanceConfig.model_validate(
+            getattr(connect_args, "performance", None) or {}
+        )
+        performance = performance_config.options()
+        sqlite_connect_args: dict[str, Any] = (
+            connect_args.model_dump(exclude={"performance"})
+            if connect_args is not None
+            else {}
+        )
+        if "cached_statements" in performance:
+            sqlite_connect_args["cached_statements"] = performance["cached_statements"]
+
+        queue_pool = False
         poolclass: type[Pool] | None = None
         # if the connection string is an SQLite in-memory database
         # then make SQLAlchemy maintain a static pool of "connections"
@@ -41,45 +77,87 @@ class SQLiteScopedSession(ScopedSession, IScopedSessionFactory["SQLiteScopedSess
         # e.g. `sqlite:///:memory:?check_same_thread=False`
         if ":memory:" in connection_string:
             poolclass = StaticPool
+        elif performance.get("queue_pool"):
+            # SQLAlchemy otherwise opens a connection to a database file
+            # for every checkout. A connection is only used by one thread
+            # at a time, but not always by the thread that opened it.
+            poolclass = QueuePool
+            queue_pool = True
+            sqlite_connect_args["check_same_thread"] = False
 
         if not execution_options:  # pragma: nocover
             execution_options = {}
 
         if bases:
-            schema_translate_map = {
-                base.__table_args__.get("schema"): None
-                for base in bases
-                if hasattr(base, "__table_args__")
-                and isinstance(base.__table_args__, dict)
-                and base.__table_args__.get("schema")
-            }
+            schema_translate_map = SQLiteScopedSession._get_schema_translate_map(bases)
 
             if schema_translate_map:
                 execution_options["schema_translate_map"] = schema_translate_map
 
-        engine = create_engine(
-            connection_string,
-            echo=echo,
-            execution_options=execution_options,
-            connect_args=connect_args.model_dump() if connect_args is not None else {},
-            poolclass=poolclass,
-        )
+        engine_kwargs: dict[str, Any] = {
+            "echo": echo,
+            "execution_options": execution_options,
+            "connect_args": sqlite_connect_args,
+            **(pool or DatabasePoolConfig()).engine_kwargs(queue_pool=queue_pool),
+        }
+        pragmas = performance_config.pragmas()
+
+        def create_sqlite_engine() -> Engine:
+            engine = create_engine(
+                connection_string, poolclass=poolclass, **engine_kwargs
+            )
+
+            if pragmas:
+                event.listen(engine, "connect", _get_pragmas_on_connect(pragmas))
+
+            if pool_metrics is not None:
+                instrument_pool(engine, pool_metrics)
+
+            return engine
+
+        if registry is None or poolclass is StaticPool:
+            engine = create_sqlite_engine()
+        else:
+            engine = registry.get(
+                get_engine_key(
+                    connection_string, pool_metrics=pool_metrics, **engine_kwargs
+                ),
+                create_sqlite_engine,
+            )
 
         if bases:
-            SQLiteScopedSession._alter_base_schemas(engine, bases)
+            SQLiteScopedSession._alter_base_schemas(engine if reflect else None, bases)
 
         return SQLiteScopedSession(
             sessionmaker(autocommit=False, autoflush=False, bind=engine)
         )
 
     @staticmethod
-    def _alter_base_schemas(engine: Engine, bases: list[MetaBase | type[MetaBase]]):
+    def _get_schema_translate_map(
+        bases: list[MetaBase | type[MetaBase]],
+    ) -> dict[str | None, None]:
+        # SQLite does not have schemas, so every schema is translated to none.
+        return {
+            base.__table_args__.get("schema"): None
+            for base in bases
+            if hasattr(base, "__table_args__")
+            and isinstance(base.__table_args__, dict)
+            and base.__table_args__.get("schema")
+        }
+
+    @staticmethod
+    def _alter_base_schemas(
+        engine: Engine | None, bases: list[MetaBase | type[MetaBase]]
+    ):
         # SQLite does not have schemas, which are mapped to None above,
         # however, we can "fake" it by querying table names with periods,
         # e.g., `SELECT * FROM 'foo.table'`.
         # This renames all tables to include the schema name in their name.
+        # Without an engine, only the tables declared on
+        # the bases are renamed, and the database is not reflected.
         for metadata_base in bases:
-            metadata_base.metadata.reflect(bind=engine)
+            if engine is not None:
+                reflect_tables(engine, metadata_base.metadata)
             for table_subclass in type(metadata_base).__subclasses__(metadata_base):
                 schema: str | None = None
                 if hasattr(metadata_base, "__table_args__") and isinstance(
@@ -120,10 +198,29 @@ class SQLiteScopedSession(ScopedSession, IScopedSessionFactory["SQLiteScopedSess
         This will be removed at a later date.
         """
 
-        def _fk_pragma_on_connect(dbapi_con: Connection, con_record: _ConnectionRecord):
-            """
-            Called immediately after a connection is established.
-            """
-            _ = dbapi_con.execute("pragma foreign_keys=ON")
+        # engines shared through an `EngineRegistry` are used by
+        # more than one session factory, but only need one listener.
+        if not event.contains(self.bind, "connect", _fk_pragma_on_connect):
+            event.listen(self.bind, "connect", _fk_pragma_on_connect)
+
+
+def _fk_pragma_on_connect(dbapi_con: Connection, con_record: _ConnectionRecord):
+    """
+    Called immediately after a connection is established.
+    """
+    _ = dbapi_con.execute("pragma foreign_keys=ON")
+
+
+def _get_pragmas_on_connect(pragmas: list[str]) -> Callable[[Any, Any], None]:
+    """
+    Get a "connect" event listener that runs `pragmas` on every new connection.
+    """
+
+    def _pragmas_on_connect(dbapi_con: Any, con_record: Any):
+        # a cursor is used so this works for the aiosqlite adapter too
+        cursor = dbapi_con.cursor()
+        for pragma in pragmas:
+            _ = cursor.execute(pragma)
+        cursor.close()
 
-        event.listen(self.bind, "connect", _fk_pragma_on_connect)
+    return _pragmas_on_connect
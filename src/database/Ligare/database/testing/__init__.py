@@ -3,6 +3,8 @@ Libraries, fixtures, mocks, and other utilities
 for tests using SQLAlchemy, Alembic, or :ref:`Ligare.database`.
 """
 
+import tempfile
+from pathlib import Path
 from typing import Any as Any
 from typing import Generator, cast
 from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock
@@ -11,8 +13,11 @@ import pytest
 from injector import Injector
 from Ligare.database.config import Config
 from Ligare.database.dependency_injection import get_database_ioc_container
-from Ligare.database.migrations.alembic.env import set_up_database as _set_up_database
 from Ligare.database.testing.config import inmemory_database_config
+from Ligare.database.testing.migrations import (
+    MigratedDatabaseSnapshot,
+    set_up_database_from_snapshot,
+)
 from Ligare.database.types import MetaBase
 from mock import MagicMock
 from pytest import FixtureRequest
@@ -35,6 +40,47 @@ def mock_postgresql_connection(mocker: MockerFixture) -> MockPostgreSQLConnectio
     )
 
 
+_snapshots: dict[Path, MigratedDatabaseSnapshot] = {}
+
+
+def get_migrated_database_snapshot(
+    config: pytest.Config, config_filename: str = "alembic.ini"
+) -> MigratedDatabaseSnapshot:
+    """
+    Get the snapshot of the database migrated with `config_filename`, migrating it the first time it is needed.
+
+    Snapshots are kept in pytest's cache directory, so later test runs reuse
+    them until the migrations change, or in a temporary directory if pytest's
+    cache is disabled. The snapshot is only looked up once per process.
+
+    :param pytest.Config config: The pytest configuration.
+    :param str config_filename: The Alembic configuration file.
+    :return MigratedDatabaseSnapshot:
+    """
+    key = Path(config_filename).resolve()
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        cache = getattr(config, "cache", None)
+        directory = (
+            Path(cache.mkdir("ligare-database"))
+            if cache is not None
+            else Path(tempfile.mkdtemp(prefix="ligare-database-"))
+        )
+        snapshot = _snapshots[key] = MigratedDatabaseSnapshot.create(
+            directory, config_filename
+        )
+
+    return snapshot
+
+
+@pytest.fixture(scope="session")
+def migrated_database_snapshot(request: FixtureRequest) -> MigratedDatabaseSnapshot:
+    """
+    The database migrated with `alembic.ini`. It is migrated once, and restored for each test.
+    """
+    return get_migrated_database_snapshot(request.config)
+
+
 def _set_up_database_container(bases: list[MetaBase | type[MetaBase]]):
     database_config = inmemory_database_config()
     config = Config(database=database_config)
@@ -60,7 +106,7 @@ def set_up_database_container(request: FixtureRequest) -> Injector:
 
 @pytest.fixture
 def set_up_database(
-    request: FixtureRequest,
+    request: FixtureRequest, migrated_database_snapshot: MigratedDatabaseSnapshot
 ) -> Generator[tuple[Session, Connection], Any, None]:
     bases = _get_bases_parameter(request)
 
@@ -71,5 +117,9 @@ def set_up_database(
             raise Exception(
                 "SQLAlchemy Session is not bound to an engine. This is not supported."
             )
-        with _set_up_database(session.bind.engine) as connection:
+        # the in-memory database is restored from the migrated snapshot
+        # rather than running every migration for every test.
+        with set_up_database_from_snapshot(
+            session.bind.engine, migrated_database_snapshot
+        ) as connection:
             yield (session, connection)
@@ -0,0 +1,232 @@
+"""
+Migrated databases for tests, without running every migration for every test.
+
+SQLite tests restore a :class:`MigratedDatabaseSnapshot`, a database file that
+is migrated once and kept on disk until the migration scripts change. PostgreSQL
+tests migrate their database once per process with :func:`migrate_once`, and run
+in a transaction that :func:`transactional_database` rolls back.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, cast
+
+from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
+from Ligare.database.migrations.alembic.env import set_up_database
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm.scoping import ScopedSession
+
+
+def get_migrations_key(
+    config_filename: str = "alembic.ini", up_revision: str = "head"
+) -> str:
+    """
+    Get a key that changes when the migrations a database is migrated with change.
+
+    :param str config_filename: The Alembic configuration file.
+    :param str up_revision: The revision the database is migrated to.
+    :return str: A hash of the configuration file, every file in its script
+        directory, the revision, and the SQLite library's version.
+    """
+    alembic_config = AlembicConfig(config_filename)
+    script_directory = Path(ScriptDirectory.from_config(alembic_config).dir)
+
+    digest = hashlib.sha256()
+    digest.update(f"{up_revision}\0{sqlite3.sqlite_version}\0".encode())
+    digest.update(Path(config_filename).read_bytes())
+    for path in sorted(script_directory.rglob("*")):
+        if not path.is_file() or "__pycache__" in path.parts:
+            continue
+        digest.update(str(path.relative_to(script_directory)).encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+class MigratedDatabaseSnapshot:
+    """
+    An SQLite database file migrated to a revision, which is copied into other SQLite databases.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        :param Path path: The migrated database file.
+        """
+        self.path = path
+
+    @staticmethod
+    def create(
+        directory: Path,
+        config_filename: str = "alembic.ini",
+        up_revision: str = "head",
+    ) -> "MigratedDatabaseSnapshot":
+        """
+        Get the snapshot of the current migrations in `directory`, migrating a new database if there is none.
+
+        The snapshot's file name is the :func:`get_migrations_key` of the migrations,
+        so snapshots of migrations that have since changed are not used. Snapshots
+        are written to a temporary file that is then renamed, so processes that
+        create the same snapshot at the same time do not read incomplete files.
+
+        :param Path directory: Where snapshots are kept.
+        :param str config_filename: The Alembic configuration file.
+        :param str up_revision: The revision the database is migrated to.
+        :return MigratedDatabaseSnapshot:
+        """
+        path = directory / f"{get_migrations_key(config_filename, up_revision)}.sqlite3"
+        if path.exists():
+            return MigratedDatabaseSnapshot(path)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory, suffix=".sqlite3.tmp"
+        )
+        os.close(file_descriptor)
+        try:
+            engine = create_engine(f"sqlite:///{temporary_path}")
+            try:
+                # the database is new, so it is not downgraded first
+                with set_up_database(
+                    engine,
+                    down_revision=None,
+                    up_revision=up_revision,
+                    config_filename=config_filename,
+                ):
+                    pass
+            finally:
+                engine.dispose()
+            os.replace(temporary_path, path)
+        except:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+        return MigratedDatabaseSnapshot(path)
+
+    def restore(self, connection: Connection) -> None:
+        """
+        Replace the contents of the database `connection` is connected to with the snapshot's.
+
+        This uses SQLite's backup API, so it also restores in-memory databases.
+
+        :param Connection connection: A connection to an SQLite database that is not in a transaction.
+        """
+        # `dbapi_connection` is the `sqlite3.Connection` the pool manages
+        target = cast(
+            sqlite3.Connection,
+            connection.connection.dbapi_connection,  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+        )
+        source = sqlite3.connect(self.path)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+
+
+def set_up_database_from_snapshot(
+    engine: Engine, snapshot: MigratedDatabaseSnapshot
+) -> Engine._trans_ctx:
+    """
+    Restore `snapshot` into the SQLite database of `engine`.
+
+    This replaces `Ligare.database.migrations.alembic.env.set_up_database`
+    for SQLite databases, without running any migrations.
+
+    :param Engine engine:
+    :param MigratedDatabaseSnapshot snapshot:
+    :return Engine._trans_ctx: A transaction on a connection to the restored database.
+    """
+    with engine.connect() as connection:
+        snapshot.restore(connection)
+
+    return engine.begin()
+
+
+_migrated_lock = threading.Lock()
+# the URLs of the databases `migrate_once` has migrated, and the revisions they were migrated to
+_migrated: set[tuple[str, str, str]] = set()
+
+
+def migrate_once(
+    engine: Engine,
+    config_filename: str = "alembic.ini",
+    up_revision: str = "head",
+) -> None:
+    """
+    Migrate the database of `engine` to `up_revision`, unless this process already has.
+
+    The database is downgraded to the base revision before it is upgraded, as
+    `set_up_database` does, so it starts from the same state in every test run.
+
+    :param Engine engine:
+    :param str config_filename: The Alembic configuration file.
+    :param str up_revision: The revision the database is migrated to.
+    """
+    key = (
+        engine.url.render_as_string(hide_password=True),
+        str(Path(config_filename).resolve()),
+        up_revision,
+    )
+    with _migrated_lock:
+        if key in _migrated:
+            return
+
+        with set_up_database(
+            engine, up_revision=up_revision, config_filename=config_filename
+        ):
+            pass
+        _migrated.add(key)
+
+
+@contextmanager
+def transactional_database(
+    engine: Engine, scoped_session: ScopedSession | None = None
+) -> Iterator[Connection]:
+    """
+    Run everything in a transaction that is rolled back when the context exits.
+
+    Sessions that commit release a savepoint instead, which is started again after
+    each of their transactions ends, so what a test commits is visible to the rest of
+    the test, and rolled back after it. The database must already be migrated; see
+    :func:`migrate_once`.
+
+    :param Engine engine:
+    :param ScopedSession | None scoped_session: A session factory whose sessions are bound
+        to the transaction's connection, rather than to `engine`, until the context exits.
+    :return Iterator[Connection]: The connection the transaction is on.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    savepoint = connection.begin_nested()
+
+    def restart_savepoint(*args: Any) -> None:
+        nonlocal savepoint
+        if not savepoint.is_active:
+            savepoint = connection.begin_nested()
+
+    session_factory: Any = None
+    bind: Any = None
+    if scoped_session is not None:
+        scoped_session.remove()
+        session_factory = scoped_session.session_factory
+        bind = session_factory.kw.get("bind")
+        event.listen(session_factory, "after_transaction_end", restart_savepoint)
+        session_factory.configure(bind=connection)
+
+    try:
+        yield connection
+    finally:
+        if scoped_session is not None:
+            scoped_session.remove()
+            event.remove(session_factory, "after_transaction_end", restart_savepoint)
+            session_factory.configure(bind=bind)
+
+        transaction.rollback()
+        connection.close()
@@ -3,15 +3,19 @@ Static types for use in type hinting.
 """
 
 from abc import ABC
-from typing import Any, Callable, Protocol, TypedDict, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypedDict, TypeVar
 
-from Ligare.database.config import DatabaseConnectArgsConfig
+from Ligare.database.config import DatabaseConnectArgsConfig, DatabasePoolConfig
 from sqlalchemy import Constraint, MetaData
 from sqlalchemy.engine import Dialect
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm.scoping import ScopedSession
 from sqlalchemy.orm.session import sessionmaker
 
+if TYPE_CHECKING:
+    from Ligare.database.engine.metrics import PoolMetricsHook
+    from Ligare.database.engine.registry import EngineRegistry
+
 TBase = TypeVar("TBase")
 
 
@@ -35,6 +39,10 @@ class IScopedSessionFactory(Protocol[T_scoped_session]):
         execution_options: dict[str, Any] | None = None,
         connect_args: DatabaseConnectArgsConfig | None = None,
         bases: list[MetaBase | type[MetaBase]] | None = None,
+        pool: DatabasePoolConfig | None = None,
+        pool_metrics: "PoolMetricsHook | None" = None,
+        registry: "EngineRegistry | None" = None,
+        reflect: bool = True,
     ) -> T_scoped_session: ...
 
     def __init__(  # pyright: ignore[reportMissingSuperCall]
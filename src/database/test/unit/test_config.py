@@ -1,5 +1,11 @@
-from Ligare.database.config import DatabaseConfig
+import pytest
+from Ligare.database.config import (
+    DatabaseConfig,
+    SQLiteDatabaseConnectArgsConfig,
+    SQLitePerformanceConfig,
+)
 from Ligare.programming.config import load_config
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
 
@@ -10,3 +16,31 @@ def test__Config__load_config__initializes_database_config(mocker: MockerFixture
     config = load_config(DatabaseConfig, "foo.toml")
     assert config is not None
     assert config.connection_string == "test_connection_string"
+
+
+def test__DatabaseConfig__parses_sqlite_performance_config():
+    config = DatabaseConfig(
+        connection_string="sqlite:///foo.db",
+        connect_args={"performance": {"profile": "performance", "synchronous": "FULL"}},
+    )
+
+    assert isinstance(config.connect_args, SQLiteDatabaseConnectArgsConfig)
+    assert config.connect_args.performance.pragmas() == [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=FULL",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def test__SQLitePerformanceConfig__default_profile_only_uses_options_that_are_set():
+    performance = SQLitePerformanceConfig(cache_size=-1024)
+
+    assert performance.options() == {"cache_size": -1024}
+    assert performance.pragmas() == ["PRAGMA cache_size=-1024"]
+
+
+def test__SQLitePerformanceConfig__rejects_unknown_pragma_values():
+    with pytest.raises(ValidationError):
+        _ = SQLitePerformanceConfig(journal_mode="WAL; DROP TABLE foo")  # pyright: ignore[reportArgumentType]
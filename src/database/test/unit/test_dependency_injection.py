@@ -1,7 +1,10 @@
+import asyncio
+
 from injector import Injector
 from Ligare.database.config import DatabaseConfig
 from Ligare.database.dependency_injection import ScopedSessionModule
 from Ligare.programming.dependency_injection import ConfigModule
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.session import Session
 
 
@@ -48,3 +51,20 @@ def test__ScopedSessionModule__injector_binds_Session_using_configured_DatabaseC
     session = injector.get(Session)
     assert session.bind is not None
     assert str(session.bind.engine.url) == database_config.connection_string
+
+
+def test__ScopedSessionModule__injector_binds_AsyncSession_using_configured_DatabaseConfig_module():
+    database_config = DatabaseConfig(connection_string="sqlite:///:memory:")
+    config_module = ConfigModule(
+        database_config,
+        DatabaseConfig,
+    )
+
+    injector = Injector([config_module, ScopedSessionModule()])
+
+    async def get_session():
+        return injector.get(AsyncSession)
+
+    session = asyncio.run(get_session())
+    assert session.bind is not None
+    assert str(session.bind.url) == "sqlite+aiosqlite:///:memory:"
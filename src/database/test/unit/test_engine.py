@@ -1,7 +1,15 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+from Ligare.database.config import (
+    DatabasePoolConfig,
+    SQLiteDatabaseConnectArgsConfig,
+    SQLitePerformanceConfig,
+)
 from Ligare.database.engine import DatabaseEngine
 from Ligare.database.engine.postgresql import PostgreSQLScopedSession
 from Ligare.database.engine.sqlite import SQLiteScopedSession
@@ -256,3 +264,107 @@ def test__ScopedSession__create__correctly_resets_schema_when_creating_engine_mu
         assert Foo.__tablename__ == tablename
         assert Foo.__table__.name == tablename  # pyright: ignore[reportUnknownMemberType]
         assert Foo.__table__.fullname == f"{schema_name}.{tablename}"  # pyright: ignore[reportUnknownMemberType]
+
+
+@pytest.mark.parametrize(
+    "session_type,connection_string,expected_kwargs",
+    [
+        (
+            PostgreSQLScopedSession,
+            POSTGRESQL_TEST_CONNECTION_STR,
+            {
+                "pool_pre_ping": True,
+                "pool_recycle": 300,
+                "pool_use_lifo": True,
+                "pool_size": 2,
+                "max_overflow": 3,
+                "pool_timeout": 4.0,
+            },
+        ),
+        (
+            SQLiteScopedSession,
+            SQLITE_TEST_CONNECTION_STR,
+            {"pool_pre_ping": True, "pool_recycle": 300},
+        ),
+    ],
+)
+def test__ScopedSession__create__applies_pool_config(
+    session_type: type[SQLiteScopedSession | PostgreSQLScopedSession],
+    connection_string: str,
+    expected_kwargs: dict[str, Any],
+    mocker: MockerFixture,
+):
+    _ = mocker.patch("Ligare.database.engine.sqlite.event")
+    create_engine_mock = mocker.patch(
+        f"Ligare.database.engine.{session_type.__module__.rsplit('.', 1)[1]}.create_engine"
+    )
+    pool = DatabasePoolConfig(
+        size=2, max_overflow=3, timeout=4, recycle=300, pre_ping=True, use_lifo=True
+    )
+
+    _ = session_type.create(connection_string, pool=pool)
+
+    kwargs = create_engine_mock.call_args[1]
+    assert {
+        key: kwargs[key]
+        for key in kwargs
+        if key.startswith("pool_") or key == "max_overflow"
+    } == expected_kwargs
+
+
+def _get_pragmas(session: Any) -> tuple[Any, ...]:
+    return tuple(
+        session.execute(f"PRAGMA {name};").scalar()
+        for name in ("journal_mode", "synchronous", "temp_store", "mmap_size")
+    )
+
+
+def test__SQLiteScopedSession__create__applies_performance_profile(tmp_path: Path):
+    connect_args = SQLiteDatabaseConnectArgsConfig(
+        performance=SQLitePerformanceConfig(profile="performance")
+    )
+
+    scoped_session = SQLiteScopedSession.create(
+        f"sqlite:///{tmp_path / 'foo.db'}", connect_args=connect_args
+    )
+
+    assert isinstance(scoped_session.bind.pool, QueuePool)  # pyright: ignore[reportAttributeAccessIssue,reportOptionalMemberAccess,reportUnknownMemberType]
+    # WAL, NORMAL, MEMORY
+    assert _get_pragmas(scoped_session()) == ("wal", 1, 2, 268435456)
+
+
+def test__SQLiteScopedSession__create__uses_sqlite_defaults_without_profile(
+    tmp_path: Path,
+):
+    scoped_session = SQLiteScopedSession.create(
+        f"sqlite:///{tmp_path / 'foo.db'}",
+        connect_args=SQLiteDatabaseConnectArgsConfig(),
+    )
+
+    assert isinstance(scoped_session.bind.pool, NullPool)  # pyright: ignore[reportAttributeAccessIssue,reportOptionalMemberAccess,reportUnknownMemberType]
+    # DELETE, FULL, DEFAULT
+    assert _get_pragmas(scoped_session()) == ("delete", 2, 0, 0)
+
+
+def test__SQLiteScopedSession__create__queue_pool_connections_are_shared_between_threads(
+    tmp_path: Path,
+):
+    connect_args = SQLiteDatabaseConnectArgsConfig(
+        performance=SQLitePerformanceConfig(queue_pool=True)
+    )
+    scoped_session = SQLiteScopedSession.create(
+        f"sqlite:///{tmp_path / 'foo.db'}",
+        connect_args=connect_args,
+        pool=DatabasePoolConfig(size=1, max_overflow=0),
+    )
+    engine = scoped_session.bind
+
+    def query() -> Any:
+        with engine.connect() as connection:  # pyright: ignore[reportOptionalMemberAccess]
+            return connection.execute("SELECT 1").scalar()  # pyright: ignore[reportArgumentType]
+
+    assert query() == 1
+    # the connection opened by this thread is reused by another thread
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(query).result() == 1
+    assert engine.pool.checkedin() == 1  # pyright: ignore[reportAttributeAccessIssue,reportOptionalMemberAccess,reportUnknownMemberType]
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from Ligare.database.engine.metrics import PoolEvent, instrument_pool
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+
+def test__instrument_pool__reports_checkouts_overflow_and_timeouts(tmp_path: Path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    events: list[PoolEvent] = []
+    instrument_pool(engine, events.append)
+
+    first = engine.connect()
+    second = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        _ = engine.connect()
+    second.close()
+    first.close()
+
+    assert [(event.name, event.checked_out, event.overflow) for event in events] == [
+        ("checkout", 1, 0),
+        ("checkout", 2, 1),
+        ("overflow", 2, 1),
+        ("timeout", 2, 1),
+        # the overflow connection is closed after it is checked in
+        ("checkin", 1, 1),
+        ("checkin", 0, 1),
+    ]
+    assert all(
+        event.wait_time is not None for event in events if event.name != "checkin"
+    )
+    assert events[3].wait_time is not None and events[3].wait_time >= 0.01
+    assert events[0].engine == f"sqlite:///{tmp_path / 'test.db'}"
+
+
+def test__instrument_pool__reports_overflow_only_when_it_grows(tmp_path: Path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    events: list[PoolEvent] = []
+    instrument_pool(engine, events.append)
+
+    first = engine.connect()
+    second = engine.connect()
+    # the pool is not full, so the overflow connection is kept and reused
+    second.close()
+    third = engine.connect()
+    third.close()
+    first.close()
+
+    assert [(event.name, event.overflow) for event in events] == [
+        ("checkout", 0),
+        ("checkout", 1),
+        ("overflow", 1),
+        ("checkin", 1),
+        ("checkout", 1),
+        ("checkin", 1),
+        ("checkin", 1),
+    ]
+
+
+def test__instrument_pool__reports_events_after_dispose(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", poolclass=QueuePool)
+    events: list[PoolEvent] = []
+    instrument_pool(engine, events.append)
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert [event.name for event in events] == ["checkout", "checkin"]
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+from Ligare.database.config import DatabasePoolConfig
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.registry import EngineRegistry, get_engine_key
+from mock import MagicMock
+
+SQLITE_TEST_CONNECTION_STR = "sqlite:///:memory:"
+
+
+def test__get_engine_key__is_equal_for_equal_options():
+    assert get_engine_key(
+        "sqlite:///foo.db", echo=True, execution_options={"foo": ["bar"]}
+    ) == get_engine_key(
+        "sqlite:///foo.db", execution_options={"foo": ["bar"]}, echo=True
+    )
+
+
+@pytest.mark.parametrize(
+    "connection_string,options",
+    [
+        ("sqlite:///bar.db", {"echo": True}),
+        ("sqlite:///foo.db", {"echo": False}),
+        ("sqlite:///foo.db", {"echo": True, "pool_pre_ping": True}),
+    ],
+)
+def test__get_engine_key__differs_for_different_options(
+    connection_string: str, options: dict[str, bool]
+):
+    assert get_engine_key("sqlite:///foo.db", echo=True) != get_engine_key(
+        connection_string, **options
+    )
+
+
+def test__EngineRegistry__get__creates_engine_once():
+    registry = EngineRegistry()
+    engine = MagicMock()
+    create = MagicMock(return_value=engine)
+
+    first_engine = registry.get("foo", create)
+    second_engine = registry.get("foo", create)
+
+    assert first_engine is engine
+    assert second_engine is engine
+    assert create.call_count == 1
+    engine.dispose.assert_not_called()
+    assert len(registry) == 1
+
+
+def test__EngineRegistry__dispose_all__disposes_every_engine():
+    registry = EngineRegistry()
+    engines = [MagicMock(), MagicMock()]
+    for key, engine in enumerate(engines):
+        _ = registry.get(key, lambda: engine)
+
+    registry.dispose_all()
+
+    for engine in engines:
+        engine.dispose.assert_called_once_with()
+    assert len(registry) == 0
+
+
+def test__EngineRegistry__dispose_after_fork__keeps_engines_without_closing_connections():
+    registry = EngineRegistry()
+    engine = MagicMock()
+    _ = registry.get("foo", lambda: engine)
+
+    registry.dispose_after_fork()
+
+    engine.dispose.assert_called_once_with(close=False)
+    assert registry.get("foo", MagicMock()) is engine
+
+
+def test__DatabaseEngine__get_session_from_connection_string__shares_engines(
+    tmp_path: Path,
+):
+    registry = EngineRegistry()
+    connection_string = f"sqlite:///{tmp_path / 'foo.db'}"
+
+    first_session = DatabaseEngine.get_session_from_connection_string(
+        connection_string, registry=registry
+    )
+    second_session = DatabaseEngine.get_session_from_connection_string(
+        connection_string, registry=registry
+    )
+    other_session = DatabaseEngine.get_session_from_connection_string(
+        connection_string, registry=registry, pool=DatabasePoolConfig(pre_ping=True)
+    )
+
+    assert first_session is not second_session
+    assert first_session.bind is second_session.bind
+    assert first_session.bind is not other_session.bind
+    assert len(registry) == 2
+    assert first_session().execute("PRAGMA foreign_keys;").one() == (1,)  # pyright: ignore[reportArgumentType]
+
+    registry.dispose_all()
+
+
+def test__DatabaseEngine__get_session_from_connection_string__does_not_share_inmemory_databases():
+    registry = EngineRegistry()
+
+    first_session = DatabaseEngine.get_session_from_connection_string(
+        SQLITE_TEST_CONNECTION_STR, registry=registry
+    )
+    second_session = DatabaseEngine.get_session_from_connection_string(
+        SQLITE_TEST_CONNECTION_STR, registry=registry
+    )
+
+    assert first_session.bind is not second_session.bind
+    assert len(registry) == 0
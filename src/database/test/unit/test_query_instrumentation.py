@@ -0,0 +1,194 @@
+import logging
+import threading
+from contextvars import copy_context
+from typing import Any
+
+import pytest
+from injector import Injector
+from Ligare.database.config import (
+    DatabaseConfig,
+    DatabaseInstrumentationConfig,
+    SQLiteDatabaseConnectArgsConfig,
+)
+from Ligare.database.dependency_injection import ScopedSessionModule
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.instrumentation import QueryInstrumentation
+from Ligare.programming.dependency_injection import ConfigModule
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.scoping import ScopedSession
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _instrumentation(**config: Any) -> QueryInstrumentation:
+    return QueryInstrumentation(
+        DatabaseInstrumentationConfig(**{
+            "slow_query_threshold": None,
+            "repeated_statement_threshold": None,
+            **config,
+        })
+    )
+
+
+def _execute(engine: Engine, *statements: str) -> None:
+    with engine.connect() as connection:
+        for statement in statements:
+            _ = connection.execute(text(statement))
+
+
+def test__QueryInstrumentation__instrument__is_idempotent(engine: Engine):
+    instrumentation = _instrumentation()
+
+    instrumentation.instrument(engine)
+    instrumentation.instrument(engine)
+
+    with instrumentation.scope() as stats:
+        _execute(engine, "SELECT 1")
+
+    assert stats.count == 1
+
+
+def test__QueryInstrumentation__scope__counts_queries_and_durations(engine: Engine):
+    instrumentation = _instrumentation()
+    instrumentation.instrument(engine)
+
+    with instrumentation.scope() as stats:
+        _execute(engine, "SELECT 1", "SELECT 1", "SELECT 2")
+
+    assert stats.count == 3
+    assert stats.duration > 0
+    assert stats.statements == {"SELECT 1": 2, "SELECT 2": 1}
+    assert instrumentation.current is None
+
+
+def test__QueryInstrumentation__does_not_count_queries_outside_of_a_scope(
+    engine: Engine,
+):
+    instrumentation = _instrumentation()
+    instrumentation.instrument(engine)
+
+    _execute(engine, "SELECT 1")
+
+    with instrumentation.scope() as stats:
+        pass
+
+    assert stats.count == 0
+
+
+def test__QueryInstrumentation__counts_queries_in_threads_running_a_copy_of_the_context(
+    engine: Engine,
+):
+    instrumentation = _instrumentation()
+    instrumentation.instrument(engine)
+
+    with instrumentation.scope() as stats:
+        context = copy_context()
+        thread = threading.Thread(
+            target=context.run, args=(_execute, engine, "SELECT 1")
+        )
+        thread.start()
+        thread.join()
+
+    assert stats.count == 1
+
+
+def test__QueryInstrumentation__logs_slow_queries_with_the_scope_tag(
+    engine: Engine, caplog: pytest.LogCaptureFixture
+):
+    instrumentation = _instrumentation(slow_query_threshold=0)
+    instrumentation.instrument(engine)
+
+    with caplog.at_level(logging.WARNING), instrumentation.scope(lambda: "trace-id"):
+        _execute(engine, "SELECT 1")
+
+    assert "Slow query" in caplog.text
+    assert "trace-id" in caplog.text
+    assert "SELECT 1" in caplog.text
+
+
+def test__QueryInstrumentation__does_not_log_queries_faster_than_the_threshold(
+    engine: Engine, caplog: pytest.LogCaptureFixture
+):
+    instrumentation = _instrumentation(slow_query_threshold=60)
+    instrumentation.instrument(engine)
+
+    with caplog.at_level(logging.WARNING):
+        _execute(engine, "SELECT 1")
+
+    assert "Slow query" not in caplog.text
+
+
+def test__QueryInstrumentation__warns_once_when_a_statement_repeats(
+    engine: Engine, caplog: pytest.LogCaptureFixture
+):
+    instrumentation = _instrumentation(repeated_statement_threshold=3)
+    instrumentation.instrument(engine)
+
+    with caplog.at_level(logging.WARNING), instrumentation.scope(lambda: "trace-id"):
+        _execute(engine, *(["SELECT 1"] * 2))
+        assert "The same query ran" not in caplog.text
+        _execute(engine, *(["SELECT 1"] * 5))
+
+    messages = [
+        record.message
+        for record in caplog.records
+        if "The same query ran" in record.message
+    ]
+    assert len(messages) == 1
+    assert "3 times" in messages[0]
+    assert "trace-id" in messages[0]
+
+
+def test__QueryInstrumentation__counts_repeated_statements_per_scope(
+    engine: Engine, caplog: pytest.LogCaptureFixture
+):
+    instrumentation = _instrumentation(repeated_statement_threshold=3)
+    instrumentation.instrument(engine)
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            with instrumentation.scope():
+                _execute(engine, "SELECT 1", "SELECT 1")
+
+    assert "The same query ran" not in caplog.text
+
+
+def test__DatabaseEngine__get_session_from_connection_string__instruments_the_engine():
+    instrumentation = _instrumentation()
+
+    scoped_session = DatabaseEngine.get_session_from_connection_string(
+        "sqlite://", query_instrumentation=instrumentation
+    )
+
+    with instrumentation.scope() as stats, scoped_session() as session:
+        _ = session.execute(text("SELECT 1"))
+
+    assert stats.count == 1
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test__ScopedSessionModule__instruments_the_engine_when_enabled(enabled: bool):
+    config = DatabaseConfig(
+        connection_string="sqlite://",
+        connect_args=SQLiteDatabaseConnectArgsConfig(),
+        instrumentation=DatabaseInstrumentationConfig(enabled=enabled),
+    )
+    injector = Injector([ConfigModule(config, DatabaseConfig), ScopedSessionModule()])
+
+    scoped_session = injector.get(ScopedSession)
+    instrumentation = injector.get(QueryInstrumentation)
+
+    assert (
+        event.contains(
+            scoped_session.session_factory.kw["bind"],
+            "before_cursor_execute",
+            instrumentation._before_cursor_execute,  # pyright: ignore[reportPrivateUsage]
+        )
+        == enabled
+    )
@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.reflection import (
+    clear_reflection_cache,
+    get_table_names,
+    reflect_tables,
+)
+from pytest_mock import MockerFixture
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, create_engine
+from sqlalchemy.ext.declarative import declarative_base
+
+
+@pytest.fixture(autouse=True)
+def reflection_cache():
+    clear_reflection_cache()
+    yield
+    clear_reflection_cache()
+
+
+def _create_database(path: Path) -> str:
+    connection_string = f"sqlite:///{path}"
+    metadata = MetaData()
+    _ = Table("bar", metadata, Column("bar_id", Integer, primary_key=True))
+    _ = Table("baz", metadata, Column("baz_id", Integer, primary_key=True))
+    engine = create_engine(connection_string)
+    metadata.create_all(engine)
+    engine.dispose()
+    return connection_string
+
+
+def _get_metadata() -> MetaData:
+    metadata = MetaData()
+    _ = Table(
+        "foo",
+        metadata,
+        Column("foo_id", Integer, primary_key=True),
+        Column("bar_id", Integer, ForeignKey("bar.bar_id")),
+    )
+    return metadata
+
+
+def test__get_table_names__includes_tables_referred_to_by_foreign_keys():
+    metadata = MetaData(schema="foo_schema")
+    _ = Table(
+        "foo",
+        metadata,
+        Column("foo_id", Integer, primary_key=True),
+        Column("bar_id", Integer, ForeignKey("bar_schema.bar.bar_id")),
+    )
+
+    assert get_table_names(metadata) == {
+        "foo",
+        "foo_schema.foo",
+        "bar",
+        "bar_schema.bar",
+    }
+
+
+def test__reflect_tables__only_reflects_tables_the_metadata_uses(tmp_path: Path):
+    engine = create_engine(_create_database(tmp_path / "foo.db"))
+    metadata = _get_metadata()
+
+    reflect_tables(engine, metadata)
+
+    assert set(metadata.tables) == {"foo", "bar"}
+
+
+def test__reflect_tables__reflects_each_database_once(
+    tmp_path: Path, mocker: MockerFixture
+):
+    metadata = _get_metadata()
+    reflect_spy = mocker.spy(metadata, "reflect")
+    engines = [
+        create_engine(_create_database(tmp_path / f"{name}.db"))
+        for name in ("foo", "bar")
+    ]
+
+    reflect_tables(engines[0], metadata)
+    reflect_tables(create_engine(str(engines[0].url)), metadata)
+    reflect_tables(engines[1], metadata)
+
+    assert reflect_spy.call_count == 2
+
+
+def test__reflect_tables__reflects_inmemory_databases_every_time(
+    mocker: MockerFixture,
+):
+    metadata = _get_metadata()
+    reflect_spy = mocker.spy(metadata, "reflect")
+
+    reflect_tables(create_engine("sqlite:///:memory:"), metadata)
+    reflect_tables(create_engine("sqlite:///:memory:"), metadata)
+
+    assert reflect_spy.call_count == 2
+
+
+@pytest.mark.parametrize("reflect,call_count", [(True, 1), (False, 0)])
+def test__DatabaseEngine__get_session_from_connection_string__reflects_tables_unless_disabled(
+    reflect: bool, call_count: int, tmp_path: Path, mocker: MockerFixture
+):
+    Base = declarative_base()
+    reflect_spy = mocker.spy(Base.metadata, "reflect")
+
+    _ = DatabaseEngine.get_session_from_connection_string(
+        _create_database(tmp_path / "foo.db"),
+        bases=[Base],
+        registry=None,
+        reflect=reflect,
+    )
+
+    assert reflect_spy.call_count == call_count
@@ -0,0 +1,177 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from Ligare.database.config import DatabaseReplicaConfig
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.replica import ReplicaSet, RoutingSession
+from mock import MagicMock
+from sqlalchemy import Column, Integer, Unicode, create_engine, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class Foo(Base):  # pyright: ignore[reportUntypedBaseClass]
+    __tablename__ = "foo"
+    foo_id = Column("foo_id", Integer, primary_key=True)
+    name = Column("name", Unicode)
+
+
+def _create_database(path: Path, *names: str) -> str:
+    connection_string = f"sqlite:///{path}"
+    engine = create_engine(connection_string)
+    Base.metadata.create_all(engine)  # pyright: ignore[reportUnknownMemberType]
+    with engine.begin() as connection:
+        for name in names:
+            _ = connection.execute(Foo.__table__.insert().values(name=name))  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+    engine.dispose()
+    return connection_string
+
+
+def _get_names(session: Any) -> list[str]:
+    return [foo.name for foo in session.query(Foo).order_by(Foo.foo_id)]
+
+
+@pytest.fixture()
+def databases(tmp_path: Path) -> tuple[str, list[str]]:
+    # each database has different data, so the database
+    # a query was sent to can be told from its results.
+    primary = _create_database(tmp_path / "primary.db", "primary")
+    replicas = [
+        _create_database(tmp_path / f"replica{i}.db", f"replica{i}") for i in range(2)
+    ]
+    return primary, replicas
+
+
+def _get_scoped_session(databases: tuple[str, list[str]], **replica_config: Any) -> Any:
+    primary, replicas = databases
+    return DatabaseEngine.get_session_from_connection_string(
+        primary,
+        registry=None,
+        replicas=DatabaseReplicaConfig(connection_strings=replicas, **replica_config),
+    )
+
+
+def test__RoutingSession__sends_reads_to_replicas_in_turn(
+    databases: tuple[str, list[str]],
+):
+    scoped_session = _get_scoped_session(databases)
+
+    with scoped_session() as session:
+        assert isinstance(session, RoutingSession)
+        assert [_get_names(session) for _ in range(4)] == [
+            ["replica0"],
+            ["replica1"],
+            ["replica0"],
+            ["replica1"],
+        ]
+
+
+def test__RoutingSession__sends_writes_and_later_reads_to_primary(
+    databases: tuple[str, list[str]],
+):
+    scoped_session = _get_scoped_session(databases)
+
+    with scoped_session() as session:
+        session.add(Foo(name="new"))
+        session.commit()
+
+        assert session.reads_from_primary
+        assert _get_names(session) == ["primary", "new"]
+
+    with scoped_session() as session:
+        assert not session.reads_from_primary
+        assert _get_names(session) == ["replica0"]
+
+
+def test__RoutingSession__sends_locking_reads_to_primary(
+    databases: tuple[str, list[str]],
+):
+    scoped_session = _get_scoped_session(databases)
+
+    with scoped_session() as session:
+        assert session.execute(select(Foo.name).with_for_update()).scalars().all() == [
+            "primary"
+        ]
+
+
+def test__RoutingSession__use_primary__sends_reads_to_primary(
+    databases: tuple[str, list[str]],
+):
+    scoped_session = _get_scoped_session(databases)
+
+    with scoped_session() as session:
+        session.use_primary()
+        assert _get_names(session) == ["primary"]
+
+
+@pytest.mark.parametrize("lag,expected_names", [(0.5, ["replica0"]), (5, ["primary"])])
+def test__RoutingSession__falls_back_to_primary_when_replicas_lag(
+    lag: float, expected_names: list[str], databases: tuple[str, list[str]]
+):
+    primary, replicas = databases
+    scoped_session = _get_scoped_session((primary, replicas[:1]), max_lag=1)
+    lag_check = MagicMock(return_value=lag)
+    scoped_session.session_factory.kw["replicas"]._lag_check = lag_check
+
+    with scoped_session() as session:
+        assert _get_names(session) == expected_names
+        assert _get_names(session) == expected_names
+
+    # the lag is measured once per `lag_check_interval`
+    assert lag_check.call_count == 1
+
+
+def test__RoutingSession__falls_back_to_primary_when_lag_cannot_be_measured(
+    databases: tuple[str, list[str]],
+):
+    scoped_session = _get_scoped_session(databases, max_lag=1)
+    scoped_session.session_factory.kw["replicas"]._lag_check = MagicMock(
+        side_effect=Exception("replica is down")
+    )
+
+    with scoped_session() as session:
+        assert _get_names(session) == ["primary"]
+
+
+def test__ReplicaSet__select__chooses_replica_with_least_connections(
+    databases: tuple[str, list[str]],
+):
+    engines: list[Engine] = [create_engine(replica) for replica in databases[1]]
+    replica_set = ReplicaSet(
+        engines, DatabaseReplicaConfig(selection="least_connections")
+    )
+
+    with engines[0].connect():
+        assert replica_set.connections(engines[0]) == 1
+        assert [replica_set.select() for _ in range(2)] == [engines[1], engines[1]]
+
+    assert replica_set.connections(engines[0]) == 0
+
+
+def test__ReplicaSet__counts_connections_once_for_shared_engines(
+    databases: tuple[str, list[str]],
+):
+    engine = create_engine(databases[1][0])
+    replica_set = ReplicaSet([engine])
+    listeners = len(engine.pool.dispatch.checkout)
+    other_replica_set = ReplicaSet([engine])
+
+    assert len(engine.pool.dispatch.checkout) == listeners
+    with engine.connect():
+        assert replica_set.connections(engine) == 1
+        assert other_replica_set.connections(engine) == 1
+
+    assert replica_set.connections(engine) == 0
+
+
+def test__DatabaseEngine__get_session_from_connection_string__rejects_replicas_of_other_engines():
+    with pytest.raises(ValueError, match=r"same database engine"):
+        _ = DatabaseEngine.get_session_from_connection_string(
+            "sqlite:///:memory:",
+            replicas=DatabaseReplicaConfig(
+                connection_strings=["postgresql://localhost/foo"]
+            ),
+        )
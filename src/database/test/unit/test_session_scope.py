@@ -0,0 +1,158 @@
+import logging
+import threading
+from contextvars import copy_context
+from typing import Any
+
+import pytest
+from injector import Injector
+from Ligare.database.config import DatabaseConfig, SQLiteDatabaseConnectArgsConfig
+from Ligare.database.dependency_injection import ScopedSessionModule
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.session_scope import (
+    get_session_scope,
+    is_session_scoped,
+    remove_ended_sessions,
+    remove_scoped_session,
+    session_scope,
+)
+from Ligare.programming.dependency_injection import ConfigModule
+from sqlalchemy import Column, Integer, Unicode
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm.scoping import ScopedSession
+
+Base = declarative_base()
+
+
+class Foo(Base):  # pyright: ignore[reportUntypedBaseClass]
+    __tablename__ = "foo"
+    foo_id = Column("foo_id", Integer, primary_key=True)
+    name = Column("name", Unicode)
+
+
+@pytest.fixture()
+def scoped_session():
+    scoped_session = DatabaseEngine.get_session_from_connection_string(
+        "sqlite:///:memory:?check_same_thread=False", scopefunc=get_session_scope
+    )
+    Base.metadata.create_all(scoped_session.bind)  # pyright: ignore[reportUnknownMemberType,reportArgumentType]
+    yield scoped_session
+    scoped_session.remove()
+
+
+def _run_in_thread(target: Any) -> Any:
+    result: list[Any] = []
+    context = copy_context()
+    thread = threading.Thread(target=lambda: result.append(context.run(target)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test__get_session_scope__is_the_thread_outside_of_a_scope():
+    assert get_session_scope() == threading.get_ident()
+
+
+def test__session_scope__is_shared_by_threads_running_a_copy_of_the_context(
+    scoped_session: ScopedSession,
+):
+    with session_scope():
+        assert _run_in_thread(scoped_session) is scoped_session()
+
+
+def test__session_scope__has_its_own_session(scoped_session: ScopedSession):
+    outside = scoped_session()
+
+    with session_scope():
+        first = scoped_session()
+    with session_scope():
+        second = scoped_session()
+
+    assert len({id(outside), id(first), id(second)}) == 3
+
+
+def test__session_scope__marks_the_scope_ended():
+    with session_scope("request") as scope:
+        assert not scope.ended
+
+    assert scope.ended
+    assert get_session_scope() == threading.get_ident()
+
+
+def test__is_session_scoped(scoped_session: ScopedSession):
+    assert is_session_scoped(scoped_session)
+    assert not is_session_scoped(
+        DatabaseEngine.get_session_from_connection_string("sqlite://")
+    )
+
+
+def test__remove_scoped_session__closes_the_scope_session(
+    scoped_session: ScopedSession,
+):
+    with session_scope():
+        session = scoped_session()
+        _ = session.query(Foo).all()
+        assert session.in_transaction()
+
+        assert remove_scoped_session(scoped_session)
+
+        assert not session.in_transaction()
+        assert scoped_session() is not session
+        assert remove_scoped_session(scoped_session)
+        assert not remove_scoped_session(scoped_session)
+
+
+def test__remove_scoped_session__reports_uncommitted_changes(
+    scoped_session: ScopedSession, caplog: pytest.LogCaptureFixture
+):
+    with caplog.at_level(logging.WARNING), session_scope("request"):
+        scoped_session().add(Foo(name="foo"))
+
+        _ = remove_scoped_session(scoped_session)
+
+    assert "changes that were not committed" in caplog.text
+    assert "request" in caplog.text
+    with session_scope():
+        assert scoped_session().query(Foo).count() == 0
+
+
+def test__remove_scoped_session__does_not_report_committed_changes(
+    scoped_session: ScopedSession, caplog: pytest.LogCaptureFixture
+):
+    with caplog.at_level(logging.WARNING), session_scope():
+        scoped_session().add(Foo(name="foo"))
+        scoped_session().commit()
+
+        _ = remove_scoped_session(scoped_session)
+
+    assert "not committed" not in caplog.text
+
+
+def test__remove_ended_sessions__closes_and_reports_sessions_of_ended_scopes(
+    scoped_session: ScopedSession, caplog: pytest.LogCaptureFixture
+):
+    with session_scope("leaked"):
+        leaked = scoped_session()
+        _ = leaked.query(Foo).all()
+
+    with session_scope("current"):
+        current = scoped_session()
+        with caplog.at_level(logging.WARNING):
+            assert remove_ended_sessions(scoped_session) == 1
+
+        assert scoped_session() is current
+
+    assert "leaked" in caplog.text
+    assert not leaked.in_transaction()
+
+
+def test__ScopedSessionModule__scopefunc():
+    config = DatabaseConfig(
+        connection_string="sqlite://",
+        connect_args=SQLiteDatabaseConnectArgsConfig(),
+    )
+    injector = Injector([
+        ConfigModule(config, DatabaseConfig),
+        ScopedSessionModule(scopefunc=get_session_scope),
+    ])
+
+    assert is_session_scoped(injector.get(ScopedSession))
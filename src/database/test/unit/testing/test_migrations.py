@@ -0,0 +1,165 @@
+from pathlib import Path
+
+import pytest
+from Ligare.database.testing.migrations import (
+    MigratedDatabaseSnapshot,
+    get_migrations_key,
+    migrate_once,
+    set_up_database_from_snapshot,
+    transactional_database,
+)
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.scoping import ScopedSession
+from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+_ENV = """
+from alembic import context
+
+connection = context.config.attributes["connection"]
+context.configure(connection=connection)
+with context.begin_transaction():
+    context.run_migrations()
+"""
+
+_REVISION = """
+from alembic import op
+
+revision = "0001"
+down_revision = None
+
+
+def upgrade():
+    op.execute("CREATE TABLE foo (foo_id INTEGER PRIMARY KEY, name TEXT)")
+    op.execute("INSERT INTO foo (name) VALUES ('{name}')")
+
+
+def downgrade():
+    op.execute("DROP TABLE foo")
+"""
+
+
+@pytest.fixture()
+def alembic_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project = tmp_path / "project"
+    (project / "migrations" / "versions").mkdir(parents=True)
+    _ = (project / "alembic.ini").write_text(
+        "[alembic]\nscript_location = migrations\n"
+    )
+    _ = (project / "migrations" / "env.py").write_text(_ENV)
+    _ = (project / "migrations" / "versions" / "0001.py").write_text(
+        _REVISION.format(name="migrated")
+    )
+    monkeypatch.chdir(project)
+    return project
+
+
+def _inmemory_engine() -> Engine:
+    return create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+
+def test__get_migrations_key__changes_when_migrations_change(alembic_project: Path):
+    key = get_migrations_key()
+
+    assert get_migrations_key() == key
+    assert get_migrations_key(up_revision="0001") != key
+
+    _ = (alembic_project / "migrations" / "versions" / "0001.py").write_text(
+        _REVISION.format(name="changed")
+    )
+
+    assert get_migrations_key() != key
+
+
+def test__MigratedDatabaseSnapshot__create__migrates_once(
+    alembic_project: Path, tmp_path: Path
+):
+    snapshot = MigratedDatabaseSnapshot.create(tmp_path / "snapshots")
+    modified = snapshot.path.stat().st_mtime_ns
+
+    assert MigratedDatabaseSnapshot.create(tmp_path / "snapshots").path == snapshot.path
+    assert snapshot.path.stat().st_mtime_ns == modified
+    assert [path.name for path in (tmp_path / "snapshots").iterdir()] == [
+        snapshot.path.name
+    ]
+
+
+def test__set_up_database_from_snapshot__restores_in_memory_database(
+    alembic_project: Path, tmp_path: Path
+):
+    snapshot = MigratedDatabaseSnapshot.create(tmp_path / "snapshots")
+    engine = _inmemory_engine()
+
+    with set_up_database_from_snapshot(engine, snapshot) as connection:
+        assert connection.execute(text("SELECT name FROM foo")).scalar() == "migrated"
+        assert (
+            connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+            == "0001"
+        )
+
+
+def test__set_up_database_from_snapshot__restores_each_database_separately(
+    alembic_project: Path, tmp_path: Path
+):
+    snapshot = MigratedDatabaseSnapshot.create(tmp_path / "snapshots")
+    first, second = _inmemory_engine(), _inmemory_engine()
+
+    with set_up_database_from_snapshot(first, snapshot) as connection:
+        _ = connection.execute(text("INSERT INTO foo (name) VALUES ('first')"))
+    with set_up_database_from_snapshot(second, snapshot) as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM foo")).scalar() == 1
+
+
+def test__migrate_once__migrates_a_database_once(alembic_project: Path, tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'database.db'}")
+
+    migrate_once(engine)
+    with engine.begin() as connection:
+        _ = connection.execute(text("INSERT INTO foo (name) VALUES ('kept')"))
+    migrate_once(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM foo")).scalar() == 2
+    engine.dispose()
+
+
+def _begin_pysqlite_transactions(engine: Engine) -> None:
+    # pysqlite does not begin transactions when SQLAlchemy does, so
+    # savepoints do not work unless it is made to. PostgreSQL does not need this.
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):  # pyright: ignore[reportUnusedFunction,reportMissingParameterType,reportUnknownParameterType]
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):  # pyright: ignore[reportUnusedFunction,reportMissingParameterType,reportUnknownParameterType]
+        connection.exec_driver_sql("BEGIN")  # pyright: ignore[reportUnknownMemberType]
+
+
+def test__transactional_database__rolls_back_committed_sessions(
+    alembic_project: Path, tmp_path: Path
+):
+    engine = create_engine(f"sqlite:///{tmp_path / 'database.db'}")
+    _begin_pysqlite_transactions(engine)
+    migrate_once(engine)
+    scoped_session = ScopedSession(sessionmaker(bind=engine))
+
+    with transactional_database(engine, scoped_session):
+        for name in ("first", "second"):
+            session = scoped_session()
+            _ = session.execute(
+                text("INSERT INTO foo (name) VALUES (:name)"), {"name": name}
+            )
+            session.commit()
+        scoped_session.remove()
+
+        assert scoped_session().execute(text("SELECT COUNT(*) FROM foo")).scalar() == 3
+
+    assert scoped_session.session_factory.kw["bind"] is engine
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM foo")).scalar() == 1
+    engine.dispose()
@@ -1,15 +1,16 @@
 from functools import lru_cache
 from pickle import dumps, loads
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Optional, cast
 from urllib.parse import urlparse
 
-import requests
-from Ligare.programming.collections import merge
+from Ligare.programming.collections import merged
 from Ligare.programming.collections.dict import AnyDict
-from requests import Response
-from saml2 import BINDING_HTTP_POST
-from saml2.client import Saml2Client as PySaml2Client
-from saml2.config import Config as PySaml2Config
+
+if TYPE_CHECKING:
+    from requests import Response
+
+# requests and saml2 are imported where they are used so applications
+# importing this module do not pay for them until a SAML2 client is needed.
 
 _SAML2_REQUESTS_TIMEOUT = 10
 
@@ -32,16 +33,22 @@ class SAML2Client:
         else:
             self._metadata_url = metadata
         self._settings = settings
+        self._serialized_settings = dumps(settings)
 
         super().__init__()
 
     @lru_cache
     def _get_saml_client(self, serialized_settings: bytes):
+        from saml2.client import Saml2Client as PySaml2Client
+        from saml2.config import Config as PySaml2Config
+
         override_settings = loads(serialized_settings)
 
         if not self._metadata and self._metadata_url:
+            import requests
+
             rv: Response = cast(
-                Response,
+                "Response",
                 requests.get(self._metadata_url, timeout=_SAML2_REQUESTS_TIMEOUT),
             )  # pyright: ignore[reportUnnecessaryCast]
             self._metadata = rv.text
@@ -63,11 +70,12 @@ class SAML2Client:
         Get an instance of saml2.client.Saml2Client and set the metadata from the IDP.
         Also set any default and overridden settings.
         """
+        # the client is cached on the serialized settings, so
+        # the common case of no overrides serializes nothing
         if not override_settings:
-            override_settings = {}
-
-        settings = merge(self._settings, override_settings)
-        serialized_settings = dumps(settings)
+            serialized_settings = self._serialized_settings
+        else:
+            serialized_settings = dumps(merged(self._settings, override_settings))
 
         saml_client = self._get_saml_client(serialized_settings)
         return saml_client
@@ -93,7 +101,7 @@ class SAML2Client:
             },
         }
 
-        return merge(default_settings, override_settings)
+        return merged(default_settings, override_settings)
 
     def prepare_user_authentication(self, relay_state: Optional[str] = None):
         """
@@ -122,6 +130,8 @@ class SAML2Client:
         """
         Parse a SAML2 request from the IDP and call the `login_callback` with the username and SAML2 AVA.
         """
+        from saml2 import BINDING_HTTP_POST
+
         saml_client = self.get_saml_client()
         authn_response = saml_client.parse_authn_request_response(
             saml_response, BINDING_HTTP_POST
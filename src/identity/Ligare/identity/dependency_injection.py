@@ -5,7 +5,6 @@ from injector import Binder, CallableProvider, Module, inject, singleton
 from Ligare.identity.config import SAML2Config, SSOConfig
 from Ligare.identity.SAML2 import SAML2Client
 from Ligare.programming.collections.dict import AnyDict
-from saml2 import BINDING_HTTP_POST, BINDING_HTTP_REDIRECT
 from typing_extensions import override
 
 
@@ -29,6 +28,7 @@ class SAML2Module(SSOModule):
         Get an instance of the SAML2 manager with ACS URLs.
         This method depends on a currently running Flask application for the use of `url_for`.
         """
+        from saml2 import BINDING_HTTP_POST, BINDING_HTTP_REDIRECT
 
         settings = config.settings
         if not isinstance(settings, SAML2Config):
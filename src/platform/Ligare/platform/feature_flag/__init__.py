@@ -1,6 +1,6 @@
 from .caching_feature_flag_router import CachingFeatureFlagRouter
 from .caching_feature_flag_router import FeatureFlag as CacheFeatureFlag
-from .db_feature_flag_router import DBFeatureFlagRouter
+from .db_feature_flag_router import AsyncDBFeatureFlagRouter, DBFeatureFlagRouter
 from .db_feature_flag_router import FeatureFlag as DBFeatureFlag
 from .decorators import feature_flag
 from .feature_flag_router import FeatureFlag, FeatureFlagChange, FeatureFlagRouter
@@ -9,6 +9,7 @@ __all__ = (
     "FeatureFlagRouter",
     "CachingFeatureFlagRouter",
     "DBFeatureFlagRouter",
+    "AsyncDBFeatureFlagRouter",
     "FeatureFlag",
     "CacheFeatureFlag",
     "DBFeatureFlag",
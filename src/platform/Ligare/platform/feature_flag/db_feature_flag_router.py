@@ -3,10 +3,14 @@ from logging import Logger
 from typing import Protocol, Sequence, TypeVar, cast, overload
 
 from injector import inject
-from sqlalchemy import Boolean, Column, String, Unicode
+from Ligare.database.engine.async_scoping import scoped_async_session
+from Ligare.database.engine.replica import RoutingSession
+from sqlalchemy import Boolean, Column, String, Unicode, bindparam, select
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm.scoping import ScopedSession
+from sqlalchemy.sql.selectable import Select
 from typing_extensions import override
 
 from .caching_feature_flag_router import CachingFeatureFlagRouter
@@ -72,6 +76,29 @@ class FeatureFlagTable:
         return _FeatureFlag
 
 
+class _FeatureFlagStatements:
+    """
+    The statements that query a feature flag table.
+
+    They are built once, and the values they query are bound when they
+    are executed, so SQLAlchemy reuses their compiled SQL from its cache
+    rather than every query being built from scratch.
+    """
+
+    def __init__(self, feature_flag: type[FeatureFlagTableBase[DeclarativeMeta]]):
+        name = cast(Column[String], feature_flag.name)
+        self.feature_flag: Select = select(feature_flag).where(
+            name == bindparam("name")
+        )
+        self.enabled: Select = select(feature_flag.enabled).where(
+            name == bindparam("name")
+        )
+        self.feature_flags: Select = select(feature_flag)
+        self.feature_flags_by_name: Select = select(feature_flag).where(
+            name.in_(bindparam("names", expanding=True))
+        )
+
+
 class DBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
     @inject
     def __init__(
@@ -81,6 +108,7 @@ class DBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
         logger: Logger,
     ) -> None:
         self._feature_flag = feature_flag
+        self._statements = _FeatureFlagStatements(feature_flag)
         self._scoped_session = scoped_session
         super().__init__(logger)
 
@@ -105,10 +133,15 @@ class DBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
 
         feature_flag: FeatureFlagTableBase[DeclarativeMeta]
         with self._scoped_session() as session:
+            # the flag is changed, so it is read from the primary database
+            # rather than a read replica that might not be up to date.
+            if isinstance(session, RoutingSession):
+                session.use_primary()
+
             try:
                 feature_flag = (
-                    session.query(self._feature_flag)
-                    .filter(self._feature_flag.name == name)
+                    session.execute(self._statements.feature_flag, {"name": name})
+                    .scalars()
                     .one()
                 )
             except NoResultFound as e:
@@ -152,19 +185,17 @@ class DBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
             return super().feature_is_enabled(name, default)
 
         with self._scoped_session() as session:
-            feature_flag = (
-                session.query(self._feature_flag)
-                .filter(self._feature_flag.name == name)
-                .one_or_none()
-            )
+            enabled = session.execute(
+                self._statements.enabled, {"name": name}
+            ).one_or_none()
 
-        if feature_flag is None:
+        if enabled is None:
             self._logger.warning(
                 f'Feature flag {name} not found in database. Returning "{default}" by default.'
             )
             return default
 
-        is_enabled = cast(bool, feature_flag.enabled)
+        is_enabled = cast(bool, enabled[0])
 
         _ = super().set_feature_is_enabled(name, is_enabled)
 
@@ -194,16 +225,161 @@ class DBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
         :return tuple[TFeatureFlag]: An immutable sequence (a tuple) of feature flags.
         If `names` is `None` this sequence contains _all_ feature flags in the database. Otherwise, the list is filtered.
         """
-        db_feature_flags: list[FeatureFlagTableBase[DeclarativeMeta]]
         with self._scoped_session() as session:
             if names is None:
-                db_feature_flags = session.query(self._feature_flag).all()
+                result = session.execute(self._statements.feature_flags)
+            else:
+                result = session.execute(
+                    self._statements.feature_flags_by_name, {"names": names}
+                )
+            db_feature_flags: Sequence[FeatureFlagTableBase[DeclarativeMeta]] = (
+                result.scalars().all()
+            )
+
+        feature_flags = tuple(
+            self._create_feature_flag(
+                name=feature_flag.name,
+                enabled=feature_flag.enabled,
+                description=feature_flag.description,
+            )
+            for feature_flag in db_feature_flags
+        )
+
+        # cache the feature flags
+        for feature_flag in feature_flags:
+            _ = super().set_feature_is_enabled(feature_flag.name, feature_flag.enabled)
+
+        return feature_flags
+
+
+class AsyncDBFeatureFlagRouter(CachingFeatureFlagRouter[TFeatureFlag]):
+    """
+    A feature flag router that reads and writes feature flags with an `AsyncSession`.
+
+    The database is only queried by the `*_async` methods. The methods
+    inherited from `CachingFeatureFlagRouter` use the values they cached,
+    so they can still be used where awaiting is not possible.
+    """
+
+    @inject
+    def __init__(
+        self,
+        feature_flag: type[FeatureFlagTableBase[DeclarativeMeta]],
+        async_scoped_session: async_scoped_session,
+        logger: Logger,
+    ) -> None:
+        self._feature_flag = feature_flag
+        self._statements = _FeatureFlagStatements(feature_flag)
+        self._async_scoped_session = async_scoped_session
+        super().__init__(logger)
+
+    async def set_feature_is_enabled_async(
+        self, name: str, is_enabled: bool
+    ) -> FeatureFlagChange:
+        """
+        Enable or disable a feature flag in the database.
+
+        This method caches the value of `is_enabled` for the specified feature flag
+        unless saving to the database fails.
+
+        :param str name: The feature flag to check.
+        :param bool is_enabled: Whether the feature flag is to be enabled or disabled.
+        :return FeatureFlagChange: An object representing the previous and new values of the changed feature flag.
+        """
+        self._validate_name(name)
+
+        async with scoped_async_session(self._async_scoped_session) as session:
+            try:
+                feature_flag = (
+                    (
+                        await session.execute(
+                            self._statements.feature_flag, {"name": name}
+                        )
+                    )
+                    .scalars()
+                    .one()
+                )
+            except NoResultFound as e:
+                raise LookupError(
+                    f"The feature flag `{name}` does not exist. It must be created before being accessed."
+                ) from e
+
+            old_enabled_value = cast(bool | None, feature_flag.enabled)
+            feature_flag.enabled = is_enabled
+            await session.commit()
+        _ = super().set_feature_is_enabled(name, is_enabled)
+
+        return FeatureFlagChange(
+            name=name, old_value=old_enabled_value, new_value=is_enabled
+        )
+
+    async def feature_is_enabled_async(
+        self, name: str, default: bool = False, check_cache: bool = True
+    ) -> bool:
+        """
+        Determine whether a feature flag is enabled or disabled.
+        This method returns `default` if the feature flag does not exist in the database.
+
+        This method caches the value pulled from the database
+        for the specified feature flag. It is only cached if the value is
+        pulled from the database. If the flag does not exist, no value is cached.
+
+        :param str name: The feature flag to check.
+        :param bool default: The default value to return when a flag does not exist.
+        :param bool check_cache: Whether to use the cached value if it is cached. The default is `True`.
+            If the cache is not checked, the new value pulled from the database will be cached.
+        """
+        if check_cache and super().feature_is_cached(name):
+            return super().feature_is_enabled(name, default)
+
+        async with scoped_async_session(self._async_scoped_session) as session:
+            enabled = (
+                await session.execute(self._statements.enabled, {"name": name})
+            ).one_or_none()
+
+        if enabled is None:
+            self._logger.warning(
+                f'Feature flag {name} not found in database. Returning "{default}" by default.'
+            )
+            return default
+
+        is_enabled = cast(bool, enabled[0])
+
+        _ = super().set_feature_is_enabled(name, is_enabled)
+
+        return is_enabled
+
+    @override
+    def _create_feature_flag(
+        self, name: str, enabled: bool, description: str | None = None
+    ) -> TFeatureFlag:
+        parent_feature_flag = super()._create_feature_flag(name, enabled)
+        return cast(
+            TFeatureFlag,
+            FeatureFlag(
+                parent_feature_flag.name, parent_feature_flag.enabled, description
+            ),
+        )
+
+    async def get_feature_flags_async(
+        self, names: list[str] | None = None
+    ) -> Sequence[TFeatureFlag]:
+        """
+        Get all feature flags and their status from the database.
+        This methods updates the cache to the values retrieved from the database.
+
+        :param list[str] | None names: Get only the flags contained in this list.
+        :return tuple[TFeatureFlag]: An immutable sequence (a tuple) of feature flags.
+        If `names` is `None` this sequence contains _all_ feature flags in the database. Otherwise, the list is filtered.
+        """
+        async with scoped_async_session(self._async_scoped_session) as session:
+            if names is None:
+                result = await session.execute(self._statements.feature_flags)
             else:
-                db_feature_flags = (
-                    session.query(self._feature_flag)
-                    .filter(cast(Column[String], self._feature_flag.name).in_(names))
-                    .all()
+                result = await session.execute(
+                    self._statements.feature_flags_by_name, {"names": names}
                 )
+            db_feature_flags = result.scalars().all()
 
         feature_flags = tuple(
             self._create_feature_flag(
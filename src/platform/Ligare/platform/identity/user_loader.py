@@ -1,15 +1,20 @@
 from dataclasses import dataclass
 from enum import Enum
 from logging import Logger
-from typing import Generic, Protocol, Sequence, Type, TypeVar, cast
+from typing import Any, Generic, Protocol, Sequence, Type, TypeVar, cast
 
 from injector import inject
+from Ligare.database.engine.async_scoping import scoped_async_session
+from Ligare.database.engine.replica import RoutingSession
 from Ligare.platform.identity import TMetaBase
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import class_mapper  # pyright: ignore[reportUnknownVariableType]
-from sqlalchemy.orm import ColumnProperty, RelationshipProperty
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, selectinload
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.scoping import ScopedSession
+from sqlalchemy.sql.selectable import Select
 from typing_extensions import override
 
 from . import Role as DbRole
@@ -51,6 +56,12 @@ class UserLoader(Generic[TUserMixin]):
     Class intended for user with FlaskLogin. FlaskLogin is not required.
     """
 
+    # The statements are built the first time they are used, when the tables'
+    # mappers are configured, and the values they query are bound when they
+    # are executed, so SQLAlchemy reuses their compiled SQL from its cache.
+    _user_statement: Select | None = None
+    _role_statement: Select | None = None
+
     @inject
     def __init__(
         self,
@@ -79,6 +90,65 @@ class UserLoader(Generic[TUserMixin]):
         self._log = log
         super().__init__()
 
+    def _get_roles_relationship(self) -> "RelationshipProperty[Any]":
+        """
+        Get the relationship from the `user` table to the `role` table.
+        """
+        user_table_property_mapper = cast(Mapper, class_mapper(self._user_table))
+        user_table_properties = cast(
+            "list[RelationshipProperty[DbRole[DeclarativeMeta]] | ColumnProperty]",
+            user_table_property_mapper.iterate_properties,  # pyright: ignore[reportUnknownMemberType]
+        )
+        # We find this by matching on the `role` table relationship
+        # from the `user` table.
+        return next(
+            cast("RelationshipProperty[Any]", relationship)
+            for relationship in user_table_properties
+            if (entity := getattr(relationship, "entity", None))
+            and entity.class_ == self._role_table
+        )
+
+    def _get_user_statement(self) -> Select:
+        """
+        Get the statement that selects the user named by the `username` parameter.
+        """
+        if self._user_statement is None:
+            # SQLAlchemy generates invalid SQL when attempting an implicit
+            # LEFT JOIN between user -> user_role and user_role -> role.
+            # As such, we handle the join explicitly by extracting the property
+            # relationships and referencing the relevant columns.
+            # Only extract the secondary join table (user_role).
+            user_role_table = self._get_roles_relationship().secondary
+
+            self._user_statement = (
+                select(self._user_table)
+                # These two `outerjoin` calls define the explicit
+                # join conditions between the `user` and `role` tables,
+                # and the secondary join table `user_role`.
+                .outerjoin(
+                    user_role_table,
+                    user_role_table.c.user_id == self._user_table.user_id,
+                )
+                .outerjoin(
+                    self._role_table,
+                    user_role_table.c.role_id == self._role_table.role_id,
+                )
+                .where(self._user_table.username == bindparam("username"))
+            )
+
+        return self._user_statement
+
+    def _get_role_statement(self) -> Select:
+        """
+        Get the statement that selects the role named by the `role_name` parameter.
+        """
+        if self._role_statement is None:
+            self._role_statement = select(self._role_table).where(
+                self._role_table.role_name == bindparam("role_name")
+            )
+
+        return self._role_statement
+
     def user_loader(
         self, username: str, default_role: Enum | None, create_if_new_user: bool = False
     ) -> None | TUserMixin:
@@ -99,43 +169,31 @@ class UserLoader(Generic[TUserMixin]):
 
         with self._scoped_session() as session:
             try:
-                # SQLAlchemy generates invalid SQL when attempting an implicit
-                # LEFT JOIN between user -> user_role and user_role -> role.
-                # As such, we handle the join explicitly by extracting the property
-                # relationships and referencing the relevant columns.
-                user_table_property_mapper = cast(
-                    Mapper, class_mapper(self._user_table)
-                )
-                user_table_properties = cast(
-                    "list[RelationshipProperty[DbRole[DeclarativeMeta]] | ColumnProperty]",
-                    user_table_property_mapper.iterate_properties,  # pyright: ignore[reportUnknownMemberType]
-                )
-                # Only extract the secondary join table (user_role).
-                # We find this by matching on the `role` table relationship
-                # from the `user` table.
-                user_role_table = next(
-                    relationship.secondary
-                    for relationship in user_table_properties
-                    if (entity := getattr(relationship, "entity", None))
-                    and entity.class_ == self._role_table
-                )
-
-                user = (
-                    session.query(self._user_table)
-                    # These two `outerjoin` calls define the explicit
-                    # join conditions between the `user` and `role` tables,
-                    # and the secondary join table `user_role`.
-                    .outerjoin(
-                        user_role_table,
-                        user_role_table.c.user_id == self._user_table.user_id,
+                user_statement = self._get_user_statement()
+
+                def query_user() -> Any:
+                    # the user is joined with each of its roles, so the rows are made
+                    # unique, as ORM queries did for a single entity.
+                    return (
+                        session.execute(user_statement, {"username": username})
+                        .scalars()
+                        .unique()
+                        .one_or_none()
                     )
-                    .outerjoin(
-                        self._role_table,
-                        user_role_table.c.role_id == self._role_table.role_id,
-                    )
-                    .filter(self._user_table.username == username)
-                    .one_or_none()
-                )
+
+                user = query_user()
+
+                # A read replica might not have a user that was
+                # just created, so check the primary database
+                # before creating the user again.
+                if (
+                    create_if_new_user
+                    and user is None
+                    and isinstance(session, RoutingSession)
+                    and not session.reads_from_primary
+                ):
+                    session.use_primary()
+                    user = query_user()
 
                 self._log.debug(f'Queried for "{username}" in database')
 
@@ -148,8 +206,11 @@ class UserLoader(Generic[TUserMixin]):
                         user = self._user_table(username=username)
                     else:
                         role = (
-                            session.query(self._role_table)
-                            .filter(self._role_table.role_name == default_role.name)
+                            session.execute(
+                                self._get_role_statement(),
+                                {"role_name": default_role.name},
+                            )
+                            .scalars()
                             .one()
                         )
 
@@ -191,3 +252,152 @@ class UserLoader(Generic[TUserMixin]):
                     f'Error when loading user "{username}" from the database.'
                 )
                 raise
+
+
+class AsyncUserLoader(UserLoader[TUserMixin]):
+    """
+    A `UserLoader` that loads users with an `AsyncSession`.
+    """
+
+    @inject
+    def __init__(  # pyright: ignore[reportMissingSuperCall]
+        self,
+        loader: type[TUserMixin],
+        roles: Type[Enum],
+        user_table: Type[DbUser[TMetaBase]],
+        role_table: Type[DbRole[TMetaBase]],
+        async_scoped_session: async_scoped_session,
+        log: Logger,
+    ) -> None:
+        """
+        Load and optionally create a user.
+
+        :param Callable[[UserId, list[Enum]], None] loader: A callback that receives the create user information including its roles.
+        :param Type[Enum] roles: An enum representing possible roles for a user.
+        :param Type[DbUser] user_table: The SQLAlchemy table type for a user.
+        :param Type[DbRole] role_table: The SQLAlchemy table type for a role.
+        :param async_scoped_session async_scoped_session: The SQLAlchemy async connection scope.
+        :param Logger log: A Logger instance.
+        """
+        self._loader = loader
+        self._roles = roles
+        self._user_table = user_table
+        self._role_table = role_table
+        self._async_scoped_session = async_scoped_session
+        self._log = log
+
+    @override
+    async def user_loader(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, username: str, default_role: Enum | None, create_if_new_user: bool = False
+    ) -> None | TUserMixin:
+        """
+        Load a user and its roles from the database.
+
+        :param str username: The users username.
+        :param Enum default_role: The default role assigned to the user when `create_if_new_user` is true and the user does not already exist.
+        :param bool create_if_new_user: Create the user in the database if it does not already exist, defaults to False.
+
+        :raises AssertionError: If a user is loaded from the database, but it is not of the type specified by user_table.
+        """
+        self._log.debug(f'Loading user "{username}"')
+
+        if not username:
+            self._log.warning("`username` is empty. Skipping load.")
+            return
+
+        async with scoped_async_session(self._async_scoped_session) as session:
+            try:
+                user = (
+                    (
+                        await session.execute(
+                            self._get_user_statement(), {"username": username}
+                        )
+                    )
+                    .scalars()
+                    .one_or_none()
+                )
+
+                self._log.debug(f'Queried for "{username}" in database')
+
+                if create_if_new_user and user is None:
+                    self._log.info(
+                        f'User "{username}" does not already exist in the database'
+                    )
+
+                    if default_role is None:
+                        user = self._user_table(username=username, roles=[])
+                    else:
+                        role = (
+                            (
+                                await session.execute(
+                                    self._get_role_statement(),
+                                    {"role_name": default_role.name},
+                                )
+                            )
+                            .scalars()
+                            .one()
+                        )
+
+                        user = self._user_table(username=username, roles=[role])
+
+                    session.add(user)
+                    # the user's values are read before committing,
+                    # because committing expires them, and they
+                    # cannot be loaded again without awaiting.
+                    await session.flush()
+                    loaded_user = self._load_user(user)
+                    await session.commit()
+
+                    self._log.info(f'User "{username}" added to the database')
+                    return loaded_user
+                elif user is None:
+                    self._log.info(
+                        "Username does not exist. Refusing to create a new user. This happens when a username (likely from a cookie)\
+        cannot be found in the database, and the process should not create a new user."
+                    )
+                    return
+                else:
+                    self._log.debug(f'User "{username}" loaded from the database')
+
+                return self._load_user(user)
+            except:
+                self._log.exception(
+                    f'Error when loading user "{username}" from the database.'
+                )
+                raise
+
+    @override
+    def _get_user_statement(self) -> Select:
+        if self._user_statement is None:
+            # AsyncSession cannot lazy load relationships,
+            # so the roles are loaded with the user.
+            roles_attribute = getattr(
+                self._user_table, self._get_roles_relationship().key
+            )
+            self._user_statement = (
+                select(self._user_table)
+                .options(selectinload(roles_attribute))
+                .where(self._user_table.username == bindparam("username"))
+            )
+
+        return self._user_statement
+
+    def _load_user(self, user: Any) -> TUserMixin:
+        if not isinstance(user, self._user_table):
+            raise AssertionError(
+                f"User object queried from database is unexpected type `{type(user)}`. Expected type `{type(self._user_table)}`."
+            )
+
+        user_roles = dict(self._roles.__members__.items())
+        roles = cast(
+            Sequence[Role],
+            [user_roles[user_role.role_name] for user_role in user.roles],
+        )
+
+        return self._loader(
+            UserId(
+                user_id=user.user_id,
+                username=user.username,
+            ),
+            roles,
+        )
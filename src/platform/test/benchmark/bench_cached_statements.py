@@ -0,0 +1,158 @@
+"""
+Compare the per-call overhead of building the user and feature flag queries
+on every call, as `UserLoader` and `DBFeatureFlagRouter` did, with executing
+the statements they now build once.
+
+Run with `python src/platform/test/benchmark/bench_cached_statements.py`.
+"""
+
+import logging
+import time
+from typing import Any, Callable
+
+from Ligare.database.engine.sqlite import SQLiteScopedSession
+from Ligare.platform.feature_flag.db_feature_flag_router import (
+    DBFeatureFlagRouter,
+    FeatureFlag,
+    FeatureFlagTable,
+)
+from Ligare.platform.identity import RoleTable, UserRoleTable, UserTable
+from Ligare.platform.identity.user_loader import Role, UserId, UserLoader, UserMixin
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+FeatureFlagTableBase = FeatureFlagTable(Base)  # pyright: ignore[reportArgumentType]
+RoleTableBase = RoleTable(Base)  # pyright: ignore[reportArgumentType]
+UserTableBase = UserTable(Base)  # pyright: ignore[reportArgumentType]
+UserRoleTableBase = UserRoleTable(Base)  # pyright: ignore[reportArgumentType]
+
+LOOKUPS = 5_000
+
+
+class BenchmarkRole(Role):
+    User = "User"
+
+
+class User(UserMixin[Role]):
+    def __init__(self, id: UserId, roles: Any = None) -> None:
+        self.id = id
+        self._roles = roles or []
+
+    @property
+    def roles(self) -> Any:
+        return self._roles
+
+
+def run(name: str, lookup: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        lookup()
+    microseconds = (time.perf_counter() - start) / LOOKUPS * 1_000_000
+    print(f"    {name:<40}{microseconds:10.1f} us/lookup")
+    return microseconds
+
+
+def main() -> None:
+    log = logging.getLogger(__name__)
+    log.addHandler(logging.NullHandler())
+    log.propagate = False
+
+    scoped_session = SQLiteScopedSession.create(
+        "sqlite:///:memory:?check_same_thread=False"
+    )
+    Base.metadata.create_all(scoped_session.bind)  # pyright: ignore[reportUnknownMemberType,reportArgumentType]
+    with scoped_session() as session:
+        session.add(FeatureFlagTableBase(name="flag", description=""))  # pyright: ignore[reportCallIssue]
+        session.add(
+            UserTableBase(  # pyright: ignore[reportCallIssue]
+                username="user",
+                roles=[RoleTableBase(role_name=BenchmarkRole.User.name)],  # pyright: ignore[reportCallIssue]
+            )
+        )
+        session.commit()
+
+    router = DBFeatureFlagRouter[FeatureFlag](
+        FeatureFlagTableBase,  # pyright: ignore[reportArgumentType]
+        scoped_session,
+        log,
+    )
+    user_loader = UserLoader[User](
+        User,
+        BenchmarkRole,
+        UserTableBase,  # pyright: ignore[reportArgumentType]
+        RoleTableBase,  # pyright: ignore[reportArgumentType]
+        scoped_session,
+        log,
+    )
+
+    def query_feature_flag() -> Any:
+        with scoped_session() as session:
+            return (
+                session
+                .query(FeatureFlagTableBase)
+                .filter(FeatureFlagTableBase.name == "flag")
+                .one_or_none()
+            )
+
+    def execute_feature_flag() -> Any:
+        with scoped_session() as session:
+            return session.execute(
+                router._statements.enabled,  # pyright: ignore[reportPrivateUsage]
+                {"name": "flag"},
+            ).one_or_none()
+
+    def query_user() -> Any:
+        user_role_table = UserRoleTableBase.__table__  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType,reportUnknownVariableType]
+        with scoped_session() as session:
+            return (
+                session
+                .query(UserTableBase)
+                .outerjoin(
+                    user_role_table,
+                    user_role_table.c.user_id == UserTableBase.user_id,  # pyright: ignore[reportUnknownMemberType]
+                )
+                .outerjoin(
+                    RoleTableBase,
+                    user_role_table.c.role_id == RoleTableBase.role_id,  # pyright: ignore[reportUnknownMemberType]
+                )
+                .filter(UserTableBase.username == "user")
+                .one_or_none()
+            )
+
+    def execute_user() -> Any:
+        with scoped_session() as session:
+            return (
+                session
+                .execute(
+                    user_loader._get_user_statement(),  # pyright: ignore[reportPrivateUsage]
+                    {"username": "user"},
+                )
+                .scalars()
+                .unique()
+                .one_or_none()
+            )
+
+    for name, built, cached in (
+        ("feature flag", query_feature_flag, execute_feature_flag),
+        ("user", query_user, execute_user),
+    ):
+        # warm SQLAlchemy's compiled statement cache
+        built()
+        cached()
+        print(name)
+        before = run("query built on every call", built)
+        after = run("statement built once", cached)
+        print(f"    {'reduction':<40}{(1 - after / before) * 100:10.1f} %")
+
+    print("end to end")
+    _ = run(
+        "DBFeatureFlagRouter.feature_is_enabled",
+        lambda: router.feature_is_enabled("flag", check_cache=False),
+    )
+    _ = run("UserLoader.user_loader", lambda: user_loader.user_loader("user", None))
+
+    scoped_session.bind.dispose()  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue,reportUnknownMemberType]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Compare feature flag and user lookups against an SQLite database file,
+with and without the `performance` SQLite profile, from several threads.
+
+Run with `python src/platform/test/benchmark/bench_sqlite_lookups.py`.
+"""
+
+import logging
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from Ligare.database.config import (
+    DatabasePoolConfig,
+    SQLiteDatabaseConnectArgsConfig,
+    SQLitePerformanceConfig,
+)
+from Ligare.database.engine.sqlite import SQLiteScopedSession
+from Ligare.platform.feature_flag.db_feature_flag_router import (
+    DBFeatureFlagRouter,
+    FeatureFlag,
+    FeatureFlagTable,
+)
+from Ligare.platform.identity import RoleTable, UserRoleTable, UserTable
+from Ligare.platform.identity.user_loader import Role, UserId, UserLoader, UserMixin
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+FeatureFlagTableBase = FeatureFlagTable(Base)  # pyright: ignore[reportArgumentType]
+RoleTableBase = RoleTable(Base)  # pyright: ignore[reportArgumentType]
+UserTableBase = UserTable(Base)  # pyright: ignore[reportArgumentType]
+_ = UserRoleTable(Base)  # pyright: ignore[reportArgumentType]
+
+FLAGS = 100
+USERS = 100
+LOOKUPS = 2_000
+THREADS = (1, 4, 16)
+
+
+class BenchmarkRole(Role):
+    User = "User"
+
+
+class User(UserMixin[Role]):
+    def __init__(self, id: UserId, roles: Sequence[Role] | None = None) -> None:
+        self.id = id
+        self._roles = roles or []
+
+    @property
+    def roles(self) -> Sequence[Role]:
+        return self._roles
+
+
+def create_database(filename: Path, profile: str) -> SQLiteScopedSession:
+    scoped_session = SQLiteScopedSession.create(
+        f"sqlite:///{filename}",
+        connect_args=SQLiteDatabaseConnectArgsConfig(
+            performance=SQLitePerformanceConfig(profile=profile)  # pyright: ignore[reportArgumentType]
+        ),
+        pool=DatabasePoolConfig(size=max(THREADS)),
+    )
+
+    with scoped_session() as session:
+        Base.metadata.create_all(session.bind)  # pyright: ignore[reportUnknownMemberType,reportArgumentType]
+        session.add(RoleTableBase(role_name=BenchmarkRole.User.name))  # pyright: ignore[reportCallIssue]
+        session.add_all([
+            FeatureFlagTableBase(name=f"flag{i}", description="")  # pyright: ignore[reportCallIssue]
+            for i in range(FLAGS)
+        ])
+        session.add_all([
+            UserTableBase(username=f"user{i}")  # pyright: ignore[reportCallIssue]
+            for i in range(USERS)
+        ])
+        session.commit()
+
+    return scoped_session
+
+
+def run(name: str, lookup: Callable[[int], Any], threads: int) -> None:
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        for _ in executor.map(lookup, range(LOOKUPS)):
+            pass
+        seconds = time.perf_counter() - start
+    print(f"    {name:<40}{LOOKUPS / seconds:10.0f} lookups/s")
+
+
+def main() -> None:
+    log = logging.getLogger(__name__)
+    log.addHandler(logging.NullHandler())
+    log.propagate = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in ("default", "performance"):
+            scoped_session = create_database(Path(directory, f"{profile}.db"), profile)
+            router = DBFeatureFlagRouter[FeatureFlag](
+                FeatureFlagTableBase,  # pyright: ignore[reportArgumentType]
+                scoped_session,
+                log,
+            )
+            user_loader = UserLoader[User](
+                User,
+                BenchmarkRole,
+                UserTableBase,  # pyright: ignore[reportArgumentType]
+                RoleTableBase,  # pyright: ignore[reportArgumentType]
+                scoped_session,
+                log,
+            )
+
+            print(f"{profile} profile")
+            for threads in THREADS:
+                run(
+                    f"feature flags, {threads} threads",
+                    lambda i: router.feature_is_enabled(
+                        f"flag{i % FLAGS}", check_cache=False
+                    ),
+                    threads,
+                )
+                run(
+                    f"users, {threads} threads",
+                    lambda i: user_loader.user_loader(f"user{i % USERS}", None),
+                    threads,
+                )
+
+            scoped_session.bind.dispose()  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue,reportUnknownMemberType]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
+import asyncio
 import logging
 from typing import Any, Tuple
 
 import pytest
 from Ligare.database.config import DatabaseConfig
 from Ligare.database.dependency_injection import ScopedSessionModule
+from Ligare.database.engine.async_scoping import scoped_async_session
 from Ligare.platform.feature_flag.db_feature_flag_router import (
+    AsyncDBFeatureFlagRouter,
     DBFeatureFlagRouter,
     FeatureFlag,
     FeatureFlagTable,
@@ -12,6 +15,7 @@ from Ligare.platform.feature_flag.db_feature_flag_router import (
 from Ligare.programming.dependency_injection import ConfigModule
 from mock import MagicMock
 from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio.scoping import async_scoped_session
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 from sqlalchemy.orm.scoping import ScopedSession
 from sqlalchemy.orm.session import Session
@@ -178,8 +182,8 @@ def test__set_feature_is_enabled__sets_correct_value(
 @pytest.mark.parametrize("enable", [True, False])
 def test__set_feature_is_enabled__caches_flags(enable: bool, mocker: MockerFixture):
     session_mock = mocker.patch("sqlalchemy.orm.session.Session")
-    session_query_mock = mocker.patch("sqlalchemy.orm.session.Session.query")
-    session_mock.query = session_query_mock
+    session_execute_mock = mocker.patch("sqlalchemy.orm.session.Session.execute")
+    session_mock.execute = session_execute_mock
     scoped_session_mock = get_scoped_session_mock(session_mock)
 
     logger = logging.getLogger(_FEATURE_FLAG_LOGGER_NAME)
@@ -193,7 +197,7 @@ def test__set_feature_is_enabled__caches_flags(enable: bool, mocker: MockerFixtu
     _ = db_feature_flag_router.feature_is_enabled(_FEATURE_FLAG_TEST_NAME)
     _ = db_feature_flag_router.feature_is_enabled(_FEATURE_FLAG_TEST_NAME)
 
-    assert session_query_mock.call_count == 1
+    assert session_execute_mock.call_count == 1
 
 
 @pytest.mark.parametrize("check_cache", [(True, 1), (False, 0)])
@@ -256,8 +260,8 @@ def test__set_feature_is_enabled__resets_cache_when_flag_enable_is_set(
     enable: bool, mocker: MockerFixture
 ):
     session_mock = mocker.patch("sqlalchemy.orm.session.Session")
-    session_query_mock = mocker.patch("sqlalchemy.orm.session.Session.query")
-    session_mock.query = session_query_mock
+    session_execute_mock = mocker.patch("sqlalchemy.orm.session.Session.execute")
+    session_mock.execute = session_execute_mock
     scoped_session_mock = get_scoped_session_mock(session_mock)
 
     logger = logging.getLogger(_FEATURE_FLAG_LOGGER_NAME)
@@ -277,7 +281,7 @@ def test__set_feature_is_enabled__resets_cache_when_flag_enable_is_set(
     _ = db_feature_flag_router.feature_is_enabled(_FEATURE_FLAG_TEST_NAME)
     second_value = db_feature_flag_router.feature_is_enabled(_FEATURE_FLAG_TEST_NAME)
 
-    assert session_query_mock.call_count == 2
+    assert session_execute_mock.call_count == 2
     assert first_value == enable
     assert second_value == (not enable)
 
@@ -506,3 +510,119 @@ def test__get_feature_flags__caches_all_existing_flags_when_queried(
     assert cache_mock.call_count == len(added_flags)
     for flag_name, enabled in added_flags.items():
         assert call_args_dict[flag_name] == enabled
+
+
+@pytest.fixture()
+def async_db_feature_flag_router() -> AsyncDBFeatureFlagRouter[FeatureFlag]:
+    from injector import Injector
+
+    injector = Injector([
+        ConfigModule(inmemory_database_config(), DatabaseConfig),
+        ScopedSessionModule(bases=[PlatformBase]),  # pyright: ignore[reportArgumentType]
+    ])
+
+    async_session = injector.get(async_scoped_session)
+
+    async def create_feature_flags():
+        async with async_session.bind.begin() as connection:  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue,reportOptionalMemberAccess]
+            await connection.run_sync(PlatformBase.metadata.create_all)  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+        async with scoped_async_session(async_session) as session:
+            session.add(
+                FeatureFlagTableBase(  # pyright: ignore[reportCallIssue]
+                    name=_FEATURE_FLAG_TEST_NAME,
+                    description=_FEATURE_FLAG_TEST_DESCRIPTION,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(create_feature_flags())
+
+    logger = logging.getLogger(_FEATURE_FLAG_LOGGER_NAME)
+    return AsyncDBFeatureFlagRouter[FeatureFlag](
+        FeatureFlagTableBase,  # pyright: ignore[reportArgumentType]
+        async_session,
+        logger,
+    )
+
+
+@pytest.mark.parametrize("enable", [True, False])
+def test__set_feature_is_enabled_async__sets_correct_value(
+    enable: bool,
+    async_db_feature_flag_router: AsyncDBFeatureFlagRouter[FeatureFlag],
+):
+    async def set_feature_is_enabled():
+        change = await async_db_feature_flag_router.set_feature_is_enabled_async(
+            _FEATURE_FLAG_TEST_NAME, enable
+        )
+        is_enabled = await async_db_feature_flag_router.feature_is_enabled_async(
+            _FEATURE_FLAG_TEST_NAME, check_cache=False
+        )
+        return change, is_enabled
+
+    change, is_enabled = asyncio.run(set_feature_is_enabled())
+
+    assert change.old_value is False
+    assert change.new_value == enable
+    assert is_enabled == enable
+    # the inherited method uses the cached value
+    assert (
+        async_db_feature_flag_router.feature_is_enabled(_FEATURE_FLAG_TEST_NAME)
+        == enable
+    )
+
+
+def test__set_feature_is_enabled_async__fails_when_flag_does_not_exist(
+    async_db_feature_flag_router: AsyncDBFeatureFlagRouter[FeatureFlag],
+):
+    with pytest.raises(LookupError):
+        _ = asyncio.run(
+            async_db_feature_flag_router.set_feature_is_enabled_async("bar", True)
+        )
+
+
+@pytest.mark.parametrize("default", [True, False])
+def test__feature_is_enabled_async__uses_default_when_flag_does_not_exist(
+    default: bool,
+    async_db_feature_flag_router: AsyncDBFeatureFlagRouter[FeatureFlag],
+):
+    is_enabled = asyncio.run(
+        async_db_feature_flag_router.feature_is_enabled_async("bar", default)
+    )
+
+    assert is_enabled == default
+    assert not async_db_feature_flag_router.feature_is_cached("bar")
+
+
+def test__get_feature_flags_async__returns_and_caches_flags(
+    async_db_feature_flag_router: AsyncDBFeatureFlagRouter[FeatureFlag],
+):
+    feature_flags = asyncio.run(
+        async_db_feature_flag_router.get_feature_flags_async([_FEATURE_FLAG_TEST_NAME])
+    )
+
+    assert feature_flags == (
+        FeatureFlag(_FEATURE_FLAG_TEST_NAME, False, _FEATURE_FLAG_TEST_DESCRIPTION),
+    )
+    assert async_db_feature_flag_router.feature_is_cached(_FEATURE_FLAG_TEST_NAME)
+
+
+def test__AsyncDBFeatureFlagRouter__removes_sessions_of_finished_tasks(
+    async_db_feature_flag_router: AsyncDBFeatureFlagRouter[FeatureFlag],
+):
+    async def use_feature_flags():
+        _ = await async_db_feature_flag_router.set_feature_is_enabled_async(
+            _FEATURE_FLAG_TEST_NAME, True
+        )
+        _ = await async_db_feature_flag_router.feature_is_enabled_async(
+            _FEATURE_FLAG_TEST_NAME, check_cache=False
+        )
+        _ = await async_db_feature_flag_router.get_feature_flags_async()
+
+    async def use_feature_flags_in_tasks():
+        for _ in range(10):
+            await asyncio.create_task(use_feature_flags())
+
+    asyncio.run(use_feature_flags_in_tasks())
+
+    async_session = async_db_feature_flag_router._async_scoped_session  # pyright: ignore[reportPrivateUsage]
+    assert not async_session.registry.registry  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
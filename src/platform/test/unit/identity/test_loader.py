@@ -1,17 +1,28 @@
+import asyncio
+import logging
+from pathlib import Path
 from typing import Sequence
 
 from injector import Injector
+from Ligare.database.config import DatabaseReplicaConfig
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.async_scoping import scoped_async_session
+from Ligare.database.engine.async_sqlite import AsyncSQLiteScopedSession
 from Ligare.platform.dependency_injection import UserLoaderModule
 from Ligare.platform.identity import Role as DbRole
+from Ligare.platform.identity import RoleTable
 from Ligare.platform.identity import User as DbUser
+from Ligare.platform.identity import UserRoleTable, UserTable
 from Ligare.platform.identity.user_loader import (
+    AsyncUserLoader,
     Role,
     TRole,
     UserId,
     UserLoader,
     UserMixin,
 )
-from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy import create_engine
+from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 from typing_extensions import override
 
 
@@ -40,3 +51,169 @@ def test__UserLoaderModule__uses_application_loader_mixin():
     user_loader = injector.get(UserLoader[UserMixin[Role]])
 
     assert user_loader._loader is UM  # pyright: ignore[reportPrivateUsage]
+
+
+class _AsyncUser(UserMixin[Role]):
+    def __init__(self, id: UserId, roles: Sequence[Role] | None = None) -> None:
+        self.id = id
+        self._roles = roles or []
+
+    @property
+    @override
+    def roles(self) -> Sequence[Role]:
+        return self._roles
+
+
+class _AsyncRole(Role):
+    Administrator = "Administrator"
+    Operator = "Operator"
+
+
+def _get_async_user_loader() -> AsyncUserLoader[_AsyncUser]:
+    Base = declarative_base()
+    role_table = RoleTable(Base)  # pyright: ignore[reportArgumentType]
+    user_table = UserTable(Base)  # pyright: ignore[reportArgumentType]
+    _ = UserRoleTable(Base)  # pyright: ignore[reportArgumentType]
+
+    scoped_session = AsyncSQLiteScopedSession.create("sqlite:///:memory:")
+
+    async def create_roles():
+        async with scoped_session.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+        async with scoped_async_session(scoped_session) as session:
+            session.add_all([
+                role_table(role_name=role.name)  # pyright: ignore[reportCallIssue]
+                for role in _AsyncRole
+            ])
+            await session.commit()
+
+    asyncio.run(create_roles())
+
+    return AsyncUserLoader[_AsyncUser](
+        loader=_AsyncUser,
+        roles=_AsyncRole,
+        user_table=user_table,
+        role_table=role_table,
+        async_scoped_session=scoped_session,
+        log=logging.getLogger(),
+    )
+
+
+def test__AsyncUserLoader__user_loader__creates_new_user_with_default_role():
+    user_loader = _get_async_user_loader()
+
+    async def load_user():
+        created_user = await user_loader.user_loader(
+            "foo", _AsyncRole.Operator, create_if_new_user=True
+        )
+        loaded_user = await user_loader.user_loader("foo", None)
+        return created_user, loaded_user
+
+    created_user, loaded_user = asyncio.run(load_user())
+
+    assert created_user is not None and loaded_user is not None
+    assert created_user.id == loaded_user.id
+    assert created_user.id.username == "foo"
+    assert loaded_user.roles == [_AsyncRole.Operator]
+
+
+def test__AsyncUserLoader__user_loader__does_not_create_user_unless_requested():
+    user_loader = _get_async_user_loader()
+
+    assert asyncio.run(user_loader.user_loader("foo", _AsyncRole.Operator)) is None
+
+
+def test__AsyncUserLoader__user_loader__removes_sessions_of_finished_tasks():
+    user_loader = _get_async_user_loader()
+
+    async def load_users():
+        # each user is loaded by its own task, as each request is
+        for i in range(10):
+            _ = await asyncio.create_task(
+                user_loader.user_loader(f"foo{i}", _AsyncRole.Operator, True)
+            )
+
+    asyncio.run(load_users())
+
+    scoped_session = user_loader._async_scoped_session  # pyright: ignore[reportPrivateUsage]
+    assert not scoped_session.registry.registry  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+
+
+def test__UserLoader__user_loader__does_not_recreate_user_missing_from_replica(
+    tmp_path: Path,
+):
+    Base = declarative_base()
+    role_table = RoleTable(Base)  # pyright: ignore[reportArgumentType]
+    user_table = UserTable(Base)  # pyright: ignore[reportArgumentType]
+    _ = UserRoleTable(Base)  # pyright: ignore[reportArgumentType]
+
+    primary, replica = (
+        f"sqlite:///{tmp_path / name}" for name in ("primary.db", "replica.db")
+    )
+    for connection_string in (primary, replica):
+        engine = create_engine(connection_string)
+        Base.metadata.create_all(engine)  # pyright: ignore[reportUnknownMemberType]
+        engine.dispose()
+
+    scoped_session = DatabaseEngine.get_session_from_connection_string(
+        primary,
+        registry=None,
+        replicas=DatabaseReplicaConfig(connection_strings=[replica]),
+    )
+    user_loader = UserLoader[_AsyncUser](
+        loader=_AsyncUser,
+        roles=_AsyncRole,
+        user_table=user_table,
+        role_table=role_table,
+        scoped_session=scoped_session,
+        log=logging.getLogger(),
+    )
+
+    created_user = user_loader.user_loader("foo", None, create_if_new_user=True)
+    # the user is only in the primary database, so loading it again
+    # would fail the unique constraint if the user were created again.
+    loaded_user = user_loader.user_loader("foo", None, create_if_new_user=True)
+
+    assert created_user is not None and loaded_user is not None
+    assert created_user.id == loaded_user.id
+
+
+def test__UserLoader__user_loader__loads_user_with_many_roles_and_reuses_its_statement():
+    Base = declarative_base()
+    role_table = RoleTable(Base)  # pyright: ignore[reportArgumentType]
+    user_table = UserTable(Base)  # pyright: ignore[reportArgumentType]
+    _ = UserRoleTable(Base)  # pyright: ignore[reportArgumentType]
+
+    scoped_session = DatabaseEngine.get_session_from_connection_string(
+        "sqlite:///:memory:?check_same_thread=False"
+    )
+    Base.metadata.create_all(scoped_session.bind)  # pyright: ignore[reportUnknownMemberType,reportArgumentType]
+    with scoped_session() as session:
+        session.add(
+            user_table(  # pyright: ignore[reportCallIssue]
+                username="foo",
+                roles=[
+                    role_table(role_name=role.name)  # pyright: ignore[reportCallIssue]
+                    for role in _AsyncRole
+                ],
+            )
+        )
+        session.commit()
+
+    user_loader = UserLoader[_AsyncUser](
+        loader=_AsyncUser,
+        roles=_AsyncRole,
+        user_table=user_table,
+        role_table=role_table,
+        scoped_session=scoped_session,
+        log=logging.getLogger(),
+    )
+
+    user = user_loader.user_loader("foo", None)
+    statement = user_loader._user_statement  # pyright: ignore[reportPrivateUsage]
+    _ = user_loader.user_loader("foo", None)
+
+    assert user is not None
+    assert sorted(user.roles, key=str) == sorted(_AsyncRole, key=str)
+    assert statement is not None
+    assert user_loader._user_statement is statement  # pyright: ignore[reportPrivateUsage]
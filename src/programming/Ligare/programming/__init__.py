@@ -4,3 +4,10 @@ and augmenting the stdlib.
 """
 
 __version__: str = "0.7.1"
+
+from importlib import import_module as _import_module
+from os import environ as _environ
+
+if _environ.get("LIGARE_STARTUP_TRACE"):
+    # start timing imports as early as possible. see `Ligare.programming.startup`.
+    _ = _import_module(f"{__name__}.startup")
@@ -12,6 +12,7 @@ from typing import (
     Callable,
     Generator,
     Generic,
+    Iterable,
     Protocol,
     TypeVar,
     cast,
@@ -25,16 +26,19 @@ from Ligare.programming.config import (
     Config,
     ConfigBuilder,
     TConfig,
+    TomlParser,
     load_config,
 )
 from Ligare.programming.config.exceptions import ConfigBuilderStateError
-from Ligare.programming.dependency_injection import ConfigModule
+from Ligare.programming.config.reload import ConfigReloader
+from Ligare.programming.dependency_injection import ConfigModule, ReloadableConfigModule
 from Ligare.programming.exception import BuilderBuildError, InvalidBuilderStateError
 from Ligare.programming.patterns.dependency_injection import (
     BatchModule,
     ConfigurableModule,
     LoggerModule,
 )
+from Ligare.programming.startup import get_startup_tracer, trace_phase, traced
 from typing_extensions import Self, override
 
 _ligare_aws_is_installed = importlib.util.find_spec("Ligare.AWS")
@@ -224,6 +228,9 @@ class ApplicationConfigBuilder(Generic[TConfig]):
         self._config_filename: str = ApplicationConfigBuilder._DEFAULT_CONFIG_FILENAME
         self._use_filename: bool = False
         self._use_ssm: bool = False
+        self._toml_parser: TomlParser = "toml"
+        self._use_config_cache: bool = False
+        self._reloadable_sections: frozenset[str] | None = None
 
     def with_config_builder(self, config_builder: ConfigBuilder[TConfig]) -> Self:
         """
@@ -294,6 +301,51 @@ class ApplicationConfigBuilder(Generic[TConfig]):
         self._use_filename = True
         return self
 
+    def with_toml_parser(self, toml_parser: TomlParser) -> Self:
+        """
+        The package used to parse the TOML file configured with `with_config_filename`.
+
+        :param TomlParser toml_parser: One of "toml" (the default), "tomllib", or "rtoml".
+        :return Self:
+        """
+        self._toml_parser = toml_parser
+        return self
+
+    def enable_config_cache(self, value: bool) -> Self:
+        """
+        Reuse the parsed TOML file in later builds in the same process while
+        the file and the value overrides are unchanged.
+
+        :param bool value: Whether to cache the parsed TOML file
+        :return Self:
+        """
+        self._use_config_cache = value
+        return self
+
+    def with_reloadable_sections(self, sections: Iterable[str] | None) -> Self:
+        """
+        Allow the configuration to be reloaded while the application is running.
+
+        The application's configuration bindings then resolve to the current
+        configuration of a `ConfigReloader`, which is also bound, and which
+        rejects reloads that change any top-level section not in `sections`.
+        Use `ConfigWatcher` to reload when the configuration file changes.
+
+        :param Iterable[str] | None sections: The names of the top-level sections,
+            like "logging", that may change when reloading. If `None`, reloading is disabled.
+        :return Self:
+        """
+        self._reloadable_sections = None if sections is None else frozenset(sections)
+        return self
+
+    @property
+    def reloadable_sections(self) -> frozenset[str] | None:
+        """
+        The sections configured with `with_reloadable_sections`,
+        or `None` if reloading is disabled.
+        """
+        return self._reloadable_sections
+
     def enable_ssm(self, value: bool) -> Self:
         """
         Try to load configuration values from AWS SSM. If `use_filename` was
@@ -322,7 +374,8 @@ class ApplicationConfigBuilder(Generic[TConfig]):
             )
 
         try:
-            config_type = self._config_builder.build()
+            with trace_phase("ConfigBuilder.build"):
+                config_type = self._config_builder.build()
         except ConfigBuilderStateError as e:
             raise BuilderBuildError(
                 f"A root config must be specified using `{ApplicationConfigBuilder[TConfig].with_root_config_type.__name__}`, `{ApplicationConfigBuilder[TConfig].with_config_type.__name__}`, or `{ApplicationConfigBuilder[TConfig].with_config_types.__name__}` before calling `{ApplicationConfigBuilder[TConfig].build.__name__}`."
@@ -334,7 +387,8 @@ class ApplicationConfigBuilder(Generic[TConfig]):
             try:
                 # requires that aws-ssm.ini exists and is correctly configured
                 ssm_parameters = SSMParameters()  # pyright: ignore[reportPossiblyUnboundVariable] This is guarded by _ligare_aws_is_installed
-                full_config = ssm_parameters.load_config(config_type)
+                with trace_phase("SSMParameters.load_config"):
+                    full_config = ssm_parameters.load_config(config_type)
 
                 if not self._use_filename and full_config is None:
                     raise BuilderBuildError(SSM_FAIL_ERROR_MSG)
@@ -345,12 +399,14 @@ class ApplicationConfigBuilder(Generic[TConfig]):
                     raise BuilderBuildError(SSM_FAIL_ERROR_MSG) from e
 
         if self._use_filename and full_config is None:
-            if self._config_value_overrides:
+            with trace_phase("load_config"):
                 full_config = load_config(
-                    config_type, self._config_filename, self._config_value_overrides
+                    config_type,
+                    self._config_filename,
+                    self._config_value_overrides or None,
+                    toml_parser=self._toml_parser,
+                    cache=self._use_config_cache,
                 )
-            else:
-                full_config = load_config(config_type, self._config_filename)
 
         # `full_config` is not `None` by this point because the builder
         # ensures one of either `_use_ssm` or `_use_file` is true, and
@@ -404,6 +460,7 @@ class ApplicationBuilder(Generic[TApp]):
         self._exec = exec
         self._modules: list[Module | type[Module]] = []
         self._config_overrides: dict[str, Any] = {}
+        self._config_reloader: ConfigReloader[AbstractConfig] | None = None
 
     _APPLICATION_CONFIG_BUILDER_PROPERTY_NAME: str = "__application_config_builder"
 
@@ -519,7 +576,8 @@ class ApplicationBuilder(Generic[TApp]):
 
     def _build_config(self) -> AbstractConfig:
         try:
-            config = self._application_config_builder.build()
+            with trace_phase("ApplicationConfigBuilder.build"):
+                config = self._application_config_builder.build()
         except InvalidBuilderStateError as e:
             raise BuilderBuildError(
                 f"`{ApplicationBuilder[TApp].__name__}` failed to build the application configuration because the `{ApplicationConfigBuilder[AbstractConfig].__name__}` instance was improperly configured. \
@@ -539,6 +597,11 @@ Review the exception raised from `{ApplicationConfigBuilder[AbstractConfig].__na
         return config
 
     def _register_config_modules(self, config: AbstractConfig):
+        reloadable_sections = self._application_config_builder.reloadable_sections
+        if reloadable_sections is not None:
+            self._register_reloadable_config_modules(config, reloadable_sections)
+            return
+
         config_generator = cast(
             Generator[tuple[str, AbstractConfig], None, None], config
         )
@@ -556,15 +619,53 @@ Review the exception raised from `{ApplicationConfigBuilder[AbstractConfig].__na
 
         _ = self.with_modules(cast(list[Module | type[Module]], config_modules))
 
+    def _register_reloadable_config_modules(
+        self, config: AbstractConfig, reloadable_sections: frozenset[str]
+    ):
+        # the same bindings as `_register_config_modules`, but resolved
+        # from the reloader's current config every time they are injected.
+        reloader = ConfigReloader[AbstractConfig](
+            config, self._application_config_builder.build, reloadable_sections
+        )
+        self._config_reloader = reloader
+
+        config_generator = cast(
+            Generator[tuple[str, AbstractConfig], None, None], config
+        )
+        config_modules = (
+            [
+                ReloadableConfigModule(reloader, type(section), name)
+                for (name, section) in config_generator
+            ]
+            + [ReloadableConfigModule(reloader, Config)]
+            + [ReloadableConfigModule(reloader, config.__class__.__bases__[0])]
+        )
+
+        _ = self.with_modules(cast(list[Module | type[Module]], config_modules))
+
     def _build_application_modules(self) -> list[Module | type[Module]]:
         application_modules = self._modules if self._modules else []
 
-        return [
+        modules = [
             (module if isinstance(module, Module) else module())
             for module in (application_modules if application_modules else [])
         ]
 
+        if get_startup_tracer() is not None:
+            for module in modules:
+                # Injector calls `configure` through `Module.__call__`,
+                # so the instance attribute takes precedence.
+                module.configure = traced(  # pyright: ignore[reportAttributeAccessIssue]
+                    f"{type(module).__name__}.configure", module.configure
+                )
+
+        return modules
+
     def build(self) -> CreateAppResultProtocol[TApp]:
+        with trace_phase("ApplicationBuilder.build"):
+            return self._build()
+
+    def _build(self) -> CreateAppResultProtocol[TApp]:
         if not self._app_module_set:
             _ = self.with_module(AppModule(self._exec, None))
 
@@ -578,7 +679,8 @@ Review the exception raised from `{ApplicationConfigBuilder[AbstractConfig].__na
 
         modules = self._build_application_modules()
 
-        injector = Injector(modules)
+        with trace_phase("Injector"):
+            injector = Injector(modules)
 
         app = cast(TApp, injector.get(ApplicationBase))
         return CreateAppResult[TApp](app=app, injector=injector)
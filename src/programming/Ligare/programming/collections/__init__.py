@@ -2,6 +2,6 @@
 Libraries for working with collections.
 """
 
-from .dict import merge
+from .dict import PersistentDict, merge, merged
 
-__all__ = ("merge",)
+__all__ = ("merge", "merged", "PersistentDict")
@@ -4,8 +4,11 @@ Libraries for working with dictionaries.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any, TypeVar, Union
 
+from typing_extensions import final, override
+
 AnyDict = dict[Any, Union[Any, "AnyDict"]]
 TKey = TypeVar("TKey")
 TValue = TypeVar("TValue")
@@ -16,19 +19,165 @@ def merge(a: AnyDict, b: AnyDict, skip_existing: bool = False):
     """
     Recursively merge values from `b` into `a`
 
+    `a`, and any dictionaries nested in it that `b` also has, are changed in place.
+    Use `merged` to leave `a` unchanged.
+
     skip_existing: If true, any keys in `b` that already exist in `a` will not be merged.
         This applies recursively. Keys in nested dictionaries will be merged, but any existing keys will not be overwritten.
     """
-    for key in b:
-        a_val = a.get(key)
-        b_val = b.get(key)
-        if isinstance(a_val, dict) and isinstance(b_val, dict):
-            result = merge(a_val, b_val, skip_existing)  # pyright: ignore[reportUnknownArgumentType]
-            if skip_existing and a_val:
-                continue
-            a[key] = {**a_val, **result}
-        else:
-            if skip_existing and a_val:
-                continue
-            a[key] = b_val
+    # nested dictionaries are merged from a stack
+    # rather than by recursion, so deeply nested
+    # dictionaries do not cost a call per level
+    stack: list[tuple[AnyDict, AnyDict]] = [(a, b)]
+    while stack:
+        a_dict, b_dict = stack.pop()
+        for key, b_val in b_dict.items():
+            a_val = a_dict.get(key)
+            if isinstance(a_val, dict) and isinstance(b_val, dict):
+                stack.append((a_val, b_val))  # pyright: ignore[reportUnknownArgumentType]
+            elif not (skip_existing and a_val):
+                a_dict[key] = b_val
     return a
+
+
+def merged(a: Mapping[Any, Any], b: Mapping[Any, Any]) -> AnyDict:
+    """
+    Recursively merge values from `b` into a new dictionary with the values of `a`.
+
+    Neither `a` nor `b` is changed. Only the dictionaries in `a` that `b` has
+    values for are copied; every other value of the result, including nested
+    dictionaries, is shared with `a` or `b`. Do not change the result's nested
+    dictionaries in place without copying them first.
+
+    :param Mapping[Any, Any] a: The values to merge into.
+    :param Mapping[Any, Any] b: The values that replace those in `a`.
+    :return AnyDict: A new dictionary.
+    """
+    result = dict(a)
+    stack: list[tuple[AnyDict, Mapping[Any, Any]]] = [(result, b)]
+    while stack:
+        result_dict, b_dict = stack.pop()
+        for key, b_val in b_dict.items():
+            a_val = result_dict.get(key)
+            # checking for `dict` first skips the slower
+            # `Mapping` check for the common case
+            if (type(a_val) is dict or isinstance(a_val, Mapping)) and (
+                type(b_val) is dict or isinstance(b_val, Mapping)
+            ):
+                result_dict[key] = copy = dict(a_val)  # pyright: ignore[reportUnknownArgumentType]
+                stack.append((copy, b_val))  # pyright: ignore[reportUnknownArgumentType]
+            else:
+                result_dict[key] = b_val
+    return result
+
+
+@final
+class PersistentDict(Mapping[Any, Any]):
+    """
+    An immutable, nested mapping.
+
+    Changes are made by creating new `PersistentDict` instances with
+    `merge` or `set`. Those share every nested `PersistentDict` they do not
+    change with the original, so creating them only copies the mappings
+    along the paths that changed.
+
+    Dictionaries nested in the values are converted to `PersistentDict`.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Mapping[Any, Any] | None = None) -> None:
+        super().__init__()
+        self._data: dict[Any, Any] = {}
+        self._hash: int | None = None
+        if data:
+            for key, value in data.items():
+                self._data[key] = PersistentDict._freeze(value)
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        if isinstance(value, dict):
+            return PersistentDict(value)  # pyright: ignore[reportUnknownArgumentType]
+        return value
+
+    @staticmethod
+    def _from_frozen(data: dict[Any, Any]) -> PersistentDict:
+        # `data` values are already frozen
+        instance = object.__new__(PersistentDict)
+        instance._data = data
+        instance._hash = None
+        return instance
+
+    @override
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentDict):
+            return self._data == other._data
+        return isinstance(other, Mapping) and self._data == dict(other)  # pyright: ignore[reportUnknownArgumentType]
+
+    @override
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def set(self, key: Any, value: Any) -> PersistentDict:
+        """
+        Create a `PersistentDict` with `key` set to `value`.
+
+        :param Any key:
+        :param Any value:
+        :return PersistentDict:
+        """
+        data = dict(self._data)
+        data[key] = PersistentDict._freeze(value)
+        return PersistentDict._from_frozen(data)
+
+    def merge(self, other: Mapping[Any, Any]) -> PersistentDict:
+        """
+        Create a `PersistentDict` with the values of `other` recursively merged into it.
+
+        :param Mapping[Any, Any] other:
+        :return PersistentDict:
+        """
+        if not other:
+            return self
+
+        data = dict(self._data)
+        for key, value in other.items():
+            existing = data.get(key)
+            if isinstance(existing, PersistentDict) and isinstance(value, Mapping):
+                data[key] = existing.merge(value)  # pyright: ignore[reportUnknownArgumentType]
+            else:
+                data[key] = PersistentDict._freeze(value)
+        return PersistentDict._from_frozen(data)
+
+    def to_dict(self) -> AnyDict:
+        """
+        Create a mutable copy with nested `PersistentDict` values converted to dictionaries.
+
+        :return AnyDict:
+        """
+        return {
+            key: value.to_dict() if isinstance(value, PersistentDict) else value
+            for key, value in self._data.items()
+        }
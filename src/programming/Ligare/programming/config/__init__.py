@@ -4,8 +4,11 @@
 """
 
 import abc
+import hashlib
+import json
+import sys
 from pathlib import Path
-from typing import Any, Generic, TypeVar, cast
+from typing import Any, Generic, Literal, TypeVar, cast
 
 import toml
 from Ligare.programming.collections.dict import AnyDict, merge
@@ -38,8 +41,25 @@ class Config(AbstractConfig):
 
 TConfig = TypeVar("TConfig", bound=AbstractConfig)
 
+TomlParser = Literal["toml", "tomllib", "rtoml"]
+"""
+The package used to parse TOML files.
+
+`toml` is the default. `tomllib` is faster, and is part of the standard
+library from Python 3.11; on Python 3.10 the `tomli` package, which
+`tomllib` was added from, is used instead. `rtoml` must be installed
+separately and is faster still.
+Both only accept valid TOML 1.0, which `toml` is more lenient about.
+"""
+
 from collections import deque
 
+# `create_model` is slow, and applications and tests build
+# the same config types from the same config classes repeatedly.
+_generated_config_types: dict[
+    tuple[type[AbstractConfig], tuple[type[AbstractConfig], ...]], type[Any]
+] = {}
+
 
 class ConfigBuilder(Generic[TConfig]):
     _root_config: type[TConfig] | None = None
@@ -97,10 +117,12 @@ class ConfigBuilder(Generic[TConfig]):
         :return type[TConfig]: The TConfig type, including any pluggable config types
         """
         if self._root_config and not self._configs:
-            _new_type = cast(
-                "type[TConfig]", type("GeneratedConfig", (self._root_config,), {})
-            )
-            return _new_type
+            key = (self._root_config, ())
+            if (generated_type := _generated_config_types.get(key)) is None:
+                generated_type = _generated_config_types[key] = type(
+                    "GeneratedConfig", (self._root_config,), {}
+                )
+            return cast("type[TConfig]", generated_type)
 
         if not self._configs:
             raise ConfigBuilderStateError(
@@ -113,15 +135,18 @@ class ConfigBuilder(Generic[TConfig]):
                     f"Class name '{config_type.__name__}' is not a valid config class. The name must end with 'Config'"
                 )
 
-        _new_type_base = (
-            self._root_config if self._root_config else self._configs.popleft()
-        )
+        configs = list(self._configs)
+        _new_type_base = self._root_config if self._root_config else configs.pop(0)
+
+        key = (_new_type_base, tuple(configs))
+        if (generated_type := _generated_config_types.get(key)) is not None:
+            return cast(type[TConfig], generated_type)
 
         test_type_name(_new_type_base)
 
         annotations: dict[str, Any] = {}
 
-        for config in self._configs:
+        for config in configs:
             test_type_name(config)
 
             config_name = config.__name__[: config.__name__.rindex("Config")].lower()
@@ -135,26 +160,99 @@ class ConfigBuilder(Generic[TConfig]):
             **annotations,
         )
 
+        _generated_config_types[key] = generated_model
         return cast(type[TConfig], generated_model)
 
 
+# parsed TOML documents, with overrides applied, keyed
+# on the parser, the file's hash, and the overrides.
+_config_dict_cache: dict[tuple[str, str, str], AnyDict] = {}
+
+
+def _parse_toml(content: str, toml_parser: TomlParser) -> AnyDict:
+    if toml_parser == "tomllib":
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
+        return tomllib.loads(content)
+    if toml_parser == "rtoml":
+        import rtoml  # pyright: ignore[reportMissingImports]
+
+        return cast(AnyDict, rtoml.loads(content))  # pyright: ignore[reportUnknownMemberType]
+    return toml.loads(content)
+
+
+def _load_toml(toml_file_path: str | Path, toml_parser: TomlParser) -> AnyDict:
+    if toml_parser == "toml":
+        return toml.load(toml_file_path)
+    with open(toml_file_path, "r", encoding="utf-8") as file:
+        return _parse_toml(file.read(), toml_parser)
+
+
+def _load_cached_toml(
+    toml_file_path: str | Path,
+    config_overrides: AnyDict | None,
+    toml_parser: TomlParser,
+) -> AnyDict:
+    with open(toml_file_path, "rb") as file:
+        content = file.read()
+
+    key = (
+        toml_parser,
+        hashlib.sha256(content).hexdigest(),
+        json.dumps(config_overrides, sort_keys=True, default=repr),
+    )
+    if (config_dict := _config_dict_cache.get(key)) is None:
+        config_dict = _parse_toml(content.decode("utf-8"), toml_parser)
+        if config_overrides is not None:
+            config_dict = merge(config_dict, config_overrides)
+        _config_dict_cache[key] = config_dict
+
+    return config_dict
+
+
+def clear_config_cache() -> None:
+    """
+    Clear the TOML documents cached by `load_config(..., cache=True)`.
+    """
+    _config_dict_cache.clear()
+
+
 def load_config(
     config_type: type[TConfig],
     toml_file_path: str | Path,
     config_overrides: AnyDict | None = None,
+    *,
+    toml_parser: TomlParser = "toml",
+    cache: bool = False,
 ) -> TConfig:
     """
     Load configuration data from a TOML file into a TConfig object instance
 
     `config_type.post_load` is called on the root config type _only_.
 
+    With `cache`, the parsed TOML file, with overrides applied, is kept in memory
+    and reused while the file's contents and the overrides are unchanged. A new
+    TConfig instance is still validated from it and `post_load` is still called,
+    because validating is faster than copying an already validated instance.
+
     :param type[TConfig] config_type: The configuration type that is instantiated and hydrated with data from the TOML file.
     :param str | Path toml_file_path: The path to the TOML file to load.
     :param AnyDict | None config_overrides: Explicit data used to override any data in the TOML file, defaults to None
+    :param TomlParser toml_parser: The package used to parse the TOML file, defaults to "toml"
+    :param bool cache: Whether to reuse the parsed TOML file, defaults to False
     :return TConfig: The hydrated configuration object
     """
     try:
-        config_dict: dict[str, Any] = toml.load(toml_file_path)
+        if cache:
+            config_dict = _load_cached_toml(
+                toml_file_path, config_overrides, toml_parser
+            )
+            config_overrides = None
+        else:
+            config_dict = _load_toml(toml_file_path, toml_parser)
     except FileNotFoundError as e:
         full_path = Path(toml_file_path).resolve()
         raise ConfigInvalidError(
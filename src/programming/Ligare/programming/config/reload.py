@@ -0,0 +1,216 @@
+"""
+Reloading configuration while an application is running.
+
+A :class:`ConfigReloader` holds the current configuration. Reloading
+loads and validates a new configuration, and if only sections declared
+as reloadable changed, replaces the current configuration with it in
+a single assignment. Code that reads `ConfigReloader.config` for every
+use, like the Injector providers `ApplicationBuilder` binds when reloading
+is enabled, sees either the old or the new configuration, never a mix.
+
+A :class:`ConfigWatcher` reloads when the configuration file changes,
+or when the process receives `SIGHUP`.
+"""
+
+import logging
+import os
+import signal
+import threading
+from typing import Any, Callable, Generic, Iterable
+
+from typing_extensions import final
+
+from . import TConfig
+
+ConfigReloadCallback = Callable[[TConfig, TConfig], Any]
+
+
+@final
+class ConfigReloader(Generic[TConfig]):
+    """
+    Holds the current configuration and replaces it when reloaded.
+    """
+
+    def __init__(
+        self,
+        config: TConfig,
+        load: Callable[[], TConfig],
+        reloadable_sections: Iterable[str],
+    ) -> None:
+        """
+        :param TConfig config: The current configuration.
+        :param Callable[[], TConfig] load: Loads and validates a new configuration.
+        :param Iterable[str] reloadable_sections: The names of the top-level configuration
+            sections that may change when reloading, like "logging". A reload that changes
+            any other section is rejected, because the application has already used
+            those values in a way that cannot change while it is running.
+        """
+        super().__init__()
+        self._config = config
+        self._load = load
+        self.reloadable_sections = frozenset(reloadable_sections)
+        self._callbacks: list[ConfigReloadCallback[TConfig]] = []
+        self._lock = threading.Lock()
+        self._log = logging.getLogger(__name__)
+
+    @property
+    def config(self) -> TConfig:
+        """
+        The current configuration.
+        """
+        return self._config
+
+    def subscribe(self, callback: ConfigReloadCallback[TConfig]) -> None:
+        """
+        Call `callback` with the old and new configuration after each successful reload.
+
+        :param ConfigReloadCallback[TConfig] callback:
+        """
+        self._callbacks.append(callback)
+
+    def changed_sections(self, old: TConfig, new: TConfig) -> set[str]:
+        """
+        Get the names of the top-level sections that differ between two configurations.
+
+        :param TConfig old:
+        :param TConfig new:
+        :return set[str]:
+        """
+        return {
+            name
+            for name in type(old).model_fields
+            if getattr(old, name, None) != getattr(new, name, None)
+        }
+
+    def reload(self) -> bool:
+        """
+        Load a new configuration and make it the current configuration.
+
+        The current configuration is kept if the new configuration fails to load,
+        fails to validate, changes sections that are not reloadable, or is unchanged.
+
+        :return bool: Whether the current configuration was replaced.
+        """
+        with self._lock:
+            old = self._config
+            try:
+                new = self._load()
+            except Exception as e:
+                self._log.error(
+                    "Failed to reload the configuration. The current configuration is kept.",
+                    exc_info=e,
+                )
+                return False
+
+            changed = self.changed_sections(old, new)
+            if not changed:
+                return False
+
+            if not_reloadable := changed - self.reloadable_sections:
+                self._log.warning(
+                    f"The configuration was not reloaded because these sections changed and are not reloadable: {', '.join(sorted(not_reloadable))}. Restart the application to apply them."
+                )
+                return False
+
+            self._config = new
+
+        self._log.info(
+            f"Reloaded the configuration. Changed sections: {', '.join(sorted(changed))}."
+        )
+        for callback in self._callbacks:
+            try:
+                callback(old, new)
+            except Exception as e:
+                self._log.error("A configuration reload callback failed.", exc_info=e)
+        return True
+
+
+@final
+class ConfigWatcher:
+    """
+    Reloads a :class:`ConfigReloader` from a background thread when the
+    configuration file changes or the process receives `SIGHUP`.
+
+    Threads do not survive `fork`, so when workers are forked from a
+    preloaded application, start the watcher in each worker.
+    """
+
+    def __init__(
+        self,
+        reloader: ConfigReloader[Any],
+        filename: str | os.PathLike[str] | None = None,
+        poll_interval: float = 5.0,
+        reload_on_sighup: bool = False,
+    ) -> None:
+        """
+        :param ConfigReloader[Any] reloader: The reloader to reload.
+        :param str | os.PathLike[str] | None filename: The configuration file whose
+            modification time is polled. If `None`, the file is not polled.
+        :param float poll_interval: Seconds between checks of the file.
+        :param bool reload_on_sighup: Whether to reload when the process receives
+            `SIGHUP`. This replaces any other `SIGHUP` handler, and requires
+            `start` to be called from the main thread.
+        """
+        super().__init__()
+        self._reloader = reloader
+        self._filename = filename
+        self._poll_interval = poll_interval
+        self._reload_on_sighup = reload_on_sighup
+        self._reload_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._mtime_ns = self._get_mtime_ns()
+
+    def _get_mtime_ns(self) -> int | None:
+        if self._filename is None:
+            return None
+        try:
+            return os.stat(self._filename).st_mtime_ns
+        except OSError:
+            return None
+
+    def request_reload(self) -> None:
+        """
+        Reload on the watcher thread as soon as possible.
+        """
+        self._reload_requested.set()
+
+    def start(self) -> None:
+        """
+        Start watching.
+        """
+        if self._thread is not None:
+            return
+
+        if self._reload_on_sighup:
+            _ = signal.signal(signal.SIGHUP, lambda *_: self.request_reload())
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ConfigWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching and wait for the watcher thread to end.
+        """
+        self._stopped.set()
+        self._reload_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            requested = self._reload_requested.wait(
+                self._poll_interval if self._filename is not None else None
+            )
+            if self._stopped.is_set():
+                return
+            self._reload_requested.clear()
+
+            mtime_ns = self._get_mtime_ns()
+            if requested or mtime_ns != self._mtime_ns:
+                self._mtime_ns = mtime_ns
+                _ = self._reloader.reload()
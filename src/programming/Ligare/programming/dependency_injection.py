@@ -2,8 +2,11 @@
 `Injector <https://pypi.org/project/injector/>`_ dependency injection modules for :ref:`Ligare.programming.config`.
 """
 
-from injector import Binder, Module
+from typing import Any
+
+from injector import Binder, CallableProvider, Module
 from Ligare.programming.config import AbstractConfig
+from Ligare.programming.config.reload import ConfigReloader
 from typing_extensions import override
 
 
@@ -18,3 +21,41 @@ class ConfigModule(Module):
     @override
     def configure(self, binder: Binder) -> None:
         binder.bind(self._interface, to=self._config)
+
+
+class ReloadableConfigModule(ConfigModule):
+    """
+    Binds a configuration, or one of its sections, so that every
+    injection gets the current configuration of a :class:`ConfigReloader`.
+    The reloader itself is also bound.
+    """
+
+    def __init__(
+        self,
+        reloader: ConfigReloader[Any],
+        interface: type[AbstractConfig] = AbstractConfig,
+        section_name: str | None = None,
+    ) -> None:
+        """
+        :param ConfigReloader[Any] reloader:
+        :param type[AbstractConfig] interface: The type to bind.
+        :param str | None section_name: The name of the section of the configuration to bind.
+            If `None`, the whole configuration is bound.
+        """
+        config = reloader.config
+        super().__init__(
+            config if section_name is None else getattr(config, section_name),
+            interface,
+        )
+        self._reloader = reloader
+        self._section_name = section_name
+
+    def _get_config(self) -> AbstractConfig:
+        if self._section_name is None:
+            return self._reloader.config
+        return getattr(self._reloader.config, self._section_name)
+
+    @override
+    def configure(self, binder: Binder) -> None:
+        binder.bind(ConfigReloader, to=self._reloader)
+        binder.bind(self._interface, to=CallableProvider(self._get_config))
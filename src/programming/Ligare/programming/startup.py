@@ -0,0 +1,266 @@
+"""
+An opt-in tracer for application startup.
+
+When enabled, the tracer records the wall time of each startup phase
+of `ApplicationBuilder.build`, like building the configuration or
+configuring each Injector module, and the time taken to import each
+`Ligare` module. The result is written as a
+`Chrome trace event <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_
+file when the outermost phase ends, which can be viewed as a flame graph
+in Perfetto, speedscope, or `chrome://tracing`.
+
+Set the `LIGARE_STARTUP_TRACE` environment variable to the report filename
+to trace startup, including the import of `Ligare` modules that happen
+before the application is built. Alternatively, call
+:func:`enable_startup_trace` to trace from that point on.
+
+Imports that happened before tracing was enabled are not recorded.
+`python -X importtime` covers those.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any, Callable, Generator, Sequence, TypeVar, cast
+
+from typing_extensions import final, override
+
+STARTUP_TRACE_ENV_VAR = "LIGARE_STARTUP_TRACE"
+_TRACED_IMPORT_PREFIX = "Ligare."
+
+TCallable = TypeVar("TCallable", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class TraceSpan:
+    """
+    A timed phase or import.
+    """
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    depth: int
+
+
+@final
+class StartupTracer:
+    """
+    Records nested, timed spans and writes them as a trace event file.
+    """
+
+    def __init__(self, filename: str) -> None:
+        super().__init__()
+        self.filename = filename
+        self.spans: list[TraceSpan] = []
+        self._origin_ns = perf_counter_ns()
+        self._depth = 0
+        self._thread_id = threading.get_ident()
+        self._log = logging.getLogger(__name__)
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase") -> Generator[None, None, None]:
+        """
+        Time the body of the `with` statement.
+
+        Spans started from threads other than the one that enabled
+        the tracer are not recorded.
+
+        :param str name: The name of the phase.
+        :param str category: The kind of span, e.g. "phase" or "import".
+        """
+        if threading.get_ident() != self._thread_id:
+            yield
+            return
+
+        depth = self._depth
+        self._depth += 1
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.spans.append(
+                TraceSpan(
+                    name,
+                    category,
+                    start - self._origin_ns,
+                    perf_counter_ns() - start,
+                    depth,
+                )
+            )
+            if depth == 0 and category == "phase":
+                self.write_report()
+
+    def to_trace_events(self) -> dict[str, Any]:
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": os.getpid(),
+                    "tid": self._thread_id,
+                }
+                for span in sorted(self.spans, key=lambda span: span.start_ns)
+            ],
+        }
+
+    def write_report(self) -> None:
+        """
+        Write all recorded spans to `filename` and log the slowest phases.
+        """
+        with open(self.filename, "w", encoding="utf-8") as file:
+            json.dump(self.to_trace_events(), file)
+
+        phases = sorted(
+            (span for span in self.spans if span.category == "phase"),
+            key=lambda span: span.duration_ns,
+            reverse=True,
+        )
+        self._log.info(
+            "Startup trace written to %s. Slowest phases:\n%s",
+            self.filename,
+            "\n".join(
+                f"  {span.duration_ns / 1_000_000:10.2f} ms  {span.name}"
+                for span in phases[:10]
+            ),
+        )
+
+
+@final
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader, tracer: StartupTracer) -> None:
+        super().__init__()
+        self._loader = loader
+        self._tracer = tracer
+
+    def __getattr__(self, name: str) -> Any:
+        # loaders also provide resource and source access
+        return getattr(self._loader, name)
+
+    @override
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    @override
+    def exec_module(self, module: ModuleType) -> None:
+        with self._tracer.span(module.__name__, "import"):
+            self._loader.exec_module(module)
+
+
+@final
+class _ImportTimer(MetaPathFinder):
+    def __init__(self, tracer: StartupTracer) -> None:
+        super().__init__()
+        self._tracer = tracer
+
+    @override
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if not fullname.startswith(_TRACED_IMPORT_PREFIX):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._tracer)
+            return spec
+
+        return None
+
+
+_tracer: StartupTracer | None = None
+_import_timer: _ImportTimer | None = None
+
+
+def enable_startup_trace(filename: str) -> StartupTracer:
+    """
+    Start tracing startup phases and `Ligare` imports.
+
+    :param str filename: The trace event file written when the outermost phase ends.
+    :return StartupTracer:
+    """
+    global _tracer, _import_timer
+    disable_startup_trace()
+    _tracer = StartupTracer(filename)
+    _import_timer = _ImportTimer(_tracer)
+    sys.meta_path.insert(0, _import_timer)
+    return _tracer
+
+
+def disable_startup_trace() -> None:
+    """
+    Stop tracing. The report is not written.
+    """
+    global _tracer, _import_timer
+    if _import_timer is not None and _import_timer in sys.meta_path:
+        sys.meta_path.remove(_import_timer)
+    _tracer = None
+    _import_timer = None
+
+
+def get_startup_tracer() -> StartupTracer | None:
+    """
+    Get the enabled tracer, or None if startup is not being traced.
+    """
+    return _tracer
+
+
+_NO_TRACE: AbstractContextManager[None] = nullcontext()
+
+
+def trace_phase(name: str) -> AbstractContextManager[None]:
+    """
+    Time a startup phase if startup is being traced.
+
+    :param str name: The name of the phase.
+    :return AbstractContextManager[None]:
+    """
+    tracer = _tracer
+    return _NO_TRACE if tracer is None else tracer.span(name)
+
+
+def traced(name: str, method: TCallable) -> TCallable:
+    """
+    Wrap `method` so each call is traced as a startup phase.
+    If startup is not being traced, `method` is returned unchanged.
+
+    :param str name: The name of the phase.
+    :param TCallable method: The callable to trace.
+    :return TCallable:
+    """
+    if _tracer is None:
+        return method
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with trace_phase(name):
+            return method(*args, **kwargs)
+
+    return cast(TCallable, wrapper)
+
+
+if filename := os.environ.get(STARTUP_TRACE_ENV_VAR):
+    _ = enable_startup_trace(filename)
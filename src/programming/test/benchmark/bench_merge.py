@@ -0,0 +1,89 @@
+"""
+Compare the dictionary merge implementations on deep and wide dictionaries.
+
+Run with `python src/programming/test/benchmark/bench_merge.py`.
+"""
+
+import copy
+import timeit
+from typing import Any, Callable
+
+from Ligare.programming.collections.dict import PersistentDict, merge, merged
+
+
+def recursive_merge(a: Any, b: Any, skip_existing: bool = False):
+    # the recursive implementation `merge` replaced
+    for key in b:
+        a_val = a.get(key)
+        b_val = b.get(key)
+        if isinstance(a_val, dict) and isinstance(b_val, dict):
+            result = recursive_merge(a_val, b_val, skip_existing)
+            if skip_existing and a_val:
+                continue
+            a[key] = {**a_val, **result}
+        else:
+            if skip_existing and a_val:
+                continue
+            a[key] = b_val
+    return a
+
+
+def deep(depth: int, leaf: Any) -> dict[str, Any]:
+    root: dict[str, Any] = {}
+    level = root
+    for i in range(depth):
+        level[f"key{i}"] = i
+        level["nested"] = level = {}
+    level["leaf"] = leaf
+    return root
+
+
+def wide(width: int, nested_width: int) -> dict[str, Any]:
+    return {
+        f"section{i}": {f"key{j}": j for j in range(nested_width)} for i in range(width)
+    }
+
+
+CASES = {
+    "deep (depth 200, override the leaf)": (deep(200, 1), deep(200, 2)),
+    "wide (500 x 20, override one section)": (
+        wide(500, 20),
+        {"section250": {"key10": -1}},
+    ),
+    "config-sized (10 x 10, override 3 sections)": (
+        wide(10, 10),
+        {f"section{i}": {"key0": -1} for i in range(3)},
+    ),
+}
+
+
+def run(name: str, function: Callable[[Any], Any], a: Any, number: int) -> None:
+    # `merge` and `recursive_merge` change `a`, so every call
+    # gets its own copy, made before timing starts
+    best = float("inf")
+    for _ in range(5):
+        copies = iter([copy.deepcopy(a) for _ in range(number)])
+        seconds = timeit.timeit(lambda: function(next(copies)), number=number)
+        best = min(best, seconds / number)
+    print(f"    {name:<32}{best * 1_000_000:10.2f} us")
+
+
+def main() -> None:
+    for case, (a, b) in CASES.items():
+        print(case)
+        number = 200
+        persistent = PersistentDict(a)
+        run("recursive merge (previous)", lambda a: recursive_merge(a, b), a, number)
+        run("merge", lambda a: merge(a, b), a, number)
+        run(
+            "copy.deepcopy + merge",
+            lambda _: merge(copy.deepcopy(a), b),
+            a,
+            number,
+        )
+        run("merged", lambda _: merged(a, b), a, number)
+        run("PersistentDict.merge", lambda _: persistent.merge(b), a, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from typing import Any
+
+import pytest
+from Ligare.programming.collections.dict import PersistentDict, merge, merged
+
+
+def _recursive_merge(a: Any, b: Any, skip_existing: bool = False):
+    # the recursive implementation `merge` replaced
+    for key in b:
+        a_val = a.get(key)
+        b_val = b.get(key)
+        if isinstance(a_val, dict) and isinstance(b_val, dict):
+            result = _recursive_merge(a_val, b_val, skip_existing)
+            if skip_existing and a_val:
+                continue
+            a[key] = {**a_val, **result}
+        else:
+            if skip_existing and a_val:
+                continue
+            a[key] = b_val
+    return a
+
+
+def _cases() -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    return [
+        ({}, {"a": 1}),
+        ({"a": 1}, {}),
+        ({"a": 1, "b": 2}, {"b": 3, "c": 4}),
+        ({"a": {"b": {"c": 1, "d": 2}}}, {"a": {"b": {"c": 3, "e": 4}}}),
+        ({"a": {"b": 1}}, {"a": 2}),
+        ({"a": 1}, {"a": {"b": 2}}),
+        ({"a": 0, "b": "", "c": None}, {"a": 1, "b": "x", "c": {"d": 1}}),
+        ({"a": {"b": {}}}, {"a": {"b": {"c": 1}, "d": [1]}}),
+    ]
+
+
+@pytest.mark.parametrize("skip_existing", [False, True])
+@pytest.mark.parametrize("a,b", _cases())
+def test__merge__matches_recursive_merge(
+    a: dict[str, Any], b: dict[str, Any], skip_existing: bool
+):
+    expected = _recursive_merge(_copy(a), _copy(b), skip_existing)
+
+    assert merge(_copy(a), _copy(b), skip_existing) == expected
+
+
+def test__merge__changes_a_in_place():
+    a = {"a": {"b": 1}}
+
+    result = merge(a, {"a": {"c": 2}})
+
+    assert result is a
+    assert a == {"a": {"b": 1, "c": 2}}
+
+
+def test__merge__merges_deeply_nested_dicts():
+    depth = 5000
+    a: dict[str, Any] = {}
+    b: dict[str, Any] = {}
+    a_level, b_level = a, b
+    for _ in range(depth):
+        a_level["x"] = a_level = {}
+        b_level["x"] = b_level = {}
+    b_level["value"] = 1
+
+    result = merge(a, b)
+
+    for _ in range(depth):
+        result = result["x"]
+    assert result == {"value": 1}
+
+
+@pytest.mark.parametrize("a,b", _cases())
+def test__merged__matches_merge_without_changing_arguments(
+    a: dict[str, Any], b: dict[str, Any]
+):
+    a_before = _copy(a)
+    b_before = _copy(b)
+
+    result = merged(a, b)
+
+    assert result == merge(_copy(a), _copy(b))
+    assert a == a_before
+    assert b == b_before
+
+
+def test__merged__shares_unchanged_nested_dicts():
+    a = {"changed": {"value": 1}, "unchanged": {"value": 2}}
+
+    result = merged(a, {"changed": {"value": 3}})
+
+    assert result["unchanged"] is a["unchanged"]
+    assert result["changed"] is not a["changed"]
+
+
+def test__PersistentDict__merge_shares_unchanged_subtrees():
+    original = PersistentDict({"changed": {"value": 1}, "unchanged": {"value": 2}})
+
+    result = original.merge({"changed": {"other": 3}})
+
+    assert result["unchanged"] is original["unchanged"]
+    assert result.to_dict() == {
+        "changed": {"value": 1, "other": 3},
+        "unchanged": {"value": 2},
+    }
+    assert original.to_dict() == {"changed": {"value": 1}, "unchanged": {"value": 2}}
+
+
+def test__PersistentDict__merge_without_values_returns_same_instance():
+    original = PersistentDict({"a": 1})
+
+    assert original.merge({}) is original
+
+
+def test__PersistentDict__set_creates_new_instance():
+    original = PersistentDict({"a": {"b": 1}})
+
+    result = original.set("c", {"d": 2})
+
+    assert "c" not in original
+    assert isinstance(result["c"], PersistentDict)
+    assert result["a"] is original["a"]
+
+
+def test__PersistentDict__is_hashable_and_equal_to_dict():
+    value = PersistentDict({"a": {"b": 1}})
+
+    assert value == {"a": {"b": 1}}
+    assert hash(value) == hash(PersistentDict({"a": {"b": 1}}))
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
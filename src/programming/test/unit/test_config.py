@@ -1,5 +1,14 @@
+from pathlib import Path
+from typing import Any
+
 import pytest
-from Ligare.programming.config import AbstractConfig, ConfigBuilder, load_config
+import toml
+from Ligare.programming.config import (
+    AbstractConfig,
+    ConfigBuilder,
+    clear_config_cache,
+    load_config,
+)
 from Ligare.programming.config.exceptions import (
     ConfigBuilderStateError,
     NotEndsWithConfigError,
@@ -162,3 +171,64 @@ def test__ConfigBuilder__build__sets_dynamic_config_values_when_multiple_configs
     assert getattr(config, "baz")
     assert getattr(getattr(config, "baz"), "baz_value")
     assert getattr(getattr(config, "baz"), "baz_value") == "ABC"
+
+
+def test__ConfigBuilder__build__reuses_generated_config_type():
+    def build():
+        return (
+            ConfigBuilder[TestConfig]()
+            .with_root_config(TestConfig)
+            .with_configs([BazConfig])
+            .build()
+        )
+
+    assert build() is build()
+
+
+def test__ConfigBuilder__build__can_be_called_repeatedly_without_root_config():
+    config_builder = ConfigBuilder[BazConfig]().with_configs([BazConfig, BarConfig])
+
+    config_type = config_builder.build()
+
+    assert config_builder.build() is config_type
+    assert "bar" in config_type.model_fields
+
+
+@pytest.mark.parametrize("toml_parser", ["toml", "tomllib"])
+def test__Config__load_config__uses_toml_parser(toml_parser: Any, tmp_path: Path):
+    toml_file = tmp_path / "config.toml"
+    _ = toml_file.write_text('[foo]\nfoo_value = "abc123"\n')
+
+    config = load_config(TestConfig, toml_file, toml_parser=toml_parser)
+
+    assert config.foo.foo_value == "abc123"
+
+
+def test__Config__load_config__with_cache_reuses_parsed_file(
+    tmp_path: Path, mocker: MockerFixture
+):
+    clear_config_cache()
+    toml_file = tmp_path / "config.toml"
+    _ = toml_file.write_text('[foo]\nfoo_value = "abc123"\n')
+    overrides = {"foo": {"foo_other_value": True}}
+    loads_spy = mocker.spy(toml, "loads")
+
+    first = load_config(TestConfig, toml_file, overrides, cache=True)
+    second = load_config(TestConfig, toml_file, overrides, cache=True)
+
+    assert loads_spy.call_count == 1
+    assert first is not second
+    assert second.foo.foo_value == "abc123"
+    assert second.foo.foo_other_value is True
+
+
+def test__Config__load_config__with_cache_parses_changed_file(tmp_path: Path):
+    clear_config_cache()
+    toml_file = tmp_path / "config.toml"
+    _ = toml_file.write_text('[foo]\nfoo_value = "abc123"\n')
+    _ = load_config(TestConfig, toml_file, cache=True)
+
+    _ = toml_file.write_text('[foo]\nfoo_value = "xyz"\n')
+    config = load_config(TestConfig, toml_file, cache=True)
+
+    assert config.foo.foo_value == "xyz"
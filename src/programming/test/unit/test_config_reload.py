@@ -0,0 +1,135 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from Ligare.programming.application import ApplicationBuilder
+from Ligare.programming.config import AbstractConfig
+from Ligare.programming.config.reload import ConfigReloader, ConfigWatcher
+from typing_extensions import override
+
+
+class FooConfig(AbstractConfig):
+    @override
+    def post_load(self) -> None:
+        return super().post_load()
+
+    value: str = "foo"
+
+
+class BarConfig(AbstractConfig):
+    @override
+    def post_load(self) -> None:
+        return super().post_load()
+
+    value: str = "bar"
+
+
+class ReloadTestConfig(AbstractConfig):
+    @override
+    def post_load(self) -> None:
+        return super().post_load()
+
+    foo: FooConfig = FooConfig()
+    bar: BarConfig = BarConfig()
+
+
+def _config(foo: str = "foo", bar: str = "bar") -> ReloadTestConfig:
+    return ReloadTestConfig(foo=FooConfig(value=foo), bar=BarConfig(value=bar))
+
+
+def test__ConfigReloader__reload__replaces_config_when_reloadable_section_changes():
+    new_config = _config(foo="changed")
+    reloader = ConfigReloader(_config(), lambda: new_config, ["foo"])
+    changes: list[tuple[Any, Any]] = []
+    reloader.subscribe(lambda old, new: changes.append((old, new)))
+    old_config = reloader.config
+
+    assert reloader.reload()
+
+    assert reloader.config is new_config
+    assert changes == [(old_config, new_config)]
+
+
+def test__ConfigReloader__reload__keeps_config_when_other_section_changes(
+    caplog: pytest.LogCaptureFixture,
+):
+    config = _config()
+    reloader = ConfigReloader(
+        config, lambda: _config(foo="changed", bar="changed"), ["foo"]
+    )
+
+    with caplog.at_level(logging.WARNING):
+        assert not reloader.reload()
+
+    assert reloader.config is config
+    assert "bar" in caplog.text
+
+
+def test__ConfigReloader__reload__keeps_config_when_load_fails():
+    def load() -> ReloadTestConfig:
+        raise ValueError()
+
+    config = _config()
+    reloader = ConfigReloader(config, load, ["foo", "bar"])
+
+    assert not reloader.reload()
+    assert reloader.config is config
+
+
+def test__ConfigReloader__reload__keeps_config_when_unchanged():
+    config = _config()
+    reloader = ConfigReloader(config, _config, ["foo"])
+
+    assert not reloader.reload()
+    assert reloader.config is config
+
+
+def test__ConfigWatcher__reloads_when_file_changes(tmp_path: Path):
+    config_file = tmp_path / "config.toml"
+    _ = config_file.write_text("")
+    reloader = ConfigReloader(_config(), lambda: _config(foo="changed"), ["foo"])
+    watcher = ConfigWatcher(reloader, config_file, poll_interval=0.01)
+    watcher.start()
+
+    try:
+        _ = config_file.write_text("changed = true")
+        deadline = time.monotonic() + 5
+        while reloader.config.foo.value != "changed" and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert reloader.config.foo.value == "changed"
+
+
+def test__ApplicationBuilder__with_reloadable_sections__injects_reloaded_config(
+    tmp_path: Path,
+):
+    config_file = tmp_path / "config.toml"
+    _ = config_file.write_text('[foo]\nvalue = "one"\n')
+
+    class App:
+        def run(self): ...
+
+    result = (
+        ApplicationBuilder(App)
+        .use_configuration(
+            lambda config_builder: (
+                config_builder
+                .with_config_types([FooConfig, BarConfig])
+                .with_config_filename(str(config_file))
+                .with_reloadable_sections(["foo"])
+            )
+        )
+        .build()
+    )
+    reloader = result.injector.get(ConfigReloader)
+    foo = result.injector.get(FooConfig)
+
+    _ = config_file.write_text('[foo]\nvalue = "two"\n')
+    assert reloader.reload()
+
+    assert foo.value == "one"
+    assert result.injector.get(FooConfig).value == "two"
@@ -0,0 +1,13 @@
+from Ligare.testing.imports import IMPORT_TIME_BUDGET_SECONDS, import_in_new_interpreter
+
+
+def test__application__does_not_import_optional_dependencies():
+    _, modules = import_in_new_interpreter("Ligare.programming.application")
+
+    assert not {"boto3", "botocore", "connexion", "flask", "sqlalchemy"} & modules
+
+
+def test__application__imports_within_budget():
+    elapsed, _ = import_in_new_interpreter("Ligare.programming.application")
+
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS
@@ -0,0 +1,102 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+from injector import Binder, Module
+from Ligare.programming import startup
+from Ligare.programming.application import ApplicationBuilder
+from Ligare.programming.startup import (
+    disable_startup_trace,
+    enable_startup_trace,
+    get_startup_tracer,
+    trace_phase,
+)
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+
+@pytest.fixture(autouse=True)
+def _disable_startup_trace() -> Generator[None, None, None]:
+    yield
+    disable_startup_trace()
+
+
+def _report(path: Path) -> list[dict[str, Any]]:
+    return json.loads(path.read_text())["traceEvents"]
+
+
+def test__trace_phase__does_nothing_when_disabled():
+    with trace_phase("foo"):
+        pass
+
+    assert get_startup_tracer() is None
+
+
+def test__trace_phase__writes_report_when_outermost_phase_ends(tmp_path: Path):
+    report = tmp_path / "trace.json"
+    tracer = enable_startup_trace(str(report))
+
+    with trace_phase("outer"):
+        with trace_phase("inner"):
+            pass
+        assert not report.exists()
+
+    events = _report(report)
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert [span.depth for span in tracer.spans] == [1, 0]
+
+
+def test__enable_startup_trace__records_import_times(
+    tmp_path: Path, mocker: MockerFixture
+):
+    package = tmp_path / "startup_trace_fixture"
+    package.mkdir()
+    _ = (package / "__init__.py").write_text("from . import child\n")
+    _ = (package / "child.py").write_text("VALUE = 1\n")
+    mocker.patch.object(startup, "_TRACED_IMPORT_PREFIX", "startup_trace_fixture")
+    sys.path.insert(0, str(tmp_path))
+    tracer = enable_startup_trace(str(tmp_path / "trace.json"))
+
+    try:
+        import startup_trace_fixture  # pyright: ignore[reportMissingImports]
+
+        assert startup_trace_fixture.child.VALUE == 1  # pyright: ignore[reportUnknownMemberType]
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in ["startup_trace_fixture", "startup_trace_fixture.child"]:
+            _ = sys.modules.pop(name, None)
+
+    imports = {(span.name, span.depth) for span in tracer.spans}
+    assert imports == {("startup_trace_fixture", 0), ("startup_trace_fixture.child", 1)}
+
+
+def test__disable_startup_trace__removes_import_hook(tmp_path: Path):
+    _ = enable_startup_trace(str(tmp_path / "trace.json"))
+    meta_path_length = len(sys.meta_path)
+
+    disable_startup_trace()
+
+    assert len(sys.meta_path) == meta_path_length - 1
+    assert get_startup_tracer() is None
+
+
+def test__ApplicationBuilder__build__traces_module_configure(tmp_path: Path):
+    class FooModule(Module):
+        @override
+        def configure(self, binder: Binder) -> None:
+            binder.bind(str, to="foo")
+
+    class App:
+        def run(self): ...
+
+    report = tmp_path / "trace.json"
+    _ = enable_startup_trace(str(report))
+
+    _ = ApplicationBuilder(App).with_module(FooModule).build()
+
+    names = {event["name"] for event in _report(report)}
+    assert {"ApplicationBuilder.build", "FooModule.configure", "Injector"} <= names
@@ -0,0 +1,43 @@
+"""
+Measure imports in a new interpreter, where nothing has been imported yet.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET_SECONDS = 5
+"""
+How long importing a module in a new interpreter may take.
+
+This is generous enough for slow CI machines. Importing boto3 alone
+takes a sizeable part of this budget.
+"""
+
+
+def import_in_new_interpreter(module: str) -> tuple[float, set[str]]:
+    """
+    Import `module` in a new Python interpreter.
+
+    The interpreter uses this interpreter's `sys.path`, so it imports the same packages.
+
+    :param str module: The name of the module to import.
+    :return tuple[float, set[str]]: How long the import took, in seconds,
+        and the names of every module the interpreter imported.
+    """
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(json.dumps([time.perf_counter() - start, list(sys.modules)]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    elapsed, modules = json.loads(result.stdout)
+    return elapsed, set(modules)
@@ -6,6 +6,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from os import path
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -33,9 +34,12 @@ from Ligare.programming.application import AppModule
 from Ligare.programming.collections.dict import NestedDict
 from Ligare.programming.config import AbstractConfig, ConfigBuilder, load_config
 from Ligare.programming.config.exceptions import ConfigInvalidError
+from Ligare.programming.config.reload import ConfigReloader
 from Ligare.programming.exception import BuilderBuildError, InvalidBuilderStateError
+from Ligare.programming.startup import trace_phase
 from typing_extensions import Self, override
 
+from .blueprint_manifest import BlueprintManifest
 from .config import Config, FlaskConfig
 from .middleware import (
     register_api_request_handlers,
@@ -44,6 +48,8 @@ from .middleware import (
     register_error_handlers,
 )
 from .middleware.dependency_injection import configure_dependencies
+from .middleware.headers import HeaderProcessor, SecurityHeaderTemplate
+from .specification import load_specification, override_connexion_specification
 
 _get_program_dir = lambda: path.dirname(get_path_executed_script())
 _get_exec_dir = lambda: path.abspath(".")
@@ -357,6 +363,11 @@ class ApplicationBuilder(GenericApplicationBuilder[T_app]):
 
     @override
     def build(self) -> CreateAppResult[T_app]:
+        with trace_phase("ApplicationBuilder.build"):
+            return self._build()
+
+    @override
+    def _build(self) -> CreateAppResult[T_app]:
         config_overrides = cast(NestedDict[str, Any], defaultdict(dict))
 
         if (
@@ -392,35 +403,71 @@ class ApplicationBuilder(GenericApplicationBuilder[T_app]):
             )
 
         if config.flask.openapi is not None:
-            openapi = configure_openapi(config)
+            with trace_phase("configure_openapi"):
+                openapi = configure_openapi(config)
             app = cast(T_app, openapi)
         else:
-            app = cast(T_app, configure_blueprint_routes(config))
+            with trace_phase("configure_blueprint_routes"):
+                app = cast(T_app, configure_blueprint_routes(config))
 
-        register_error_handlers(app)
-        _ = register_api_request_handlers(app)
-        _ = register_api_response_handlers(app)
-        _ = register_context_middleware(app)
+        with trace_phase("register handlers"):
+            register_error_handlers(app)
+            _ = register_api_request_handlers(app)
+            _ = register_api_response_handlers(app)
+            _ = register_context_middleware(app)
 
         modules = self._build_application_modules()
 
-        flask_injector = configure_dependencies(app, application_modules=modules)
+        with trace_phase("configure_dependencies"):
+            flask_injector = configure_dependencies(app, application_modules=modules)
 
         flask_app = app.app if isinstance(app, FlaskApp) else app
+
+        if self._config_reloader is not None:
+            _subscribe_to_config_reloads(
+                self._config_reloader, flask_app, flask_injector.injector
+            )
+
         return CreateAppResult[T_app](
             flask_app, AppInjector[T_app](app, flask_injector)
         )
 
 
-def _override_connexion_spec_clone():
-    import copy
+def _subscribe_to_config_reloads(
+    reloader: ConfigReloader[AbstractConfig], flask_app: Flask, injector: Injector
+) -> None:
+    """
+    Replace the dependencies built from the configuration when it is reloaded.
 
-    from connexion.spec import Specification
+    Values the application has already used to create its routes and
+    ASGI middleware, like the trace ID settings, are not updated.
+    """
 
-    def clone(self: Specification):
-        return type(self)(copy.deepcopy(cast(dict[Any, Any], self._raw_spec)))  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+    def on_reload(old: AbstractConfig, new: AbstractConfig) -> None:
+        old_config = cast(Config, old)
+        new_config = cast(Config, new)
 
-    Specification.clone = clone
+        if new_config.flask != old_config.flask:
+            # Flask reads the session cookie settings from `app.config` on each request
+            new_config.update_flask_config(flask_app.config)
+
+        # `HeaderProcessor` is built from `logging.headers` and the session cookie name
+        if (
+            new_config.logging != old_config.logging
+            or new_config.flask != old_config.flask
+        ):
+            injector.binder.bind(HeaderProcessor, to=HeaderProcessor(new_config))
+
+        if new_config.web != old_config.web:
+            injector.binder.bind(
+                SecurityHeaderTemplate,
+                to=SecurityHeaderTemplate(new_config.web.security),
+            )
+
+        if new_config.logging.log_level != old_config.logging.log_level:
+            flask_app.logger.setLevel(new_config.logging.log_level.upper())
+
+    reloader.subscribe(on_reload)
 
 
 def configure_openapi(config: Config, name: Optional[str] = None):
@@ -428,7 +475,7 @@ def configure_openapi(config: Config, name: Optional[str] = None):
     Instantiate Connexion and set Flask logging options
     """
 
-    _override_connexion_spec_clone()
+    override_connexion_specification()
 
     if (
         config.flask is None
@@ -461,8 +508,15 @@ def configure_openapi(config: Config, name: Optional[str] = None):
     app = connexion_app.app
     config.update_flask_config(app.config)
 
+    specification: Any = f"{config.flask.app_name}/{config.flask.openapi.spec_path}"
+    if config.flask.openapi.spec_cache_dir is not None:
+        with trace_phase("load_specification"):
+            specification = load_specification(
+                Path(exec_dir, specification), config.flask.openapi.spec_cache_dir
+            )
+
     _ = connexion_app.add_api(
-        f"{config.flask.app_name}/{config.flask.openapi.spec_path}",
+        specification,
         validate_responses=config.flask.openapi.validate_responses,
     )
 
@@ -493,12 +547,17 @@ def configure_blueprint_routes(
     app = Flask(config.flask.app_name)
     config.update_flask_config(app.config)
 
-    blueprint_modules = _import_blueprint_modules(app, blueprint_import_subdir)
+    with trace_phase("_import_blueprint_modules"):
+        blueprint_modules = _import_blueprint_modules(
+            app, blueprint_import_subdir, config.flask.blueprint_manifest
+        )
     _register_blueprint_modules(app, blueprint_modules)
     return app
 
 
-def _import_blueprint_modules(app: Flask, blueprint_import_subdir: str):
+def _import_blueprint_modules(
+    app: Flask, blueprint_import_subdir: str, use_manifest: bool = False
+):
     from importlib.util import module_from_spec, spec_from_file_location
     from pathlib import Path
 
@@ -510,22 +569,37 @@ def _import_blueprint_modules(app: Flask, blueprint_import_subdir: str):
     module_paths = blueprint_import_dir.glob("*.py")
 
     blueprint_modules: list[Blueprint] = []
+    manifest = BlueprintManifest(blueprint_import_dir) if use_manifest else None
 
     for path in module_paths:
         if not (path.is_file() or path.name == "__init__.py"):
             continue
+        stat = None
+        if manifest is not None:
+            stat = path.stat()
+            # skip files that did not define any blueprints
+            # the last time they were executed
+            if manifest.defines_no_blueprints(path.name, stat):
+                continue
         # load the module from its path
         # and execute it
-        spec = spec_from_file_location(path.name.rstrip(".py"), str(path))
+        spec = spec_from_file_location(path.name.removesuffix(".py"), str(path))
         if spec is None or spec.loader is None:
             raise Exception(f"Module cannot be created from path {path}")
         module = module_from_spec(spec)
         spec.loader.exec_module(module)
         # find all Flask blueprints in
         # the module and register them
+        blueprint_names: list[str] = []
         for module_name, module_var in vars(module).items():
             if module_name.endswith("_blueprint") or isinstance(module_var, Blueprint):
                 blueprint_modules.append(module_var)
+                blueprint_names.append(module_name)
+        if manifest is not None and stat is not None:
+            manifest.record(path.name, stat, blueprint_names)
+
+    if manifest is not None:
+        manifest.save()
 
     return blueprint_modules
 
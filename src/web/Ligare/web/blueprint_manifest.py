@@ -0,0 +1,115 @@
+"""
+A cache of which blueprint modules define Flask blueprints.
+
+Blueprint discovery executes every Python file in the blueprint directory
+to find the blueprints it defines. The manifest records what each file
+defined, keyed on its modification time and size, so files that define
+no blueprints are not executed again until they change.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from os import stat_result
+from pathlib import Path
+from typing import Any
+
+from typing_extensions import final
+
+_log = logging.getLogger(__name__)
+
+
+@final
+class BlueprintManifest:
+    """
+    The blueprint variables defined by each file in a blueprint directory.
+
+    The manifest is stored in the directory's `__pycache__` directory,
+    next to the bytecode Python caches there.
+    """
+
+    FILENAME = "ligare-blueprints.json"
+
+    def __init__(self, blueprint_import_dir: Path) -> None:
+        super().__init__()
+        self.path = Path(
+            blueprint_import_dir, "__pycache__", BlueprintManifest.FILENAME
+        )
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._seen: set[str] = set()
+        self._changed = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with self.path.open("r", encoding="utf-8") as file:
+                entries = json.load(file)
+            if isinstance(entries, dict):
+                return entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _log.warning(
+                f"Ignoring unreadable blueprint manifest {self.path}.", exc_info=e
+            )
+        return {}
+
+    def defines_no_blueprints(self, filename: str, stat: stat_result) -> bool:
+        """
+        Whether the unchanged file `filename` was found to define no blueprints.
+
+        :param str filename: The name of a file in the blueprint directory.
+        :param stat_result stat: The file's current `stat`.
+        :return bool:
+        """
+        self._seen.add(filename)
+        entry = self._entries.get(filename)
+        return (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            and not entry.get("blueprints")
+        )
+
+    def record(self, filename: str, stat: stat_result, blueprints: list[str]) -> None:
+        """
+        Record the blueprint variables a file defines.
+
+        :param str filename: The name of a file in the blueprint directory.
+        :param stat_result stat: The file's `stat` from before it was executed.
+        :param list[str] blueprints: The names of the blueprint variables it defines.
+        """
+        self._seen.add(filename)
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "blueprints": blueprints,
+        }
+        if self._entries.get(filename) != entry:
+            self._entries[filename] = entry
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Write the manifest if it changed, dropping files that no longer exist.
+
+        Failing to write the manifest, e.g. because the directory is
+        read-only, is logged and otherwise ignored.
+        """
+        for filename in set(self._entries) - self._seen:
+            del self._entries[filename]
+            self._changed = True
+
+        if not self._changed:
+            return
+
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as file:
+                json.dump(self._entries, file)
+            os.replace(file.name, self.path)
+            self._changed = False
+        except OSError as e:
+            _log.warning(f"Failed to write blueprint manifest {self.path}.", exc_info=e)
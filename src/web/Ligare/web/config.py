@@ -12,9 +12,17 @@ from pydantic import BaseModel
 from typing_extensions import override
 
 
+class LoggingHeadersConfig(BaseModel):
+    # header names are case-insensitive.
+    # `None` means all headers not in `deny` are logged.
+    allow: list[str] | None = None
+    deny: list[str] = field(default_factory=lambda: [])
+
+
 class LoggingConfig(BaseModel):
     log_level: str = "INFO"
     format: Literal["plaintext", "JSON"] = "JSON"
+    headers: LoggingHeadersConfig = LoggingHeadersConfig()
 
 
 class WebSecurityCorsConfig(BaseModel):
@@ -45,8 +53,14 @@ class WebSecurityConfig(BaseModel):
     csp: str | None = None
 
 
+class WebTraceIdConfig(BaseModel):
+    # the format of generated and accepted X-Correlation-Id values
+    format: Literal["uuid4", "ulid"] = "uuid4"
+
+
 class WebConfig(BaseModel):
     security: WebSecurityConfig = WebSecurityConfig()
+    trace_id: WebTraceIdConfig = WebTraceIdConfig()
 
 
 class FlaskOpenApiConfig(BaseModel):
@@ -54,6 +68,7 @@ class FlaskOpenApiConfig(BaseModel):
     validate_responses: bool = False
     use_swagger: bool = True
     swagger_url: str | None = None
+    spec_cache_dir: str | None = None
 
 
 class FlaskSessionCookieConfig(BaseModel):
@@ -123,6 +138,7 @@ class FlaskConfig(BaseModel):
     port: str = "5000"
     openapi: FlaskOpenApiConfig | None = None
     session: FlaskSessionConfig | None = None
+    blueprint_manifest: bool = False
 
     def _prepare_env_for_flask(self):
         environ.update(
@@ -2,16 +2,16 @@
 Libraries for hosting :ref:`Ligare.web` applications with ASGI.
 """
 
-from Ligare.programming.collections.dict import merge
+from Ligare.programming.collections.dict import merged
 from uvicorn.workers import UvicornWorker
 
 
 class LifespanUvicornWorker(UvicornWorker):
-    CONFIG_KWARGS = merge(UvicornWorker.CONFIG_KWARGS, {"lifespan": "on"})
+    CONFIG_KWARGS = merged(UvicornWorker.CONFIG_KWARGS, {"lifespan": "on"})
 
 
 class ProxiedUvicornWorker(LifespanUvicornWorker):
-    CONFIG_KWARGS = merge(
-        UvicornWorker.CONFIG_KWARGS,
+    CONFIG_KWARGS = merged(
+        LifespanUvicornWorker.CONFIG_KWARGS,
         {"proxy_headers": True, "forwarded_allow_ips": "*"},
     )
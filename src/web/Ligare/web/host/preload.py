@@ -0,0 +1,80 @@
+"""
+Gunicorn preloading for :ref:`Ligare.web` applications.
+
+By default, every gunicorn worker imports the application module and so
+builds the whole application: it loads the configuration, parses the
+OpenAPI specification, and creates the dependency graph. With preloading,
+the application is built once in the gunicorn master and the workers
+share it copy-on-write after they are forked.
+
+This module is a gunicorn configuration that enables preloading.
+Use it with `gunicorn -c python:Ligare.web.host.preload`, or import
+its hooks into your own gunicorn configuration file.
+
+Anything that must not be shared between processes, like database
+connections or R worker pools, should be created by a callback
+registered with :func:`register_post_fork`, which runs in each worker.
+"""
+
+import gc
+import logging
+from typing import Any, Callable, TypeVar
+
+TCallable = TypeVar("TCallable", bound=Callable[[], Any])
+
+_post_fork_callbacks: list[Callable[[], Any]] = []
+
+preload_app = True
+
+
+def register_post_fork(callback: TCallable) -> TCallable:
+    """
+    Run `callback` in each worker after it is forked from the master.
+    Callbacks run in the order they are registered.
+
+    This can be used as a decorator.
+
+    :param TCallable callback: A callable that takes no arguments.
+    :return TCallable: `callback`
+    """
+    _post_fork_callbacks.append(callback)
+    return callback
+
+
+def unregister_post_fork(callback: Callable[[], Any]) -> None:
+    """
+    Stop running `callback` in forked workers.
+
+    :param Callable[[], Any] callback: A callback passed to :func:`register_post_fork`.
+    """
+    _post_fork_callbacks.remove(callback)
+
+
+def run_post_fork_callbacks() -> None:
+    """
+    Run all registered post-fork callbacks.
+    """
+    for callback in list(_post_fork_callbacks):
+        callback()
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    """
+    Gunicorn hook that runs in the master before each worker is forked.
+
+    Moves every object the master has created, which includes the preloaded
+    application, to the garbage collector's permanent generation. Otherwise,
+    the garbage collector in each worker writes to those objects while
+    scanning them, which copies the memory pages they are on into the worker.
+    """
+    gc.freeze()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """
+    Gunicorn hook that runs in each worker after it is forked.
+    """
+    logging.getLogger(__name__).debug(
+        f"Running {len(_post_fork_callbacks)} post-fork callbacks in worker {worker.pid}."
+    )
+    run_post_fork_callbacks()
@@ -0,0 +1,433 @@
+"""
+Response compression for :ref:`Ligare.web`.
+
+gzip is always available. Brotli and Zstandard are used when the
+`brotli` and `zstandard` packages are installed, which can be done
+through `Ligare.web[compression]`.
+
+Responses are compressed as they are sent. A response whose body is sent
+in one message is compressed in one step, and is left alone if it is
+smaller than the configured minimum size. Bodies sent in several messages
+are compressed chunk by chunk, and each chunk is flushed so clients can
+decode it as it arrives.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Callable, Literal, cast
+
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import inject
+from Ligare.programming.config import AbstractConfig
+from Ligare.programming.patterns.dependency_injection import ConfigurableModule
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import final, override
+
+ContentEncoding = Literal["zstd", "br", "gzip"]
+
+_brotli_is_installed = find_spec("brotli") is not None
+_zstandard_is_installed = find_spec("zstandard") is not None
+
+_ACCEPT_ENCODING_HEADER = b"accept-encoding"
+_CONTENT_ENCODING_HEADER = b"content-encoding"
+_CONTENT_LENGTH_HEADER = b"content-length"
+_CONTENT_RANGE_HEADER = b"content-range"
+_CONTENT_TYPE_HEADER = b"content-type"
+_ETAG_HEADER = b"etag"
+_VARY_HEADER = b"vary"
+_VARY_VALUE = b"Accept-Encoding"
+
+# responses with these statuses are not compressed. 204 and 304 do not
+# have a body, and the body of a 206 is a byte range of the uncompressed
+# representation, which compressing would no longer match.
+_UNCOMPRESSED_STATUSES = frozenset({204, 206, 304})
+
+
+class CompressionConfig(AbstractConfig):
+    @override
+    def post_load(self) -> None:
+        return super().post_load()
+
+    # the encodings to use, in order of preference when the client
+    # accepts several with the same quality. encodings whose packages
+    # are not installed are ignored.
+    encodings: list[ContentEncoding] = ["zstd", "br", "gzip"]
+    # bodies smaller than this many bytes are not compressed
+    minimum_size: int = 500
+    # compressed content types. values ending in "/" match any subtype.
+    content_types: list[str] = [
+        "text/",
+        "application/json",
+        "application/problem+json",
+        "application/javascript",
+        "application/xml",
+        "application/yaml",
+        "image/svg+xml",
+    ]
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+    # compressed bodies for paths starting with these prefixes are cached,
+    # so static assets like the Swagger UI and the OpenAPI specification
+    # are only compressed once per worker.
+    cache_paths: list[str] = ["/ui/", "/openapi.json", "/openapi.yaml"]
+    cache_size: int = 128
+
+
+class Encoder(ABC):
+    """
+    Compresses one response body.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a chunk of the body and flush it so it can be decoded
+        without the rest of the body.
+        """
+
+    @abstractmethod
+    def finish(self, data: bytes = b"") -> bytes:
+        """
+        Compress the last, or only, chunk of the body and end the stream.
+        """
+
+
+@final
+class GzipEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        super().__init__()
+        # wbits of 16 + MAX_WBITS writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    @override
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    @override
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+@final
+class BrotliEncoder(Encoder):
+    def __init__(self, quality: int) -> None:
+        super().__init__()
+        brotli = import_module("brotli")
+        self._compressor = brotli.Compressor(quality=quality)
+
+    @override
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    @override
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+@final
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        super().__init__()
+        zstandard = import_module("zstandard")
+        self._flush_block: int = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    @override
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            self._flush_block
+        )
+
+    @override
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def available_encoders(
+    config: CompressionConfig,
+) -> dict[ContentEncoding, Callable[[], Encoder]]:
+    """
+    Get a factory for each configured encoding whose package is installed,
+    in the configured order of preference.
+    """
+    factories: dict[ContentEncoding, Callable[[], Encoder]] = {}
+    for encoding in config.encodings:
+        if encoding == "gzip":
+            factories["gzip"] = lambda: GzipEncoder(config.gzip_level)
+        elif encoding == "br" and _brotli_is_installed:
+            factories["br"] = lambda: BrotliEncoder(config.brotli_quality)
+        elif encoding == "zstd" and _zstandard_is_installed:
+            factories["zstd"] = lambda: ZstdEncoder(config.zstd_level)
+    return factories
+
+
+def select_encoding(
+    accept_encoding: str, encodings: list[ContentEncoding]
+) -> ContentEncoding | None:
+    """
+    Select the encoding to use from an `Accept-Encoding` header value.
+
+    The encoding with the highest quality value is selected, and ties are
+    broken by the order of `encodings`. Encodings with a quality of 0,
+    or that are not in `encodings`, are never selected.
+
+    :param str accept_encoding: The `Accept-Encoding` header value.
+    :param list[ContentEncoding] encodings: The usable encodings in order of preference.
+    :return ContentEncoding | None: The encoding, or None if the response should not be compressed.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                quality = float(parameter[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best: ContentEncoding | None = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _find_header(headers: list[tuple[bytes, bytes]], name: bytes) -> bytes | None:
+    for header, value in headers:
+        if header.lower() == name:
+            return value
+    return None
+
+
+@final
+class CompressedBodyCache:
+    """
+    A least-recently-used cache of compressed bodies keyed on
+    the request path, encoding, and uncompressed body.
+    """
+
+    def __init__(self, size: int) -> None:
+        super().__init__()
+        self._size = size
+        self._entries: OrderedDict[tuple[str, str, bytes], bytes] = OrderedDict()
+
+    def get(self, path: str, encoding: str, body: bytes) -> bytes | None:
+        key = (path, encoding, body)
+        compressed = self._entries.get(key)
+        if compressed is not None:
+            self._entries.move_to_end(key)
+        return compressed
+
+    def set(self, path: str, encoding: str, body: bytes, compressed: bytes) -> None:
+        self._entries[(path, encoding, body)] = compressed
+        if len(self._entries) > self._size:
+            _ = self._entries.popitem(last=False)
+
+
+@final
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses using the best encoding the client accepts.
+    """
+
+    _app: ASGIApp
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig) -> None:
+        super().__init__()
+        self._app = app
+        self._encoders = available_encoders(config)
+        self._encodings = list(self._encoders)
+        self._minimum_size = config.minimum_size
+        self._content_types = tuple(config.content_types)
+        self._cache_paths = tuple(config.cache_paths)
+        self._cache = CompressedBodyCache(config.cache_size)
+
+    def _is_compressible(self, headers: list[tuple[bytes, bytes]]) -> bool:
+        if (
+            _find_header(headers, _CONTENT_ENCODING_HEADER) is not None
+            or _find_header(headers, _CONTENT_RANGE_HEADER) is not None
+        ):
+            return False
+        content_type = _find_header(headers, _CONTENT_TYPE_HEADER)
+        if content_type is None:
+            return False
+        mime_type = content_type.decode("latin-1").partition(";")[0].strip().lower()
+        return any(
+            mime_type.startswith(allowed)
+            if allowed.endswith("/")
+            else mime_type == allowed
+            for allowed in self._content_types
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._encodings:
+            return await self._app(scope, receive, send)
+
+        accept_encoding = _find_header(scope["headers"], _ACCEPT_ENCODING_HEADER)
+        encoding = (
+            None
+            if accept_encoding is None
+            else select_encoding(accept_encoding.decode("latin-1"), self._encodings)
+        )
+        if encoding is None:
+            return await self._app(scope, receive, send)
+
+        path = cast(str, scope.get("path", ""))
+        cache = self._cache if path.startswith(self._cache_paths) else None
+        responder = _CompressionResponder(
+            send, encoding, self._encoders[encoding], self._minimum_size, path, cache
+        )
+        start_message: Message | None = None
+
+        async def wrapped_send(message: Any) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                if message[
+                    "status"
+                ] in _UNCOMPRESSED_STATUSES or not self._is_compressible(
+                    message.get("headers", [])
+                ):
+                    responder.passthrough = True
+                    return await send(message)
+                # the headers depend on the body size, so
+                # the start message is held until the first body.
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or responder.passthrough:
+                return await send(message)
+
+            await responder.send_body(cast(Message, start_message), message)
+
+        await self._app(scope, receive, wrapped_send)
+
+
+@final
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: ContentEncoding,
+        encoder_factory: Callable[[], Encoder],
+        minimum_size: int,
+        path: str,
+        cache: CompressedBodyCache | None,
+    ) -> None:
+        super().__init__()
+        self.passthrough = False
+        self._send = send
+        self._encoding = encoding
+        self._encoder_factory = encoder_factory
+        self._encoder: Encoder | None = None
+        self._minimum_size = minimum_size
+        self._path = path
+        self._cache = cache
+
+    def _start_headers(
+        self, start_message: Message, content_length: int | None
+    ) -> list[tuple[bytes, bytes]]:
+        headers: list[tuple[bytes, bytes]] = []
+        for header, value in start_message.get("headers", []):
+            name = header.lower()
+            if name == _CONTENT_LENGTH_HEADER:
+                continue
+            if name == _ETAG_HEADER and not value.startswith(b"W/"):
+                # the compressed body is not byte-for-byte the body the
+                # strong ETag was computed for, so it is only weakly equal.
+                value = b"W/" + value
+            headers.append((header, value))
+        headers.append((_CONTENT_ENCODING_HEADER, self._encoding.encode("latin-1")))
+        headers.append((_VARY_HEADER, _VARY_VALUE))
+        if content_length is not None:
+            headers.append((_CONTENT_LENGTH_HEADER, str(content_length).encode()))
+        return headers
+
+    async def send_body(self, start_message: Message, message: Message) -> None:
+        body = cast(bytes, message.get("body", b""))
+        more_body = cast(bool, message.get("more_body", False))
+
+        if self._encoder is not None:
+            # continue a streamed response
+            compressed = (
+                self._encoder.compress(body)
+                if more_body
+                else self._encoder.finish(body)
+            )
+            return await self._send({
+                "type": "http.response.body",
+                "body": compressed,
+                "more_body": more_body,
+            })
+
+        if not more_body:
+            # the whole body is in one message
+            if len(body) < self._minimum_size:
+                self.passthrough = True
+                await self._send(start_message)
+                return await self._send(message)
+
+            compressed = self._compress_whole(body)
+            await self._send({
+                **start_message,
+                "headers": self._start_headers(start_message, len(compressed)),
+            })
+            return await self._send({"type": "http.response.body", "body": compressed})
+
+        # the body is streamed, so the compressed size is not known up front
+        self._encoder = self._encoder_factory()
+        await self._send({
+            **start_message,
+            "headers": self._start_headers(start_message, None),
+        })
+        await self._send({
+            "type": "http.response.body",
+            "body": self._encoder.compress(body),
+            "more_body": True,
+        })
+
+    def _compress_whole(self, body: bytes) -> bytes:
+        if self._cache is None:
+            return self._encoder_factory().finish(body)
+
+        compressed = self._cache.get(self._path, self._encoding, body)
+        if compressed is None:
+            compressed = self._encoder_factory().finish(body)
+            self._cache.set(self._path, self._encoding, body, compressed)
+        return compressed
+
+
+class CompressionMiddlewareModule(ConfigurableModule):
+    """
+    Enable response compression.
+    """
+
+    @override
+    @staticmethod
+    def get_config_type() -> type[AbstractConfig]:
+        return CompressionConfig
+
+    @inject
+    def register_middleware(self, app: FlaskApp, config: CompressionConfig):
+        # Positioned outside of Connexion's exception handling
+        # so error responses are compressed too.
+        app.add_middleware(
+            CompressionMiddleware,
+            position=MiddlewarePosition.BEFORE_EXCEPTION,
+            config=config,
+        )
@@ -11,6 +11,7 @@ CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER = "Access-Control-Allow-Methods"
 CONTENT_SECURITY_POLICY_HEADER = "Content-Security-Policy"
 ORIGIN_HEADER = "Origin"
 HOST_HEADER = "Host"
+SERVER_TIMING_HEADER = "Server-Timing"
 
 INCOMING_REQUEST_MESSAGE = "Incoming request:\n\
     %s %s\n\
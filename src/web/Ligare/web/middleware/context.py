@@ -1,9 +1,7 @@
-import uuid
 from collections.abc import Collection
 from contextvars import ContextVar
 from logging import Logger
 from typing import Any, Callable, Literal, NamedTuple, NewType, TypedDict, cast
-from uuid import uuid4
 
 from connexion import ConnexionMiddleware
 from injector import inject
@@ -12,6 +10,8 @@ from Ligare.web.middleware.consts import CORRELATION_ID_HEADER
 from starlette.types import ASGIApp, Receive, Scope, Send
 from typing_extensions import final
 
+from .trace_id import TraceIdGenerator, UUID4TraceIdGenerator
+
 MiddlewareRequestDict = TypedDict(
     "MiddlewareRequestDict",
     {
@@ -136,6 +136,18 @@ def get_trace_id() -> TraceId:
     return TraceId(_correlation_id_ctx_var.get(), _request_id_ctx_var.get())
 
 
+def get_request_id(scope: Scope) -> RequestId | None:
+    """
+    Get the request ID that :class:`RequestIdMiddleware` validated
+    or generated for a request.
+
+    :param Scope scope: The request's ASGI scope.
+    :return RequestId | None: The ID, or None if the middleware has not handled the request.
+    """
+    state = cast(AnyDict | None, scope.get("state"))
+    return None if state is None else state.get(REQUEST_ID_CTX_KEY)
+
+
 @final
 class CorrelationIdMiddleware:
     """
@@ -147,33 +159,47 @@ class CorrelationIdMiddleware:
     def __init__(
         self,
         app: ASGIApp,
+        trace_id_generator: TraceIdGenerator | None = None,
     ) -> None:
         self.app = app
+        self._trace_id_generator = trace_id_generator or UUID4TraceIdGenerator()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] not in ["http", "websocket"]:
             await self.app(scope, receive, send)
             return
 
-        correlation_id = _correlation_id_ctx_var.set(CorrelationId(str(uuid4())))
+        correlation_id = _correlation_id_ctx_var.set(
+            CorrelationId(self._trace_id_generator.generate())
+        )
 
         await self.app(scope, receive, send)
 
         _correlation_id_ctx_var.reset(correlation_id)
 
 
+_REQUEST_ID_HEADER_ENCODED = CORRELATION_ID_HEADER.lower().encode("latin-1")
+
+
 @final
 class RequestIdMiddleware:
     """
     Generate a Trace ID for each request.
     If X-Correlation-Id is set in the request headers, that ID is used instead.
+
+    The ID is validated once, here, and stored in the request scope and
+    context so later middleware and handlers can use it without parsing
+    the headers again. See :func:`get_request_id` and :func:`get_trace_id`.
     """
 
     _app: ASGIApp
 
-    def __init__(self, app: ASGIApp):
+    def __init__(
+        self, app: ASGIApp, trace_id_generator: TraceIdGenerator | None = None
+    ):
         super().__init__()
         self._app = app
+        self._trace_id_generator = trace_id_generator or UUID4TraceIdGenerator()
 
     @inject
     async def __call__(
@@ -187,49 +213,43 @@ class RequestIdMiddleware:
         request = cast(MiddlewareRequestDict, scope)
         request_headers = request.get("headers")
 
-        content_type = extract_content_type(request_headers)
-        _, encoding = split_content_type(content_type)
-        if encoding is None:
-            encoding = "utf-8"
-
-        try:
-            request_id_header_encoded = CORRELATION_ID_HEADER.lower().encode(encoding)
-
-            request_id: bytes | None = next(
-                (
-                    request_id
-                    for (header, request_id) in request_headers
-                    if header == request_id_header_encoded
-                ),
-                None,
-            )
-
-            if request_id:
-                # validate format
-                request_id_decoded = request_id.decode(encoding)
-                _ = uuid.UUID(request_id_decoded)
-                request_id_token = _request_id_ctx_var.set(
-                    RequestId(request_id_decoded)
+        request_id: bytes | None = next(
+            (
+                request_id
+                for (header, request_id) in request_headers
+                if header == _REQUEST_ID_HEADER_ENCODED
+            ),
+            None,
+        )
+
+        if request_id:
+            try:
+                # headers are always decodable as latin-1
+                request_id_decoded = self._trace_id_generator.validate(
+                    request_id.decode("latin-1")
                 )
-            else:
-                request_id_decoded = str(uuid4())
-                request_id = request_id_decoded.encode(encoding)
-                request_headers.append((
-                    request_id_header_encoded,
-                    request_id,
-                ))
-                request_id_token = _request_id_ctx_var.set(
-                    RequestId(request_id_decoded)
+            except ValueError as e:
+                log.warning(
+                    f"Badly formatted {CORRELATION_ID_HEADER} received in request."
                 )
-                log.info(
-                    f'Generated new UUID "{request_id}" for {CORRELATION_ID_HEADER} request header.'
-                )
-        except ValueError as e:
-            log.warning(f"Badly formatted {CORRELATION_ID_HEADER} received in request.")
-            raise e
+                raise e
+        else:
+            request_id_decoded = self._trace_id_generator.generate()
+            request_id = request_id_decoded.encode("latin-1")
+            request_headers.append((
+                _REQUEST_ID_HEADER_ENCODED,
+                request_id,
+            ))
+            log.info(
+                f'Generated new ID "{request_id_decoded}" for {CORRELATION_ID_HEADER} request header.'
+            )
+
+        scope.setdefault("state", {})[REQUEST_ID_CTX_KEY] = RequestId(
+            request_id_decoded
+        )
+        request_id_token = _request_id_ctx_var.set(RequestId(request_id_decoded))
 
         async def wrapped_send(message: Any) -> None:
-            nonlocal scope
             nonlocal send
 
             if message["type"] != "http.response.start":
@@ -240,13 +260,8 @@ class RequestIdMiddleware:
             response = cast(MiddlewareResponseDict, message)
             response_headers = response["headers"]
 
-            content_type = extract_content_type(response_headers)
-            _, encoding = split_content_type(content_type)
-            if encoding is None:
-                encoding = "utf-8"
-
             response_headers.append((
-                request_id_header_encoded,
+                _REQUEST_ID_HEADER_ENCODED,
                 request_id,
             ))
 
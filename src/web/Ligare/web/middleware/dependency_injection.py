@@ -19,12 +19,15 @@ from Ligare.programming.patterns.dependency_injection import (
     JSONLoggerModule,
     LoggerModule,
 )
+from Ligare.programming.startup import trace_phase
 from Ligare.web.config import Config as AppConfig
 from Ligare.web.middleware.context import (
     CorrelationIdMiddleware,
     RequestIdMiddleware,
     get_trace_id,
 )
+from Ligare.web.middleware.headers import HeaderProcessor, SecurityHeaderTemplate
+from Ligare.web.middleware.trace_id import TraceIdGenerator, create_trace_id_generator
 from starlette.types import ASGIApp, Receive, Scope, Send
 from typing_extensions import override
 
@@ -103,6 +106,19 @@ class AppModule(Module):
         binder.bind(Config, to=self._flask_app.config)
 
         app_config = binder.injector.get(AppConfig)
+
+        # compiled once so request and response handlers do not rebuild
+        # redaction patterns, header filters, or CORS/CSP headers per request.
+        binder.bind(HeaderProcessor, to=HeaderProcessor(app_config))
+        binder.bind(
+            SecurityHeaderTemplate,
+            to=SecurityHeaderTemplate(app_config.web.security),
+        )
+        # applications can bind their own TraceIdGenerator to override this.
+        binder.bind(
+            TraceIdGenerator, to=create_trace_id_generator(app_config.web.trace_id)
+        )
+
         log_level = app_config.logging.log_level.upper()
         if app_config.logging.format == "JSON":
             binder.install(WebJSONLoggerModule(self._flask_app.name, log_level))
@@ -153,17 +169,22 @@ def configure_dependencies(
         ]
 
         # bootstrap the flask application and its dependencies
-        flask_injector = FlaskInjector(flask_app, modules, app_module_injector)
+        with trace_phase("FlaskInjector"):
+            flask_injector = FlaskInjector(flask_app, modules, app_module_injector)
     else:
         app_module_injector = Injector(AppModule(app))
-        flask_injector = FlaskInjector(flask_app, injector=app_module_injector)
+        with trace_phase("FlaskInjector"):
+            flask_injector = FlaskInjector(flask_app, injector=app_module_injector)
 
     flask_injector.injector.binder.bind(Injector, flask_injector.injector)
 
     if isinstance(app, FlaskApp):
         app.add_middleware(OpenAPIEndpointDependencyInjectionMiddleware(flask_injector))
-        app.add_middleware(CorrelationIdMiddleware)
-        app.add_middleware(RequestIdMiddleware)
+        trace_id_generator = flask_injector.injector.get(TraceIdGenerator)
+        app.add_middleware(
+            CorrelationIdMiddleware, trace_id_generator=trace_id_generator
+        )
+        app.add_middleware(RequestIdMiddleware, trace_id_generator=trace_id_generator)
 
         # For every module registered, check if any are "middleware" type modules.
         # if they are, they need to be registered with the application.
@@ -180,9 +201,10 @@ def configure_dependencies(
                     module, "register_middleware", None
                 )
                 if register_callback is not None and callable(register_callback):
-                    flask_injector.injector.call_with_injection(
-                        register_callback, kwargs={"app": app}
-                    )
+                    with trace_phase(f"{type(module).__name__}.register_middleware"):
+                        flask_injector.injector.call_with_injection(
+                            register_callback, kwargs={"app": app}
+                        )
 
         # this binds all Ligare middlewares with Injector
         _configure_openapi_middleware_dependencies(app, flask_injector)
@@ -2,10 +2,9 @@
 Flask-specific integrations for :ref:`Ligare.web`.
 """
 
-import re
 import uuid
 from logging import Logger
-from typing import Awaitable, Callable, Dict, TypeAlias, TypeVar
+from typing import Awaitable, Callable, TypeAlias, TypeVar
 from uuid import uuid4
 
 from connexion import FlaskApp
@@ -16,18 +15,14 @@ from Ligare.web.middleware.context import get_trace_id
 
 from ...config import Config
 from ..consts import (
-    CONTENT_SECURITY_POLICY_HEADER,
     CORRELATION_ID_HEADER,
-    CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER,
-    CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER,
     CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER,
     HOST_HEADER,
     INCOMING_REQUEST_MESSAGE,
     ORIGIN_HEADER,
     OUTGOING_RESPONSE_MESSAGE,
-    REQUEST_COOKIE_HEADER,
-    RESPONSE_COOKIE_HEADER,
 )
+from ..headers import HeaderProcessor, SecurityHeaderTemplate
 
 # pyright: reportUnusedFunction=false
 
@@ -71,7 +66,10 @@ def bind_requesthandler(
 
 
 def _get_correlation_id(log: Logger) -> str:
-    correlation_id = get_trace_id().CorrelationId
+    trace_id = get_trace_id()
+    # the request ID has already been validated by RequestIdMiddleware
+    # when the application runs behind Connexion.
+    correlation_id = trace_id.CorrelationId or trace_id.RequestId
 
     if not correlation_id:
         correlation_id = _get_correlation_id_from_headers(log)
@@ -104,22 +102,12 @@ def _log_all_api_requests(
     request: Request,
     config: Config,
     log: Logger,
+    header_processor: HeaderProcessor,
 ):
-    request_headers_safe: dict[str, str] = dict(request.headers)
+    request_headers_safe = header_processor.safe_headers(request.headers.items())
 
     correlation_id = _get_correlation_id(log)
 
-    if (
-        request_headers_safe.get(REQUEST_COOKIE_HEADER)
-        and config.flask
-        and config.flask.session
-    ):
-        request_headers_safe[REQUEST_COOKIE_HEADER] = re.sub(
-            rf"({config.flask.session.cookie.name}=)[^;]+(;|$)",
-            r"\1<redacted>\2",
-            request_headers_safe[REQUEST_COOKIE_HEADER],
-        )
-
     log.info(
         INCOMING_REQUEST_MESSAGE,
         request.method,
@@ -137,52 +125,44 @@ def _log_all_api_requests(
 
 
 @inject
-def _ordered_api_response_handers(response: Response, config: Config, log: Logger):
-    _wrap_all_api_responses(response, config, log)
-    _log_all_api_responses(response, config, log)
+def _ordered_api_response_handers(
+    response: Response,
+    config: Config,
+    log: Logger,
+    header_processor: HeaderProcessor,
+    security_headers: SecurityHeaderTemplate,
+):
+    _wrap_all_api_responses(response, config, log, security_headers)
+    _log_all_api_responses(response, config, log, header_processor)
     return response
 
 
-def _wrap_all_api_responses(response: Response, config: Config, log: Logger):
+def _wrap_all_api_responses(
+    response: Response,
+    config: Config,
+    log: Logger,
+    security_headers: SecurityHeaderTemplate,
+):
     correlation_id = _get_correlation_id(log)
 
-    cors_domains: list[str] | None = None
-    if config.web.security.cors.origins:
-        cors_domains = config.web.security.cors.origins
-    else:
-        if not response.headers.get(CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER):
-            cors_domains = (
-                (header_value := request.headers.get(ORIGIN_HEADER))
-                and [header_value]
-                or None
-            )
-            if not cors_domains:
-                cors_domains = (
-                    (header_value := request.headers.get(HOST_HEADER))
-                    and [header_value]
-                    or None
-                )
-
-    if cors_domains:
-        # although the config allows multiple, the header may only contain one.
-        # either only one will have been set, or we take the first from the config.
-        # this may not be valid in all cases, and so the ASGI CORSMiddleware sould
-        # be used instead
-        response.headers[CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER] = cors_domains[0]
-
-    response.headers[CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER] = str(
-        config.web.security.cors.allow_credentials
+    # although the config allows multiple origins, the header may only contain one.
+    # this may not be valid in all cases, and so the ASGI CORSMiddleware sould
+    # be used instead
+    allow_origin = security_headers.allow_origin(
+        request.headers.get(ORIGIN_HEADER),
+        request.headers.get(HOST_HEADER),
+        response.headers.get(CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER),
     )
+    if allow_origin:
+        response.headers[CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER] = allow_origin
+        if security_headers.varies_by_origin:
+            # keep shared caches from serving this response to other origins
+            response.vary.add(ORIGIN_HEADER)
 
-    response.headers[CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER] = ",".join(
-        config.web.security.cors.allow_methods
-    )
+    response.headers.update(security_headers.static_headers)
 
     response.headers[CORRELATION_ID_HEADER] = correlation_id
 
-    if config.web.security.csp:
-        response.headers[CONTENT_SECURITY_POLICY_HEADER] = config.web.security.csp
-
     # if config.flask and config.flask.openapi and config.flask.openapi.use_swagger:
     #    # Use a permissive CSP for the Swagger UI
     #    # https://github.com/swagger-api/swagger-ui/issues/7540
@@ -195,21 +175,15 @@ def _wrap_all_api_responses(response: Response, config: Config, log: Logger):
     #        ] = "default-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self'; script-src 'self' 'unsafe-inline'"
 
 
-def _log_all_api_responses(response: Response, config: Config, log: Logger):
+def _log_all_api_responses(
+    response: Response,
+    config: Config,
+    log: Logger,
+    header_processor: HeaderProcessor,
+):
     correlation_id = _get_correlation_id(log)
 
-    response_headers_safe: Dict[str, str] = dict(response.headers)
-
-    if (
-        response_headers_safe.get(RESPONSE_COOKIE_HEADER)
-        and config.flask
-        and config.flask.session
-    ):
-        response_headers_safe[RESPONSE_COOKIE_HEADER] = re.sub(
-            rf"({config.flask.session.cookie.name}=)[^;]+(;|$)",
-            r"\1<redacted>\2",
-            response_headers_safe[RESPONSE_COOKIE_HEADER],
-        )
+    response_headers_safe = header_processor.safe_headers(response.headers.items())
 
     log.info(
         OUTGOING_RESPONSE_MESSAGE,
@@ -0,0 +1,196 @@
+"""
+Header processing shared by the Flask and OpenAPI request and response handlers.
+
+A :class:`HeaderProcessor` is created once, when the application is built,
+from the application :class:`Config`. Everything that does not change between
+requests, like the session cookie redaction patterns and the header allow/deny
+lists, is compiled at that point so the per-request work is limited to
+decoding and filtering the headers themselves.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from typing import Pattern
+
+from typing_extensions import final
+
+from ..config import Config, WebSecurityConfig
+from .consts import (
+    CONTENT_SECURITY_POLICY_HEADER,
+    CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER,
+    CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER,
+    REQUEST_COOKIE_HEADER,
+    RESPONSE_COOKIE_HEADER,
+)
+
+REDACTED_VALUE = "<redacted>"
+
+_REQUEST_COOKIE_HEADER_LOWER = REQUEST_COOKIE_HEADER.lower()
+_RESPONSE_COOKIE_HEADER_LOWER = RESPONSE_COOKIE_HEADER.lower()
+
+
+def decode_headers(headers: Iterable[tuple[bytes, bytes]]) -> list[tuple[str, str]]:
+    """
+    Decode raw ASGI headers.
+
+    Header names and values are always decodable as latin-1
+    (RFC 7230 section 3.2.4), so the `Content-Type` charset is not consulted.
+
+    :param Iterable[tuple[bytes, bytes]] headers: The raw headers from an ASGI scope or message.
+    :return list[tuple[str, str]]: The decoded headers.
+    """
+    return [
+        (header.decode("latin-1"), value.decode("latin-1"))
+        for (header, value) in headers
+    ]
+
+
+def compile_cookie_redaction_pattern(cookie_name: str) -> Pattern[str]:
+    """
+    Compile the pattern used to redact the value of `cookie_name`
+    from `Cookie` and `Set-Cookie` header values.
+
+    :param str cookie_name: The name of the cookie whose value is redacted.
+    :return Pattern[str]:
+    """
+    return re.compile(rf"({re.escape(cookie_name)}=)[^;]+(;|$)")
+
+
+@final
+class HeaderProcessor:
+    """
+    Decode, filter, and redact request and response headers for logging.
+    """
+
+    def __init__(self, config: Config) -> None:
+        super().__init__()
+
+        self._cookie_redaction_pattern: Pattern[str] | None = (
+            compile_cookie_redaction_pattern(config.flask.session.cookie.name)
+            if config.flask and config.flask.session
+            else None
+        )
+
+        headers_config = config.logging.headers
+        self._allow: frozenset[str] | None = (
+            None
+            if headers_config.allow is None
+            else frozenset(header.lower() for header in headers_config.allow)
+        )
+        self._deny: frozenset[str] = frozenset(
+            header.lower() for header in headers_config.deny
+        )
+
+    def _is_logged(self, header: str) -> bool:
+        lower_header = header.lower()
+        if lower_header in self._deny:
+            return False
+        return self._allow is None or lower_header in self._allow
+
+    def redact(self, header: str, value: str) -> str:
+        """
+        Redact the session cookie from a `Cookie` or `Set-Cookie` header value.
+        Values of any other header are returned unchanged.
+
+        :param str header: The header name. This is case-insensitive.
+        :param str value: The header value.
+        :return str:
+        """
+        if self._cookie_redaction_pattern is None or not value:
+            return value
+
+        lower_header = header.lower()
+        if (
+            lower_header != _REQUEST_COOKIE_HEADER_LOWER
+            and lower_header != _RESPONSE_COOKIE_HEADER_LOWER
+        ):
+            return value
+
+        return self._cookie_redaction_pattern.sub(rf"\1{REDACTED_VALUE}\2", value)
+
+    def safe_headers(
+        self, headers: Mapping[str, str] | Iterable[tuple[str, str]]
+    ) -> dict[str, str]:
+        """
+        Get the headers that are safe to log.
+
+        Headers not permitted by the configured allow/deny lists
+        are removed, and the session cookie value is redacted.
+
+        :param Mapping[str, str] | Iterable[tuple[str, str]] headers: Decoded headers.
+        :return dict[str, str]:
+        """
+        header_pairs = headers.items() if isinstance(headers, Mapping) else headers
+        return {
+            header: self.redact(header, value)
+            for (header, value) in header_pairs
+            if self._is_logged(header)
+        }
+
+    def safe_raw_headers(
+        self, headers: Iterable[tuple[bytes, bytes]]
+    ) -> dict[str, str]:
+        """
+        Decode raw ASGI headers and get the headers that are safe to log.
+
+        :param Iterable[tuple[bytes, bytes]] headers: The raw headers from an ASGI scope or message.
+        :return dict[str, str]:
+        """
+        return self.safe_headers(decode_headers(headers))
+
+
+@final
+class SecurityHeaderTemplate:
+    """
+    The CORS and CSP response headers derived from :class:`WebSecurityConfig`.
+
+    Headers whose values only depend on configuration are built once,
+    and the `Access-Control-Allow-Origin` value is the only one resolved
+    per response.
+    """
+
+    static_headers: dict[str, str]
+    """Headers set on every response."""
+
+    varies_by_origin: bool
+    """Whether `Access-Control-Allow-Origin` depends on the request's `Origin`, so responses need `Vary: Origin`."""
+
+    def __init__(self, config: WebSecurityConfig) -> None:
+        super().__init__()
+
+        cors = config.cors
+        self._allowed_origins: frozenset[str] = frozenset(cors.origins or [])
+        self._default_origin: str | None = cors.origins[0] if cors.origins else None
+        # with one configured origin, every response allows that origin
+        self.varies_by_origin = len(self._allowed_origins) != 1
+
+        self.static_headers = {
+            CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER: str(cors.allow_credentials),
+            CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER: ",".join(cors.allow_methods),
+        }
+        if config.csp:
+            self.static_headers[CONTENT_SECURITY_POLICY_HEADER] = config.csp
+
+    def allow_origin(
+        self, origin: str | None, host: str | None, response_origin: str | None
+    ) -> str | None:
+        """
+        Get the `Access-Control-Allow-Origin` value for a response.
+
+        With configured origins, the request `Origin` is used if it is one of
+        them, and otherwise the first configured origin is used. Without
+        configured origins, the request `Origin`, or else `Host`, is used
+        unless the response already has a value.
+
+        :param str | None origin: The request `Origin` header.
+        :param str | None host: The request `Host` header.
+        :param str | None response_origin: The response's existing `Access-Control-Allow-Origin` header.
+        :return str | None: The value, or None if the header should not be set.
+        """
+        if self._default_origin is not None:
+            return origin if origin in self._allowed_origins else self._default_origin
+
+        if response_origin:
+            return None
+
+        return origin or host or None
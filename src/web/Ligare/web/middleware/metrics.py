@@ -0,0 +1,288 @@
+"""
+Request latency, in-flight, and response size metrics for :ref:`Ligare.web`.
+
+Metrics are kept per worker process. All updates happen on the worker's
+event loop thread, so the structures are plain counters without locks.
+Each worker exposes its own metrics, and aggregating across workers is
+left to the scraper.
+"""
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Sequence, cast
+
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import Binder, CallableProvider, inject, singleton
+from Ligare.programming.config import AbstractConfig
+from Ligare.programming.patterns.dependency_injection import ConfigurableModule
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing_extensions import final, override
+
+from .consts import SERVER_TIMING_HEADER
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_SIZE_BUCKETS: tuple[float, ...] = (
+    100,
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+)
+
+_METRICS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+_SERVER_TIMING_HEADER_ENCODED = SERVER_TIMING_HEADER.lower().encode("latin-1")
+_CONNEXION_ROUTING_EXTENSION = "connexion_routing"
+UNMATCHED_ROUTE = "<unmatched>"
+"""The route label of requests that did not match a Connexion operation."""
+
+
+class MetricsConfig(AbstractConfig):
+    @override
+    def post_load(self) -> None:
+        return super().post_load()
+
+    # the path metrics are exposed on. `None` disables the endpoint.
+    endpoint: str | None = "/metrics"
+    server_timing: bool = False
+    latency_buckets: list[float] = list(DEFAULT_LATENCY_BUCKETS)
+    size_buckets: list[float] = list(DEFAULT_SIZE_BUCKETS)
+
+
+@final
+class Histogram:
+    """
+    A cumulative histogram with fixed upper bounds.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        super().__init__()
+        self.buckets = tuple(sorted(buckets))
+        # the last count is the `+Inf` bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        """
+        Get the `le` bound and cumulative count of each bucket, ending with `+Inf`.
+        """
+        result: list[tuple[str, int]] = []
+        total = 0
+        for bound, count in zip((*self.buckets, None), self.counts):
+            total += count
+            result.append(("+Inf" if bound is None else f"{bound:g}", total))
+        return result
+
+
+MetricsKey = tuple[str, str, int]
+"""The route, method, and status code a metric applies to."""
+
+
+@final
+class RequestMetrics:
+    """
+    Per-route, per-status request metrics for a single worker process.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        super().__init__()
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        self.in_flight = 0
+        self.latency: dict[MetricsKey, Histogram] = {}
+        self.response_size: dict[MetricsKey, Histogram] = {}
+
+    def observe(
+        self, route: str, method: str, status: int, duration: float, size: int
+    ) -> None:
+        """
+        Record a completed request.
+
+        :param str route: The Connexion operation ID, or `UNMATCHED_ROUTE` for requests Connexion does not route.
+        :param str method: The HTTP method.
+        :param int status: The response status code.
+        :param float duration: The request duration in seconds.
+        :param int size: The response body size in bytes.
+        """
+        key = (route, method, status)
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(self._latency_buckets)
+            self.response_size[key] = Histogram(self._size_buckets)
+        latency.observe(duration)
+        self.response_size[key].observe(size)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+        ]
+        for name, histograms in (
+            ("http_request_duration_seconds", self.latency),
+            ("http_response_size_bytes", self.response_size),
+        ):
+            lines.append(f"# TYPE {name} histogram")
+            for (route, method, status), histogram in histograms.items():
+                labels = f'route="{_escape_label(route)}",method="{method}",status="{status}"'
+                for bound, count in histogram.cumulative_counts():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _get_route(scope: Scope) -> str:
+    # Connexion's RoutingMiddleware stores the matched operation in the
+    # request scope. Requests without an operation, like 404s and blueprint
+    # routes registered outside of Connexion, share one label. Their paths
+    # are not used because every distinct path would add histograms.
+    routing = cast(
+        dict[str, Any],
+        scope.get("extensions", {}).get(_CONNEXION_ROUTING_EXTENSION) or {},
+    )
+    operation_id = routing.get("operation_id")
+    return str(operation_id) if operation_id else UNMATCHED_ROUTE
+
+
+@final
+class MetricsMiddleware:
+    """
+    ASGI middleware that records request metrics and serves them on the configured endpoint.
+    """
+
+    _app: ASGIApp
+
+    def __init__(
+        self, app: ASGIApp, metrics: RequestMetrics, config: MetricsConfig
+    ) -> None:
+        super().__init__()
+        self._app = app
+        self._metrics = metrics
+        self._endpoint = config.endpoint
+        self._server_timing = config.server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        if self._endpoint is not None and scope.get("path") == self._endpoint:
+            return await self._send_metrics(send)
+
+        start = perf_counter()
+        status = 500
+        size = 0
+
+        async def wrapped_send(message: Any) -> None:
+            nonlocal status
+            nonlocal size
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self._server_timing:
+                    duration_ms = (perf_counter() - start) * 1000
+                    headers = list(message.get("headers", []))
+                    headers.append((
+                        _SERVER_TIMING_HEADER_ENCODED,
+                        f"app;dur={duration_ms:.3f}".encode("latin-1"),
+                    ))
+                    message["headers"] = headers
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+
+            return await send(message)
+
+        self._metrics.in_flight += 1
+        try:
+            await self._app(scope, receive, wrapped_send)
+        finally:
+            self._metrics.in_flight -= 1
+            self._metrics.observe(
+                _get_route(scope),
+                str(scope.get("method", "")),
+                status,
+                perf_counter() - start,
+                size,
+            )
+
+    async def _send_metrics(self, send: Send) -> None:
+        body = self._metrics.render().encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", _METRICS_CONTENT_TYPE),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class MetricsMiddlewareModule(ConfigurableModule):
+    """
+    Enable request metrics and the metrics endpoint.
+    """
+
+    @override
+    @staticmethod
+    def get_config_type() -> type[AbstractConfig]:
+        return MetricsConfig
+
+    @override
+    def configure(self, binder: Binder) -> None:
+        # One instance per worker process. Every request in the worker
+        # updates it from the event loop thread.
+        binder.bind(
+            RequestMetrics,
+            to=CallableProvider(self._provide_request_metrics),
+            scope=singleton,
+        )
+
+    @inject
+    def _provide_request_metrics(self, config: MetricsConfig) -> RequestMetrics:
+        return RequestMetrics(config.latency_buckets, config.size_buckets)
+
+    @inject
+    def register_middleware(
+        self, app: FlaskApp, config: MetricsConfig, metrics: RequestMetrics
+    ):
+        # Positioned outside of Connexion's exception handling
+        # so error responses are measured too.
+        app.add_middleware(
+            MetricsMiddleware,
+            position=MiddlewarePosition.BEFORE_EXCEPTION,
+            metrics=metrics,
+            config=config,
+        )
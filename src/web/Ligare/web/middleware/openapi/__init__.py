@@ -2,7 +2,6 @@
 Connexion and OpenAPI-specific integrations for :ref:`Ligare.web`.
 """
 
-import re
 import uuid
 from collections.abc import Iterable
 from contextlib import ExitStack
@@ -14,19 +13,18 @@ from uuid import uuid4
 import starlette
 import starlette.datastructures
 import starlette.requests
-from connexion import FlaskApp, context, utils
+from connexion import FlaskApp, context
 from connexion.middleware import MiddlewarePosition
 from flask import Flask, Request, Response, request
 from flask.ctx import AppContext
 from flask.globals import _cv_app  # pyright: ignore[reportPrivateUsage]
 from flask.globals import current_app
 from flask.typing import ResponseReturnValue
-from flask_login import AnonymousUserMixin, current_user
 from injector import inject
-from Ligare.programming.collections.dict import merge
 from Ligare.web.middleware.context import (
     MiddlewareRequestDict,
     MiddlewareResponseDict,
+    get_request_id,
     get_trace_id,
 )
 from starlette.datastructures import Address
@@ -40,8 +38,11 @@ from ..consts import (
     CORRELATION_ID_HEADER,
     INCOMING_REQUEST_MESSAGE,
     OUTGOING_RESPONSE_MESSAGE,
-    REQUEST_COOKIE_HEADER,
-    RESPONSE_COOKIE_HEADER,
+)
+from ..headers import HeaderProcessor, decode_headers
+
+_CONTENT_SECURITY_POLICY_HEADER_ENCODED = CONTENT_SECURITY_POLICY_HEADER.lower().encode(
+    "latin-1"
 )
 
 # pyright: reportUnusedFunction=false
@@ -90,7 +91,7 @@ def headers_as_dict(
 def _get_correlation_id(
     request: MiddlewareRequestDict, response: MiddlewareResponseDict, log: Logger
 ) -> str:
-    correlation_id = get_trace_id().CorrelationId
+    correlation_id = get_trace_id().CorrelationId or get_request_id(request)
     if not correlation_id:
         correlation_id = _get_correlation_id_from_headers(request, response, log)
 
@@ -124,28 +125,32 @@ def _get_correlation_id_from_headers(
         raise e
 
 
+def _get_user_id(app: Flask) -> Any:
+    if not hasattr(app, "login_manager"):
+        return "Anonymous"
+
+    # flask_login is only imported by applications that use it
+    from flask_login import AnonymousUserMixin, current_user
+
+    return (
+        "Anonymous"
+        if isinstance(current_user, AnonymousUserMixin)
+        else current_user.get_id()
+    )
+
+
 @inject
 def _log_all_api_requests(
     request: MiddlewareRequestDict,
     app: Flask,
     config: Config,
     log: Logger,
+    header_processor: HeaderProcessor,
 ):
-    request_headers_safe: dict[str, str] = headers_as_dict(request)
+    request_headers_safe = header_processor.safe_raw_headers(request["headers"])
 
     correlation_id = get_trace_id().CorrelationId
 
-    if (
-        request_headers_safe.get(REQUEST_COOKIE_HEADER)
-        and config.flask
-        and config.flask.session
-    ):
-        request_headers_safe[REQUEST_COOKIE_HEADER] = re.sub(
-            rf"({config.flask.session.cookie.name}=)[^;]+(;|$)",
-            r"\1<redacted>\2",
-            request_headers_safe[REQUEST_COOKIE_HEADER],
-        )
-
     server = get_server_address()
     client = get_remote_address()
     log.info(
@@ -156,12 +161,7 @@ def _log_all_api_requests(
         # can be `None` if not available.
         f"{server.host}:{server.port}",
         f"{client.host}:{client.port}",
-        "Anonymous"
-        if (
-            isinstance(current_user, AnonymousUserMixin)
-            or not hasattr(app, "login_manager")
-        )
-        else current_user.get_id(),
+        _get_user_id(app),
         extra={
             "props": {
                 "correlation_id": correlation_id,
@@ -172,13 +172,13 @@ def _log_all_api_requests(
 
 
 def _wrap_all_api_responses(response: MiddlewareResponseDict, config: Config):
-    correlation_id = get_trace_id().CorrelationId
-    response_headers = headers_as_dict(response)
-
-    response_headers[CORRELATION_ID_HEADER] = str(correlation_id)
-
+    # RequestIdMiddleware validated the request ID once and adds it
+    # to the response headers itself, so it is not looked up again here.
     if config.web.security.csp:
-        response_headers[CONTENT_SECURITY_POLICY_HEADER] = config.web.security.csp
+        response["headers"].append((
+            _CONTENT_SECURITY_POLICY_HEADER_ENCODED,
+            config.web.security.csp.encode("latin-1"),
+        ))
 
     # if config.flask and config.flask.openapi and config.flask.openapi.use_swagger:
     #    # Use a permissive CSP for the Swagger UI
@@ -197,22 +197,12 @@ def _log_all_api_responses(
     response: MiddlewareResponseDict,
     config: Config,
     log: Logger,
+    header_processor: HeaderProcessor,
 ):
-    response_headers_safe: dict[str, str] = headers_as_dict(response)
+    response_headers_safe = header_processor.safe_raw_headers(response["headers"])
 
     correlation_id = _get_correlation_id(request, response, log)
 
-    if (
-        response_headers_safe.get(RESPONSE_COOKIE_HEADER)
-        and config.flask
-        and config.flask.session
-    ):
-        response_headers_safe[RESPONSE_COOKIE_HEADER] = re.sub(
-            rf"({config.flask.session.cookie.name}=)[^;]+(;|$)",
-            r"\1<redacted>\2",
-            response_headers_safe[RESPONSE_COOKIE_HEADER],
-        )
-
     log.info(
         OUTGOING_RESPONSE_MESSAGE,
         response["status"],
@@ -226,19 +216,6 @@ def _log_all_api_responses(
     )
 
 
-def decode_headers(headers: list[tuple[bytes, bytes]]):
-    content_type = utils.extract_content_type(headers)
-    _, encoding = utils.split_content_type(content_type)
-    if encoding is None:
-        encoding = "utf-8"
-
-    decoded_headers = [
-        (header.decode(encoding), value.decode(encoding)) for (header, value) in headers
-    ]
-
-    return decoded_headers
-
-
 def encode_headers(
     headers: list[tuple[bytes, bytes]],
     append_headers: list[tuple[str, str]],
@@ -265,6 +242,7 @@ class RequestLoggerMiddleware:
         config: Config,
         log: Logger,
         app: Flask,
+        header_processor: HeaderProcessor,
     ) -> None:
         async def wrapped_send(message: Any) -> None:
             nonlocal scope
@@ -276,7 +254,7 @@ class RequestLoggerMiddleware:
 
             request = cast(MiddlewareRequestDict, scope)
 
-            _log_all_api_requests(request, app, config, log)
+            _log_all_api_requests(request, app, config, log, header_processor)
 
             return await send(message)
 
@@ -293,7 +271,13 @@ class ResponseLoggerMiddleware:
 
     @inject
     async def __call__(
-        self, scope: Scope, receive: Receive, send: Send, config: Config, log: Logger
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        config: Config,
+        log: Logger,
+        header_processor: HeaderProcessor,
     ) -> None:
         async def wrapped_send(message: Any) -> None:
             nonlocal scope
@@ -306,7 +290,7 @@ class ResponseLoggerMiddleware:
             request = cast(MiddlewareRequestDict, scope)
             response = cast(MiddlewareResponseDict, message)
 
-            _log_all_api_responses(request, response, config, log)
+            _log_all_api_responses(request, response, config, log, header_processor)
             _wrap_all_api_responses(response, config)
 
             return await send(message)
@@ -464,19 +448,18 @@ class FlaskContextMiddleware:
                         for header, value in request_headers.items()
                     })
 
-                    request_environ = merge(
-                        dict([
-                            path_info,
-                            wsgi_url_scheme,
-                            request_method,
-                            server_name,
-                            server_port,
-                            query_string,
-                            remote_addr,
-                        ]),
-                        headers,
-                        True,
-                    )
+                    # header keys are prefixed with `HTTP_` or are `CONTENT_TYPE`
+                    # or `CONTENT_LENGTH`, so they never replace these keys
+                    request_environ = dict([
+                        path_info,
+                        wsgi_url_scheme,
+                        request_method,
+                        server_name,
+                        server_port,
+                        query_string,
+                        remote_addr,
+                    ])
+                    request_environ.update(headers)
 
                     # Some values, like the query string, are stored as bytes.
                     # Decode as a UTF-8 str so encoding later doesn't fail.
@@ -0,0 +1,75 @@
+"""
+Per-request query counts, slow query logging, and repeated query warnings for :ref:`Ligare.web`.
+
+The queries are timed by the :class:`Ligare.database.engine.instrumentation.QueryInstrumentation`
+that :class:`Ligare.database.dependency_injection.ScopedSessionModule` provides,
+when `database.instrumentation.enabled` is set. This middleware counts the
+queries of each request separately, and tags what it logs with the request's
+trace ID.
+"""
+
+from typing import Any
+
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import Module, inject
+from Ligare.database.engine.instrumentation import QueryInstrumentation
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing_extensions import final
+
+from .context import TraceId, get_trace_id
+
+
+@final
+class QueryInstrumentationMiddleware:
+    """
+    ASGI middleware that counts the queries of each request.
+    """
+
+    _app: ASGIApp
+
+    def __init__(self, app: ASGIApp, instrumentation: QueryInstrumentation) -> None:
+        super().__init__()
+        self._app = app
+        self._instrumentation = instrumentation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        # The trace ID is set by middleware that may run within this one,
+        # and is reset before this one finishes, so it is kept once the
+        # response starts for the summary logged when the request ends.
+        trace_id: TraceId | None = None
+
+        def get_tag() -> TraceId:
+            return get_trace_id() if trace_id is None else trace_id
+
+        async def wrapped_send(message: Any) -> None:
+            nonlocal trace_id
+
+            if message["type"] == "http.response.start":
+                trace_id = get_trace_id()
+
+            return await send(message)
+
+        with self._instrumentation.scope(get_tag):
+            await self._app(scope, receive, wrapped_send)
+
+
+class QueryInstrumentationMiddlewareModule(Module):
+    """
+    Count and log the queries of each request.
+
+    `ScopedSessionModule` must also be installed, with `database.instrumentation.enabled` set.
+    """
+
+    @inject
+    def register_middleware(self, app: FlaskApp, instrumentation: QueryInstrumentation):
+        # Positioned outside of Connexion's exception handling
+        # so the queries of requests that fail are counted too.
+        app.add_middleware(
+            QueryInstrumentationMiddleware,
+            position=MiddlewarePosition.BEFORE_EXCEPTION,
+            instrumentation=instrumentation,
+        )
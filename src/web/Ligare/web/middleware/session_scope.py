@@ -0,0 +1,103 @@
+"""
+Request-scoped database sessions for :ref:`Ligare.web`.
+
+Each request gets its own `Session` from the application's `ScopedSession`,
+which is closed as soon as the response starts, so its connection is returned
+to the pool before the response body is sent, and its identity map is not
+kept by the thread that served the request.
+
+The `ScopedSession` must keep its sessions per request, which
+:class:`Ligare.database.dependency_injection.ScopedSessionModule`
+does when it is given
+:func:`Ligare.database.engine.session_scope.get_session_scope`
+as its `scopefunc`.
+"""
+
+from logging import Logger
+from typing import Any
+
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import Module, inject
+from Ligare.database.engine.session_scope import (
+    is_session_scoped,
+    remove_ended_sessions,
+    remove_scoped_session,
+    session_scope,
+)
+from sqlalchemy.orm.scoping import ScopedSession
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing_extensions import final
+
+from .context import get_trace_id
+
+
+@final
+class SessionScopeMiddleware:
+    """
+    ASGI middleware that gives each request its own `Session`, and closes it when the response starts.
+
+    Changes that a request does not commit are discarded and logged. Sessions
+    that outlive their request, like those used by threads the request
+    started, are closed and logged when the request ends.
+    """
+
+    _app: ASGIApp
+
+    def __init__(
+        self, app: ASGIApp, scoped_session: ScopedSession, log: Logger
+    ) -> None:
+        super().__init__()
+        self._app = app
+        self._scoped_session = scoped_session
+        self._log = log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        async def wrapped_send(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                # the request's handler has returned, so its session is no longer used.
+                request_scope.name = get_trace_id()
+                _ = remove_scoped_session(self._scoped_session, self._log)
+
+            return await send(message)
+
+        with session_scope() as request_scope:
+            try:
+                await self._app(scope, receive, wrapped_send)
+            finally:
+                # the response may not have started if the request failed,
+                # or the session may have been used again since it started.
+                _ = remove_scoped_session(self._scoped_session, self._log)
+
+        _ = remove_ended_sessions(self._scoped_session, self._log)
+
+
+class SessionScopeMiddlewareModule(Module):
+    """
+    Give each request its own database `Session`.
+
+    Install `ScopedSessionModule(scopefunc=get_session_scope)` with this module.
+    Otherwise, the middleware is not registered.
+    """
+
+    @inject
+    def register_middleware(
+        self, app: FlaskApp, scoped_session: ScopedSession, log: Logger
+    ):
+        if not is_session_scoped(scoped_session):
+            log.warning(
+                "The ScopedSession does not keep its sessions per request, so sessions are still kept per thread. Create ScopedSessionModule with `scopefunc=get_session_scope`."
+            )
+            return
+
+        # Positioned outside of Connexion's exception handling
+        # so the sessions of requests that fail are closed too.
+        app.add_middleware(
+            SessionScopeMiddleware,
+            position=MiddlewarePosition.BEFORE_EXCEPTION,
+            scoped_session=scoped_session,
+            log=log,
+        )
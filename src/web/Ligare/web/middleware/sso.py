@@ -52,14 +52,6 @@ from Ligare.programming.config import AbstractConfig
 from Ligare.programming.patterns.dependency_injection import ConfigurableModule
 from Ligare.web.config import Config
 from Ligare.web.encryption import decrypt_flask_cookie
-from saml2.validate import (
-    MustValueError,
-    NotValid,
-    OutsideCardinality,
-    ResponseLifetimeExceed,
-    ShouldValueError,
-    ToEarly,
-)
 from starlette.types import ASGIApp, Receive, Scope, Send
 from typing_extensions import NotRequired, override
 from werkzeug.exceptions import BadRequest, Forbidden, Unauthorized
@@ -383,6 +375,15 @@ def idp_initiated(
     log.info(f"Trying to log in from SAML2 response for IDP {idp_name}")
     saml_response: str = request.form["SAMLResponse"]
 
+    from saml2.validate import (
+        MustValueError,
+        NotValid,
+        OutsideCardinality,
+        ResponseLifetimeExceed,
+        ShouldValueError,
+        ToEarly,
+    )
+
     user: UserMixin[Role] | None = None
     try:
         (username, _) = saml2_client.handle_user_login(saml_response)
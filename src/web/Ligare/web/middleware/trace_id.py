@@ -0,0 +1,174 @@
+"""
+Correlation and request ID generation and validation for :ref:`Ligare.web`.
+
+IDs are generated for every request, so generators draw their randomness
+from `os.urandom` in batches rather than making one system call per ID.
+The buffered bytes are per thread and are discarded in forked children
+so no two processes or threads ever hand out the same bytes.
+"""
+
+import os
+import re
+import threading
+import time
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from typing import Pattern
+
+from typing_extensions import final, override
+
+from ..config import WebTraceIdConfig
+
+_RANDOM_BATCH_SIZE = 4096
+
+_random_buffer = threading.local()
+_ulid_generators: "weakref.WeakSet[ULIDTraceIdGenerator]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    # a forked child must neither reuse the parent's buffered
+    # bytes nor continue the parent's ULID sequences.
+    global _random_buffer
+    _random_buffer = threading.local()
+    for generator in _ulid_generators:
+        generator._reset()  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def random_bytes(size: int) -> bytes:
+    """
+    Get `size` random bytes from a per-thread buffer filled by `os.urandom`.
+
+    :param int size: The number of bytes. Must not exceed the batch size.
+    :return bytes:
+    """
+    local = _random_buffer
+    buffer: bytes = getattr(local, "buffer", b"")
+    offset: int = getattr(local, "offset", 0)
+    if offset + size > len(buffer):
+        buffer = local.buffer = os.urandom(_RANDOM_BATCH_SIZE)
+        offset = 0
+    local.offset = offset + size
+    return buffer[offset : offset + size]
+
+
+class TraceIdGenerator(ABC):
+    """
+    Generates and validates the IDs used for the `X-Correlation-Id` header.
+    """
+
+    @abstractmethod
+    def generate(self) -> str:
+        """
+        Generate a new ID.
+        """
+
+    @abstractmethod
+    def validate(self, value: str) -> str:
+        """
+        Validate an ID received from a client.
+
+        :param str value: The received ID.
+        :raises ValueError: The ID is not in the format this generator produces.
+        :return str: The validated ID.
+        """
+
+
+_UUID_VERSION_4_MASK = ~(0xF000 << 64) & ~(0xC000 << 48)
+_UUID_VERSION_4_BITS = (0x4000 << 64) | (0x8000 << 48)
+_CANONICAL_UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+@final
+class UUID4TraceIdGenerator(TraceIdGenerator):
+    """
+    Generate random (version 4) UUIDs. This is the default.
+
+    Received IDs may be any UUID `uuid.UUID` accepts.
+    """
+
+    @override
+    def generate(self) -> str:
+        value = int.from_bytes(random_bytes(16), "big")
+        hex = "%032x" % ((value & _UUID_VERSION_4_MASK) | _UUID_VERSION_4_BITS)
+        return f"{hex[:8]}-{hex[8:12]}-{hex[12:16]}-{hex[16:20]}-{hex[20:]}"
+
+    @override
+    def validate(self, value: str) -> str:
+        # nearly every client sends the canonical form, which is
+        # cheaper to match than to parse. anything else is left
+        # to `uuid.UUID` so the accepted formats do not change.
+        if _CANONICAL_UUID_PATTERN.fullmatch(value) is None:
+            _ = uuid.UUID(value)
+        return value
+
+
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_PATTERN: Pattern[str] = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}", re.IGNORECASE)
+_ULID_RANDOM_BITS = 80
+_ULID_RANDOM_MAX = (1 << _ULID_RANDOM_BITS) - 1
+
+
+@final
+class ULIDTraceIdGenerator(TraceIdGenerator):
+    """
+    Generate monotonic `ULIDs <https://github.com/ulid/spec>`_.
+
+    ULIDs sort by the time they were generated, which keeps IDs
+    from the same period together in logs and indexes. IDs generated
+    in the same millisecond increment the random part of the previous ID.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._last_random = 0
+        _ulid_generators.add(self)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+
+    @override
+    def generate(self) -> str:
+        timestamp = time.time_ns() // 1_000_000
+        with self._lock:
+            if timestamp <= self._last_timestamp:
+                timestamp = self._last_timestamp
+                random = self._last_random + 1
+                if random > _ULID_RANDOM_MAX:
+                    timestamp += 1
+                    random = int.from_bytes(random_bytes(10), "big")
+            else:
+                random = int.from_bytes(random_bytes(10), "big")
+            self._last_timestamp = timestamp
+            self._last_random = random
+
+        value = (timestamp << _ULID_RANDOM_BITS) | random
+        return "".join(
+            _CROCKFORD_BASE32[(value >> shift) & 0x1F] for shift in range(125, -1, -5)
+        )
+
+    @override
+    def validate(self, value: str) -> str:
+        if _ULID_PATTERN.fullmatch(value) is None:
+            raise ValueError(f"badly formed ULID string: {value!r}")
+        return value
+
+
+def create_trace_id_generator(config: WebTraceIdConfig) -> TraceIdGenerator:
+    """
+    Create the generator for the configured ID format.
+
+    :param WebTraceIdConfig config: The `web.trace_id` configuration.
+    :return TraceIdGenerator:
+    """
+    if config.format == "ulid":
+        return ULIDTraceIdGenerator()
+    return UUID4TraceIdGenerator()
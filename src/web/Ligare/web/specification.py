@@ -0,0 +1,136 @@
+"""
+Loading of OpenAPI specifications for :ref:`Ligare.web`.
+
+Connexion reads, validates, and resolves the references of the
+specification every time an application starts. For large specifications
+this takes long enough to noticeably slow down starting many workers,
+so the resolved specification can be pickled to a cache directory and
+reused by every later start until the specification changes.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import platform
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from connexion.spec import Specification
+
+# files in the specification's directory that can be referenced
+# by `$ref`, and so must invalidate the cache when they change.
+_SPECIFICATION_FILE_PATTERNS = ("*.yaml", "*.yml", "*.json")
+
+_log = logging.getLogger(__name__)
+
+
+def specification_cache_key(spec_file: Path) -> str:
+    """
+    Get a key that changes whenever the specification, any specification
+    file in its directory or that directory's subdirectories, or the
+    version of Connexion or Python changes.
+
+    :param Path spec_file: The OpenAPI specification file.
+    :return str: A hex digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{version('connexion')}:{platform.python_version()}".encode())
+
+    # `$ref`s may point into subdirectories, like `schemas/`
+    spec_directory = spec_file.parent.resolve()
+    spec_files = {spec_directory / spec_file.name}
+    for pattern in _SPECIFICATION_FILE_PATTERNS:
+        spec_files.update(spec_directory.rglob(pattern))
+
+    for file in sorted(spec_files):
+        digest.update(str(file.relative_to(spec_directory)).encode())
+        digest.update(b"\0")
+        digest.update(file.read_bytes())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def load_specification(spec_file: Path, cache_dir: str | Path) -> Specification:
+    """
+    Load a resolved specification from `cache_dir`, or parse `spec_file`
+    and write it to `cache_dir` if it has not been cached yet.
+
+    The cache is written atomically, so workers starting at the same time
+    can share one cache directory. The directory must only be writable
+    by trusted users because cached specifications are unpickled.
+
+    :param Path spec_file: The OpenAPI specification file.
+    :param str | Path cache_dir: The directory to store resolved specifications in.
+    :return Specification:
+    """
+    cache_dir = Path(cache_dir)
+    cache_file = (
+        cache_dir / f"{spec_file.stem}-{specification_cache_key(spec_file)}.pickle"
+    )
+
+    try:
+        with cache_file.open("rb") as file:
+            specification = pickle.load(file)
+        if isinstance(specification, Specification):
+            return specification
+        _log.warning(f"Ignoring invalid cached OpenAPI specification {cache_file}.")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        _log.warning(
+            f"Ignoring unreadable cached OpenAPI specification {cache_file}.",
+            exc_info=e,
+        )
+
+    specification = Specification.load(spec_file)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_dir, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(specification, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, cache_file)
+    except Exception as e:
+        _log.warning(
+            f"Failed to cache OpenAPI specification to {cache_file}.", exc_info=e
+        )
+
+    return specification
+
+
+def override_connexion_specification() -> None:
+    """
+    Change how Connexion loads and clones specifications.
+
+    * Already loaded `Specification` instances can be passed to `FlaskApp.add_api`.
+    * Cloning a specification shares everything below its top-level keys with
+      the original instead of copying, validating, and resolving the whole
+      specification again. Connexion clones the specification every time
+      `openapi.json` or `openapi.yaml` is requested, and only replaces
+      top-level keys of the clone.
+    """
+    if getattr(Specification, "_ligare_overridden", False):
+        return
+
+    load = Specification.load.__func__  # pyright: ignore[reportFunctionMemberAccess]
+
+    def _load(cls: type[Specification], spec: Any, *, arguments: Any = None):
+        if isinstance(spec, Specification):
+            return spec
+        return load(cls, spec, arguments=arguments)
+
+    def clone(self: Specification):
+        spec = object.__new__(type(self))
+        spec.__dict__.update(self.__dict__)
+        spec._raw_spec = dict(self._raw_spec)  # pyright: ignore[reportAttributeAccessIssue,reportUnknownArgumentType,reportUnknownMemberType]
+        spec._spec = dict(self._spec)  # pyright: ignore[reportAttributeAccessIssue,reportUnknownArgumentType,reportUnknownMemberType]
+        return spec
+
+    Specification.load = classmethod(_load)  # pyright: ignore[reportAttributeAccessIssue]
+    Specification.clone = clone
+    Specification._ligare_overridden = True  # pyright: ignore[reportAttributeAccessIssue]
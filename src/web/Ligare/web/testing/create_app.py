@@ -32,7 +32,12 @@ from flask.sessions import SecureCookieSession
 from flask.testing import FlaskClient
 from flask_injector import FlaskInjector
 from injector import Module
-from Ligare.database.migrations.alembic.env import set_up_database
+from Ligare.database.testing import get_migrated_database_snapshot
+from Ligare.database.testing.migrations import (
+    migrate_once,
+    set_up_database_from_snapshot,
+    transactional_database,
+)
 from Ligare.identity.config import SAML2Config, SSOConfig
 from Ligare.platform.dependency_injection import UserLoaderModule
 from Ligare.platform.identity import Role, User
@@ -63,6 +68,7 @@ from pytest_mock import MockerFixture
 from pytest_mock.plugin import MockType
 from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.scoping import ScopedSession
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.testclient import TestClient
 from typing_extensions import Self
@@ -629,14 +635,26 @@ Ensure either that [openapi] is set in the [flask] config, or use the `flask_cli
         openapi_client = request.getfixturevalue("openapi_client")
 
         with openapi_client.injector.injector.get(Session) as session:
-            # Get a connection to share so Alembic does not wipe out the in-memory database
-            # when using SQLite in-memory connections
             if session.bind is None:
                 raise Exception(
                     "SQLAlchemy Session is not bound to an engine. This is not supported."
                 )
 
-            with set_up_database(session.bind.engine) as connection:
+            engine = session.bind.engine
+
+        # SQLite databases are restored from a snapshot that is migrated once.
+        # Other databases are migrated once per process, and each test runs
+        # in a transaction that is rolled back when it ends.
+        if engine.dialect.name == "sqlite":
+            with set_up_database_from_snapshot(
+                engine, get_migrated_database_snapshot(request.config)
+            ) as connection:
+                yield (openapi_client, connection)
+        else:
+            migrate_once(engine)
+            with transactional_database(
+                engine, openapi_client.injector.injector.get(ScopedSession)
+            ) as connection:
                 yield (openapi_client, connection)
 
     @pytest.fixture()
@@ -1,6 +1,21 @@
 from flask import Flask
 from flask.testing import FlaskClient
+from Ligare.programming.config.reload import ConfigReloader
+from Ligare.web.application import (
+    _subscribe_to_config_reloads,  # pyright: ignore[reportPrivateUsage]
+)
+from Ligare.web.config import (
+    Config,
+    FlaskConfig,
+    FlaskSessionConfig,
+    FlaskSessionCookieConfig,
+    LoggingConfig,
+    LoggingHeadersConfig,
+    WebConfig,
+    WebSecurityConfig,
+)
 from Ligare.web.middleware.dependency_injection import configure_dependencies
+from Ligare.web.middleware.headers import HeaderProcessor, SecurityHeaderTemplate
 from Ligare.web.testing.create_app import ClientInjector, CreateFlaskApp
 
 
@@ -12,3 +27,70 @@ class TestApplicationBuilder(CreateFlaskApp):
 
         flask_app = flask_injector.injector.get(Flask)
         assert flask_app == flask_client.client.application
+
+    def test__subscribe_to_config_reloads__replaces_config_dependencies(
+        self, flask_client: ClientInjector[FlaskClient]
+    ):
+        flask_app = flask_client.client.application
+        flask_injector = configure_dependencies(flask_app)
+        new_config = Config(
+            flask=FlaskConfig(),
+            logging=LoggingConfig(log_level="ERROR"),
+            web=WebConfig(security=WebSecurityConfig(csp="default-src 'self'")),
+        )
+        reloader = ConfigReloader(
+            Config(flask=FlaskConfig()), lambda: new_config, ["logging", "web"]
+        )
+        _subscribe_to_config_reloads(reloader, flask_app, flask_injector.injector)
+
+        assert reloader.reload()
+
+        security_headers = flask_injector.injector.get(SecurityHeaderTemplate)
+        assert security_headers.static_headers["Content-Security-Policy"] == (
+            "default-src 'self'"
+        )
+        assert flask_app.logger.level == 40
+
+    def test__subscribe_to_config_reloads__replaces_header_processor_when_logging_changes(
+        self, flask_client: ClientInjector[FlaskClient]
+    ):
+        flask_app = flask_client.client.application
+        flask_injector = configure_dependencies(flask_app)
+        new_config = Config(
+            flask=FlaskConfig(),
+            logging=LoggingConfig(headers=LoggingHeadersConfig(deny=["X-Secret"])),
+        )
+        reloader = ConfigReloader(
+            Config(flask=FlaskConfig()), lambda: new_config, ["logging", "web"]
+        )
+        _subscribe_to_config_reloads(reloader, flask_app, flask_injector.injector)
+
+        assert reloader.reload()
+
+        header_processor = flask_injector.injector.get(HeaderProcessor)
+        assert header_processor.safe_headers({"X-Secret": "foo", "X-Other": "bar"}) == {
+            "X-Other": "bar"
+        }
+
+    def test__subscribe_to_config_reloads__updates_session_cookie_when_flask_changes(
+        self, flask_client: ClientInjector[FlaskClient]
+    ):
+        flask_app = flask_client.client.application
+        flask_injector = configure_dependencies(flask_app)
+        new_config = Config(
+            flask=FlaskConfig(
+                session=FlaskSessionConfig(
+                    cookie=FlaskSessionCookieConfig(
+                        secret_key="abc123", name="new-session"
+                    )
+                )
+            )
+        )
+        reloader = ConfigReloader(
+            Config(flask=FlaskConfig()), lambda: new_config, ["flask"]
+        )
+        _subscribe_to_config_reloads(reloader, flask_app, flask_injector.injector)
+
+        assert reloader.reload()
+
+        assert flask_app.config["SESSION_COOKIE_NAME"] == "new-session"
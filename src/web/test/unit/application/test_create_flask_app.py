@@ -1,3 +1,4 @@
+import importlib.util
 import pathlib
 from pathlib import Path
 from typing import cast
@@ -241,3 +242,59 @@ class TestCreateFlaskApp(CreateFlaskApp):
             match=r"^You must set \[flask\] in the application configuration\.",
         ):
             _ = next(flask_client_configurable(Config()))
+
+    def test__CreateFlaskApp__configure_blueprint_routes__names_modules_after_file(
+        self, tmp_path: Path, mocker: MockerFixture
+    ):
+        mocker.stop(
+            self._automatic_mocks["Ligare.web.application._import_blueprint_modules"]
+        )
+        mocker.stop(self._automatic_mocks["io.open"])
+        self._automatic_mocks[
+            "Ligare.web.application._get_program_dir"
+        ].return_value = str(tmp_path)
+        endpoints = tmp_path / "endpoints"
+        endpoints.mkdir()
+        _ = (endpoints / "happy.py").write_text(
+            "from flask import Blueprint\n"
+            "happy_blueprint = Blueprint(__name__, __name__)\n"
+        )
+
+        flask_app = configure_blueprint_routes(
+            Config(flask=FlaskConfig(app_name="app_name"))
+        )
+
+        assert list(flask_app.blueprints) == ["happy"]
+
+    def test__CreateFlaskApp__configure_blueprint_routes__with_manifest_skips_unchanged_files_without_blueprints(
+        self, tmp_path: Path, mocker: MockerFixture
+    ):
+        mocker.stop(
+            self._automatic_mocks["Ligare.web.application._import_blueprint_modules"]
+        )
+        mocker.stop(self._automatic_mocks["io.open"])
+        self._automatic_mocks[
+            "Ligare.web.application._get_program_dir"
+        ].return_value = str(tmp_path)
+        endpoints = tmp_path / "endpoints"
+        endpoints.mkdir()
+        _ = (endpoints / "api.py").write_text(
+            "from flask import Blueprint\napi_blueprint = Blueprint('api', __name__)\n"
+        )
+        helpers = endpoints / "helpers.py"
+        _ = helpers.write_text("executions = []\n")
+        config = Config(flask=FlaskConfig(app_name="app_name", blueprint_manifest=True))
+
+        _ = configure_blueprint_routes(config)
+        exec_spy = mocker.spy(importlib.util, "spec_from_file_location")  # pyright: ignore[reportUnknownMemberType]
+        flask_app = configure_blueprint_routes(config)
+
+        assert list(flask_app.blueprints) == ["api"]
+        assert [call.args[0] for call in exec_spy.call_args_list] == ["api"]
+
+        _ = helpers.write_text(
+            "from flask import Blueprint\nhelpers_blueprint = Blueprint('helpers', __name__)\n"
+        )
+        flask_app = configure_blueprint_routes(config)
+
+        assert sorted(flask_app.blueprints) == ["api", "helpers"]
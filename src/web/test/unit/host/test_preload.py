@@ -0,0 +1,49 @@
+from typing import Generator
+
+import pytest
+from Ligare.web.host import preload
+from mock import MagicMock
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture(autouse=True)
+def _clear_post_fork_callbacks() -> Generator[None, None, None]:
+    callbacks = list(preload._post_fork_callbacks)  # pyright: ignore[reportPrivateUsage]
+    yield
+    preload._post_fork_callbacks[:] = callbacks  # pyright: ignore[reportPrivateUsage]
+
+
+def test__preload__enables_gunicorn_preload_app():
+    assert preload.preload_app is True
+
+
+def test__pre_fork__freezes_garbage_collector(mocker: MockerFixture):
+    freeze_mock = mocker.patch("Ligare.web.host.preload.gc.freeze")
+
+    preload.pre_fork(MagicMock(), MagicMock())
+
+    freeze_mock.assert_called_once()
+
+
+def test__post_fork__runs_callbacks_in_registration_order():
+    calls: list[int] = []
+
+    @preload.register_post_fork
+    def first():
+        calls.append(1)
+
+    _ = preload.register_post_fork(lambda: calls.append(2))
+
+    preload.post_fork(MagicMock(), MagicMock(pid=123))
+
+    assert calls == [1, 2]
+
+
+def test__unregister_post_fork__stops_running_callback():
+    callback = MagicMock()
+    _ = preload.register_post_fork(callback)
+    preload.unregister_post_fork(callback)
+
+    preload.run_post_fork_callbacks()
+
+    callback.assert_not_called()
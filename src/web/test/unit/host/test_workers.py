@@ -0,0 +1,13 @@
+from Ligare.web.host import LifespanUvicornWorker, ProxiedUvicornWorker
+from uvicorn.workers import UvicornWorker
+
+
+def test__LifespanUvicornWorker__enables_lifespan_without_changing_UvicornWorker():
+    assert LifespanUvicornWorker.CONFIG_KWARGS["lifespan"] == "on"
+    assert "lifespan" not in UvicornWorker.CONFIG_KWARGS
+
+
+def test__ProxiedUvicornWorker__enables_proxy_headers_and_lifespan():
+    assert ProxiedUvicornWorker.CONFIG_KWARGS["lifespan"] == "on"
+    assert ProxiedUvicornWorker.CONFIG_KWARGS["proxy_headers"] is True
+    assert "proxy_headers" not in LifespanUvicornWorker.CONFIG_KWARGS
@@ -82,6 +82,31 @@ class TestApiResponseHandlers(CreateFlaskApp):
         header_value = response.headers.get(header)
         assert header_value == ",".join(value) if isinstance(value, list) else value
 
+    @pytest.mark.parametrize(
+        "origins,vary",
+        [
+            (["https://a.example.com"], None),
+            (["https://a.example.com", "https://b.example.com"], "Origin"),
+        ],
+    )
+    def test__wrap_all_api_responses__sets_Vary_header_when_origin_depends_on_request(
+        self,
+        origins: list[str],
+        vary: str | None,
+        flask_client_configurable: FlaskClientInjectorConfigurable,
+        basic_config: Config,
+    ):
+        basic_config.web.security.cors.origins = origins
+        flask_client = next(flask_client_configurable(basic_config))
+        response = flask_client.client.get(
+            "/", headers={"Origin": "https://a.example.com"}
+        )
+        assert (
+            response.headers.get(CORS_ACCESS_CONTROL_ALLOW_ORIGIN_HEADER)
+            == "https://a.example.com"
+        )
+        assert response.headers.get("Vary") == vary
+
     def test__log_all_api_responses__logs_response_information(
         self,
         flask_client: FlaskClientInjector,
@@ -0,0 +1,210 @@
+import asyncio
+import gzip
+from typing import Any
+
+import pytest
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import Injector
+from Ligare.programming.dependency_injection import ConfigModule
+from Ligare.web.middleware.compression import (
+    CompressionConfig,
+    CompressionMiddleware,
+    CompressionMiddlewareModule,
+    select_encoding,
+)
+from mock import MagicMock
+from starlette.types import Receive, Scope, Send
+
+_JSON_BODY = b'{"foo": "' + b"bar" * 1000 + b'"}'
+
+
+def _http_scope(path: str = "/foo", accept_encoding: bytes | None = b"gzip") -> Scope:
+    headers: list[tuple[bytes, bytes]] = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding))
+    return {"type": "http", "method": "GET", "path": path, "headers": headers}
+
+
+def _app(
+    chunks: list[bytes],
+    content_type: bytes = b"application/json",
+    status: int = 200,
+    headers: list[tuple[bytes, bytes]] | None = None,
+):
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(sum(map(len, chunks))).encode()),
+                *(headers or []),
+            ],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": index < len(chunks) - 1,
+            })
+
+    return app
+
+
+def _run(middleware: CompressionMiddleware, scope: Scope) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    asyncio.run(middleware(scope, MagicMock(), send))
+    return messages
+
+
+def _headers(message: dict[str, Any]) -> dict[bytes, bytes]:
+    return dict(message["headers"])
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip;q=0.1", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        ("gzip;q=0", None),
+    ],
+)
+def test__select_encoding__uses_quality_then_preference(
+    accept_encoding: str, expected: str | None
+):
+    assert select_encoding(accept_encoding, ["br", "gzip"]) == expected
+
+
+def test__CompressionMiddleware__compresses_whole_body():
+    middleware = CompressionMiddleware(_app([_JSON_BODY]), CompressionConfig())
+
+    messages = _run(middleware, _http_scope())
+
+    headers = _headers(messages[0])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert int(headers[b"content-length"]) == len(messages[1]["body"])
+    assert gzip.decompress(messages[1]["body"]) == _JSON_BODY
+
+
+def test__CompressionMiddleware__compresses_streamed_body():
+    chunks = [_JSON_BODY[:1000], _JSON_BODY[1000:2000], _JSON_BODY[2000:]]
+    middleware = CompressionMiddleware(_app(chunks), CompressionConfig())
+
+    messages = _run(middleware, _http_scope())
+
+    headers = _headers(messages[0])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert [message["more_body"] for message in messages[1:]] == [True, True, False]
+    assert all(message["body"] for message in messages[1:])
+    assert (
+        gzip.decompress(b"".join(message["body"] for message in messages[1:]))
+        == _JSON_BODY
+    )
+
+
+@pytest.mark.parametrize(
+    "app,scope",
+    [
+        (_app([b"{}"]), _http_scope()),
+        (_app([_JSON_BODY], content_type=b"image/png"), _http_scope()),
+        (_app([_JSON_BODY]), _http_scope(accept_encoding=None)),
+        (_app([_JSON_BODY]), _http_scope(accept_encoding=b"identity")),
+        (_app([b""], status=304), _http_scope()),
+        (_app([_JSON_BODY], status=206), _http_scope()),
+        (
+            _app([_JSON_BODY], headers=[(b"content-range", b"bytes 0-99/*")]),
+            _http_scope(),
+        ),
+    ],
+    ids=[
+        "too small",
+        "not allowed",
+        "not accepted",
+        "identity",
+        "no body",
+        "partial content",
+        "content range",
+    ],
+)
+def test__CompressionMiddleware__does_not_compress(app: Any, scope: Scope):
+    middleware = CompressionMiddleware(app, CompressionConfig())
+
+    messages = _run(middleware, scope)
+
+    assert b"content-encoding" not in _headers(messages[0])
+
+
+@pytest.mark.parametrize(
+    "etag,expected",
+    [(b'"abc"', b'W/"abc"'), (b'W/"abc"', b'W/"abc"')],
+    ids=["strong", "weak"],
+)
+def test__CompressionMiddleware__weakens_etag_of_compressed_body(
+    etag: bytes, expected: bytes
+):
+    middleware = CompressionMiddleware(
+        _app([_JSON_BODY], headers=[(b"etag", etag)]), CompressionConfig()
+    )
+
+    messages = _run(middleware, _http_scope())
+
+    assert _headers(messages[0])[b"etag"] == expected
+
+
+def test__CompressionMiddleware__caches_compressed_bodies_for_cache_paths():
+    middleware = CompressionMiddleware(
+        _app([_JSON_BODY]), CompressionConfig(cache_paths=["/openapi.json"])
+    )
+
+    first = _run(middleware, _http_scope("/openapi.json"))
+    second = _run(middleware, _http_scope("/openapi.json"))
+
+    # the second body is the cached object rather than a new compression
+    assert first[1]["body"] is second[1]["body"]
+
+
+@pytest.mark.parametrize(
+    "module_name,encoding", [("brotli", b"br"), ("zstandard", b"zstd")]
+)
+def test__CompressionMiddleware__uses_optional_encodings(
+    module_name: str, encoding: bytes
+):
+    module = pytest.importorskip(module_name)
+    middleware = CompressionMiddleware(_app([_JSON_BODY]), CompressionConfig())
+
+    messages = _run(middleware, _http_scope(accept_encoding=encoding))
+
+    assert _headers(messages[0])[b"content-encoding"] == encoding
+    if module_name == "brotli":
+        assert module.decompress(messages[1]["body"]) == _JSON_BODY
+    else:
+        assert (
+            module.ZstdDecompressor().decompressobj().decompress(messages[1]["body"])
+            == _JSON_BODY
+        )
+
+
+def test__CompressionMiddlewareModule__registers_middleware():
+    config = CompressionConfig(minimum_size=1)
+    module = CompressionMiddlewareModule()
+    injector = Injector([ConfigModule(config, CompressionConfig), module])
+    app = MagicMock(spec=FlaskApp)
+
+    injector.call_with_injection(module.register_middleware, kwargs={"app": app})
+
+    app.add_middleware.assert_called_once_with(
+        CompressionMiddleware,
+        position=MiddlewarePosition.BEFORE_EXCEPTION,
+        config=config,
+    )
@@ -0,0 +1,193 @@
+import pytest
+from Ligare.web.config import (
+    Config,
+    FlaskConfig,
+    FlaskSessionConfig,
+    FlaskSessionCookieConfig,
+    LoggingConfig,
+    LoggingHeadersConfig,
+    WebSecurityConfig,
+    WebSecurityCorsConfig,
+)
+from Ligare.web.middleware.consts import (
+    CONTENT_SECURITY_POLICY_HEADER,
+    CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER,
+    CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER,
+)
+from Ligare.web.middleware.headers import (
+    HeaderProcessor,
+    SecurityHeaderTemplate,
+    decode_headers,
+)
+
+
+def _config(
+    cookie_name: str | None = "session",
+    allow: list[str] | None = None,
+    deny: list[str] | None = None,
+):
+    return Config(
+        logging=LoggingConfig(
+            headers=LoggingHeadersConfig(allow=allow, deny=deny or [])
+        ),
+        flask=FlaskConfig(
+            session=None
+            if cookie_name is None
+            else FlaskSessionConfig(
+                cookie=FlaskSessionCookieConfig(name=cookie_name, secret_key="abc")
+            )
+        ),
+    )
+
+
+def test__decode_headers__decodes_as_latin_1():
+    assert decode_headers([(b"x-name", "café".encode("latin-1"))]) == [
+        ("x-name", "café")
+    ]
+
+
+@pytest.mark.parametrize("header", ["Cookie", "cookie", "Set-Cookie", "set-cookie"])
+def test__HeaderProcessor__redacts_session_cookie(header: str):
+    header_processor = HeaderProcessor(_config())
+
+    headers = header_processor.safe_headers({header: "foo=1; session=abc123; bar=2"})
+
+    assert headers[header] == "foo=1; session=<redacted>; bar=2"
+
+
+def test__HeaderProcessor__redacts_session_cookie_at_end_of_value():
+    header_processor = HeaderProcessor(_config())
+
+    headers = header_processor.safe_raw_headers([(b"cookie", b"session=abc123")])
+
+    assert headers["cookie"] == "session=<redacted>"
+
+
+def test__HeaderProcessor__escapes_cookie_name():
+    header_processor = HeaderProcessor(_config(cookie_name="a.b"))
+
+    headers = header_processor.safe_headers({"Cookie": "aXb=1; a.b=2"})
+
+    assert headers["Cookie"] == "aXb=1; a.b=<redacted>"
+
+
+def test__HeaderProcessor__does_not_redact_without_session_config():
+    header_processor = HeaderProcessor(_config(cookie_name=None))
+
+    headers = header_processor.safe_headers({"Cookie": "session=abc123"})
+
+    assert headers["Cookie"] == "session=abc123"
+
+
+def test__HeaderProcessor__does_not_redact_other_headers():
+    header_processor = HeaderProcessor(_config())
+
+    headers = header_processor.safe_headers({"X-Session": "session=abc123"})
+
+    assert headers["X-Session"] == "session=abc123"
+
+
+def test__HeaderProcessor__removes_denied_headers():
+    header_processor = HeaderProcessor(_config(deny=["Authorization"]))
+
+    headers = header_processor.safe_headers([
+        ("authorization", "Bearer abc"),
+        ("Host", "example.com"),
+    ])
+
+    assert headers == {"Host": "example.com"}
+
+
+def test__HeaderProcessor__keeps_only_allowed_headers():
+    header_processor = HeaderProcessor(_config(allow=["host", "X-Correlation-Id"]))
+
+    headers = header_processor.safe_headers({
+        "Host": "example.com",
+        "x-correlation-id": "abc",
+        "User-Agent": "test",
+    })
+
+    assert headers == {"Host": "example.com", "x-correlation-id": "abc"}
+
+
+def test__HeaderProcessor__deny_takes_precedence_over_allow():
+    header_processor = HeaderProcessor(_config(allow=["Host"], deny=["host"]))
+
+    headers = header_processor.safe_headers({"Host": "example.com"})
+
+    assert headers == {}
+
+
+def test__SecurityHeaderTemplate__builds_static_headers():
+    template = SecurityHeaderTemplate(
+        WebSecurityConfig(
+            cors=WebSecurityCorsConfig(allow_credentials=True, allow_methods=["GET"]),
+            csp="default-src 'self'",
+        )
+    )
+
+    assert template.static_headers == {
+        CORS_ACCESS_CONTROL_ALLOW_CREDENTIALS_HEADER: "True",
+        CORS_ACCESS_CONTROL_ALLOW_METHODS_HEADER: "GET",
+        CONTENT_SECURITY_POLICY_HEADER: "default-src 'self'",
+    }
+
+
+@pytest.mark.parametrize(
+    "origin,expected",
+    [
+        ("https://b.example.com", "https://b.example.com"),
+        ("https://c.example.com", "https://a.example.com"),
+        (None, "https://a.example.com"),
+    ],
+)
+def test__SecurityHeaderTemplate__allow_origin__uses_configured_origins(
+    origin: str | None, expected: str
+):
+    template = SecurityHeaderTemplate(
+        WebSecurityConfig(
+            cors=WebSecurityCorsConfig(
+                origins=["https://a.example.com", "https://b.example.com"]
+            )
+        )
+    )
+
+    assert template.allow_origin(origin, "localhost", None) == expected
+
+
+@pytest.mark.parametrize(
+    "origin,host,response_origin,expected",
+    [
+        ("https://a.example.com", "localhost", None, "https://a.example.com"),
+        (None, "localhost", None, "localhost"),
+        (None, None, None, None),
+        ("https://a.example.com", "localhost", "https://b.example.com", None),
+    ],
+)
+def test__SecurityHeaderTemplate__allow_origin__uses_request_without_configured_origins(
+    origin: str | None,
+    host: str | None,
+    response_origin: str | None,
+    expected: str | None,
+):
+    template = SecurityHeaderTemplate(WebSecurityConfig())
+
+    assert template.allow_origin(origin, host, response_origin) == expected
+
+
+@pytest.mark.parametrize(
+    "origins,expected",
+    [
+        (None, True),
+        (["https://a.example.com"], False),
+        (["https://a.example.com", "https://b.example.com"], True),
+    ],
+)
+def test__SecurityHeaderTemplate__varies_by_origin_unless_one_origin_is_configured(
+    origins: list[str] | None, expected: bool
+):
+    template = SecurityHeaderTemplate(
+        WebSecurityConfig(cors=WebSecurityCorsConfig(origins=origins))
+    )
+
+    assert template.varies_by_origin == expected
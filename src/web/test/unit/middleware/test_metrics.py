@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any
+
+import pytest
+from connexion import FlaskApp
+from connexion.middleware import MiddlewarePosition
+from injector import Injector
+from Ligare.programming.dependency_injection import ConfigModule
+from Ligare.web.middleware.metrics import (
+    UNMATCHED_ROUTE,
+    Histogram,
+    MetricsConfig,
+    MetricsMiddleware,
+    MetricsMiddlewareModule,
+    RequestMetrics,
+)
+from mock import MagicMock
+from starlette.types import Receive, Scope, Send
+
+
+def _http_scope(path: str = "/foo", operation_id: str | None = None) -> Scope:
+    scope: Scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+    if operation_id is not None:
+        scope["extensions"] = {"connexion_routing": {"operation_id": operation_id}}
+    return scope
+
+
+def _app(status: int = 200, body: bytes = b"hello"):
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def _run(middleware: MetricsMiddleware, scope: Scope) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    return messages
+
+
+def test__Histogram__observe__counts_values_in_inclusive_buckets():
+    histogram = Histogram([1, 2])
+
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [("1", 2), ("2", 3), ("+Inf", 4)]
+    assert histogram.sum == 6
+    assert histogram.count == 4
+
+
+def test__MetricsMiddleware__records_latency_and_size_per_route_and_status():
+    metrics = RequestMetrics()
+    middleware = MetricsMiddleware(_app(201, b"12345"), metrics, MetricsConfig())
+
+    _ = _run(middleware, _http_scope(operation_id="app.get_foo"))
+
+    assert metrics.latency[("app.get_foo", "GET", 201)].count == 1
+    assert metrics.response_size[("app.get_foo", "GET", 201)].sum == 5
+    assert metrics.in_flight == 0
+
+
+def test__MetricsMiddleware__uses_one_route_when_no_operation_is_routed():
+    metrics = RequestMetrics()
+    middleware = MetricsMiddleware(_app(), metrics, MetricsConfig())
+
+    _ = _run(middleware, _http_scope("/bar"))
+    _ = _run(middleware, _http_scope("/baz"))
+
+    assert list(metrics.latency) == [(UNMATCHED_ROUTE, "GET", 200)]
+    assert metrics.latency[(UNMATCHED_ROUTE, "GET", 200)].count == 2
+
+
+def test__MetricsMiddleware__records_500_when_app_raises():
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        raise ZeroDivisionError()
+
+    metrics = RequestMetrics()
+    middleware = MetricsMiddleware(app, metrics, MetricsConfig())
+
+    with pytest.raises(ZeroDivisionError):
+        _ = _run(middleware, _http_scope())
+
+    assert (UNMATCHED_ROUTE, "GET", 500) in metrics.latency
+    assert metrics.in_flight == 0
+
+
+@pytest.mark.parametrize("server_timing", [True, False])
+def test__MetricsMiddleware__adds_Server_Timing_header_when_configured(
+    server_timing: bool,
+):
+    middleware = MetricsMiddleware(
+        _app(), RequestMetrics(), MetricsConfig(server_timing=server_timing)
+    )
+
+    messages = _run(middleware, _http_scope())
+
+    header_names = [header for (header, _) in messages[0]["headers"]]
+    assert (b"server-timing" in header_names) == server_timing
+
+
+def test__MetricsMiddleware__serves_metrics_on_endpoint():
+    metrics = RequestMetrics()
+    metrics.observe("app.get_foo", "GET", 200, 0.2, 10)
+    app = MagicMock()
+    middleware = MetricsMiddleware(app, metrics, MetricsConfig(endpoint="/metrics"))
+
+    messages = _run(middleware, _http_scope("/metrics"))
+
+    assert not app.called
+    assert messages[0]["status"] == 200
+    body = messages[1]["body"].decode()
+    assert "http_requests_in_flight 0" in body
+    assert (
+        'http_request_duration_seconds_bucket{route="app.get_foo",method="GET",status="200",le="0.25"} 1'
+        in body
+    )
+    assert (
+        'http_response_size_bytes_count{route="app.get_foo",method="GET",status="200"} 1'
+        in body
+    )
+
+
+def test__MetricsMiddleware__does_not_serve_metrics_when_endpoint_is_disabled():
+    metrics = RequestMetrics()
+    middleware = MetricsMiddleware(_app(), metrics, MetricsConfig(endpoint=None))
+
+    messages = _run(middleware, _http_scope("/metrics"))
+
+    assert messages[1]["body"] == b"hello"
+    assert (UNMATCHED_ROUTE, "GET", 200) in metrics.latency
+
+
+def test__MetricsMiddlewareModule__registers_middleware():
+    config = MetricsConfig(latency_buckets=[1.0])
+    module = MetricsMiddlewareModule()
+    injector = Injector([ConfigModule(config, MetricsConfig), module])
+    app = MagicMock(spec=FlaskApp)
+
+    injector.call_with_injection(module.register_middleware, kwargs={"app": app})
+
+    app.add_middleware.assert_called_once_with(
+        MetricsMiddleware,
+        position=MiddlewarePosition.BEFORE_EXCEPTION,
+        metrics=injector.get(RequestMetrics),
+        config=config,
+    )
+    assert injector.get(RequestMetrics) is injector.get(RequestMetrics)
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any
+
+from connexion.middleware import MiddlewarePosition
+from Ligare.database.config import DatabaseInstrumentationConfig
+from Ligare.database.engine.instrumentation import QueryInstrumentation, QueryStats
+from Ligare.web.middleware.context import (
+    _request_id_ctx_var,  # pyright: ignore[reportPrivateUsage]
+)
+from Ligare.web.middleware.context import RequestId
+from Ligare.web.middleware.query_instrumentation import (
+    QueryInstrumentationMiddleware,
+    QueryInstrumentationMiddlewareModule,
+)
+from mock import MagicMock
+from starlette.types import Receive, Scope, Send
+
+
+def _run(middleware: Any, scope: Scope) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    return messages
+
+
+def test__QueryInstrumentationMiddleware__scopes_each_request_and_tags_it_with_the_trace_id():
+    instrumentation = QueryInstrumentation(DatabaseInstrumentationConfig())
+    request_stats: list[QueryStats | None] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        # the request ID is set, and reset, by middleware within this one
+        token = _request_id_ctx_var.set(RequestId("request-id"))
+        request_stats.append(instrumentation.current)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+        _request_id_ctx_var.reset(token)
+
+    middleware = QueryInstrumentationMiddleware(app, instrumentation)
+
+    _ = _run(middleware, {"type": "http", "path": "/", "headers": []})
+    _ = _run(middleware, {"type": "http", "path": "/", "headers": []})
+
+    first, second = request_stats
+    assert first is not None and second is not None
+    assert first is not second
+    assert first.tag.RequestId == "request-id"
+    assert instrumentation.current is None
+
+
+def test__QueryInstrumentationMiddleware__ignores_non_http_requests():
+    instrumentation = QueryInstrumentation(DatabaseInstrumentationConfig())
+    request_stats: list[QueryStats | None] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request_stats.append(instrumentation.current)
+
+    middleware = QueryInstrumentationMiddleware(app, instrumentation)
+
+    _ = _run(middleware, {"type": "lifespan"})
+
+    assert request_stats == [None]
+
+
+def test__QueryInstrumentationMiddlewareModule__registers_middleware():
+    app = MagicMock()
+    instrumentation = QueryInstrumentation()
+
+    QueryInstrumentationMiddlewareModule().register_middleware(app, instrumentation)
+
+    app.add_middleware.assert_called_once_with(
+        QueryInstrumentationMiddleware,
+        position=MiddlewarePosition.BEFORE_EXCEPTION,
+        instrumentation=instrumentation,
+    )
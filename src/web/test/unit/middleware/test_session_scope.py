@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+from connexion.middleware import MiddlewarePosition
+from Ligare.database.engine import DatabaseEngine
+from Ligare.database.engine.session_scope import get_session_scope
+from Ligare.web.middleware.session_scope import (
+    SessionScopeMiddleware,
+    SessionScopeMiddlewareModule,
+)
+from mock import MagicMock
+from sqlalchemy import text
+from sqlalchemy.orm.scoping import ScopedSession
+from starlette.types import Receive, Scope, Send
+
+
+@pytest.fixture()
+def scoped_session():
+    scoped_session = DatabaseEngine.get_session_from_connection_string(
+        "sqlite:///:memory:?check_same_thread=False", scopefunc=get_session_scope
+    )
+    yield scoped_session
+    scoped_session.remove()
+
+
+def _run(middleware: Any, scope: Scope | None = None) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    asyncio.run(
+        middleware(scope or {"type": "http", "path": "/", "headers": []}, receive, send)
+    )
+    return messages
+
+
+def test__SessionScopeMiddleware__gives_each_request_its_own_session(
+    scoped_session: ScopedSession,
+):
+    sessions: list[Any] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        sessions.append(scoped_session())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = SessionScopeMiddleware(app, scoped_session, logging.getLogger())
+
+    _ = _run(middleware)
+    _ = _run(middleware)
+
+    assert sessions[0] is not sessions[1]
+
+
+def test__SessionScopeMiddleware__closes_the_session_when_the_response_starts(
+    scoped_session: ScopedSession,
+):
+    in_transaction: list[bool] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        session = scoped_session()
+        _ = session.execute(text("SELECT 1"))
+        in_transaction.append(session.in_transaction())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        in_transaction.append(session.in_transaction())
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = SessionScopeMiddleware(app, scoped_session, logging.getLogger())
+
+    _ = _run(middleware)
+
+    assert in_transaction == [True, False]
+
+
+def test__SessionScopeMiddleware__closes_the_session_when_the_request_fails(
+    scoped_session: ScopedSession,
+):
+    sessions: list[Any] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        session = scoped_session()
+        _ = session.execute(text("SELECT 1"))
+        sessions.append(session)
+        raise RuntimeError()
+
+    middleware = SessionScopeMiddleware(app, scoped_session, logging.getLogger())
+
+    with pytest.raises(RuntimeError):
+        _ = _run(middleware)
+
+    assert not sessions[0].in_transaction()
+
+
+def test__SessionScopeMiddleware__ignores_non_http_requests(
+    scoped_session: ScopedSession,
+):
+    sessions: list[Any] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        sessions.append(scoped_session())
+
+    middleware = SessionScopeMiddleware(app, scoped_session, logging.getLogger())
+
+    _ = _run(middleware, {"type": "lifespan"})
+
+    assert sessions[0] is scoped_session()
+
+
+def test__SessionScopeMiddlewareModule__registers_middleware(
+    scoped_session: ScopedSession,
+):
+    app = MagicMock()
+    log = logging.getLogger()
+
+    SessionScopeMiddlewareModule().register_middleware(app, scoped_session, log)
+
+    app.add_middleware.assert_called_once_with(
+        SessionScopeMiddleware,
+        position=MiddlewarePosition.BEFORE_EXCEPTION,
+        scoped_session=scoped_session,
+        log=log,
+    )
+
+
+def test__SessionScopeMiddlewareModule__does_not_register_middleware_for_thread_local_sessions(
+    caplog: pytest.LogCaptureFixture,
+):
+    app = MagicMock()
+
+    with caplog.at_level(logging.WARNING):
+        SessionScopeMiddlewareModule().register_middleware(
+            app,
+            DatabaseEngine.get_session_from_connection_string("sqlite://"),
+            logging.getLogger(),
+        )
+
+    app.add_middleware.assert_not_called()
+    assert "scopefunc=get_session_scope" in caplog.text
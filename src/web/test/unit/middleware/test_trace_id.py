@@ -0,0 +1,131 @@
+import asyncio
+import uuid
+from typing import Any
+
+import pytest
+from Ligare.web.config import WebTraceIdConfig
+from Ligare.web.middleware.context import (
+    RequestIdMiddleware,
+    get_request_id,
+    get_trace_id,
+)
+from Ligare.web.middleware.trace_id import (
+    ULIDTraceIdGenerator,
+    UUID4TraceIdGenerator,
+    create_trace_id_generator,
+)
+from mock import MagicMock
+from starlette.types import Receive, Scope, Send
+
+
+def test__UUID4TraceIdGenerator__generate__creates_version_4_UUIDs():
+    generator = UUID4TraceIdGenerator()
+
+    ids = [generator.generate() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    for id in ids:
+        parsed = uuid.UUID(id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == id
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "5fd5c1a4-1a3f-4a3f-9ccd-3d1d2a1b7a4e",
+        "5FD5C1A4-1A3F-4A3F-9CCD-3D1D2A1B7A4E",
+        "5fd5c1a41a3f4a3f9ccd3d1d2a1b7a4e",
+        "{5fd5c1a4-1a3f-4a3f-9ccd-3d1d2a1b7a4e}",
+    ],
+)
+def test__UUID4TraceIdGenerator__validate__accepts_UUIDs(value: str):
+    assert UUID4TraceIdGenerator().validate(value) == value
+
+
+@pytest.mark.parametrize("value", ["abc123", "5fd5c1a4-1a3f-4a3f-9ccd-3d1d2a1b7a4g"])
+def test__UUID4TraceIdGenerator__validate__rejects_invalid_values(value: str):
+    with pytest.raises(ValueError):
+        _ = UUID4TraceIdGenerator().validate(value)
+
+
+def test__ULIDTraceIdGenerator__generate__creates_monotonic_ULIDs():
+    generator = ULIDTraceIdGenerator()
+
+    ids = [generator.generate() for _ in range(1000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    for id in ids:
+        assert generator.validate(id) == id
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["abc123", "81ARZ3NDEKTSV4RRFFQ69G5FAV", "01ARZ3NDEKTSV4RRFFQ69G5FAU"],
+)
+def test__ULIDTraceIdGenerator__validate__rejects_invalid_values(value: str):
+    with pytest.raises(ValueError):
+        _ = ULIDTraceIdGenerator().validate(value)
+
+
+@pytest.mark.parametrize(
+    "format,generator_type",
+    [("uuid4", UUID4TraceIdGenerator), ("ulid", ULIDTraceIdGenerator)],
+)
+def test__create_trace_id_generator__uses_configured_format(
+    format: Any, generator_type: type
+):
+    generator = create_trace_id_generator(WebTraceIdConfig(format=format))
+
+    assert isinstance(generator, generator_type)
+
+
+def _run_request_id_middleware(
+    headers: list[tuple[bytes, bytes]],
+) -> tuple[Scope, list[Any], Any]:
+    scope: Scope = {"type": "http", "headers": headers}
+    messages: list[Any] = []
+    seen_trace_id: Any = None
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        nonlocal seen_trace_id
+        seen_trace_id = get_trace_id().RequestId
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    middleware = RequestIdMiddleware(app, ULIDTraceIdGenerator())
+    asyncio.run(middleware(scope, MagicMock(), send, log=MagicMock()))
+    return scope, messages, seen_trace_id
+
+
+def test__RequestIdMiddleware__stores_validated_request_id_in_scope():
+    request_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+
+    scope, messages, seen_trace_id = _run_request_id_middleware([
+        (b"x-correlation-id", request_id.encode())
+    ])
+
+    assert get_request_id(scope) == request_id
+    assert seen_trace_id == request_id
+    assert (b"x-correlation-id", request_id.encode()) in messages[0]["headers"]
+
+
+def test__RequestIdMiddleware__generates_request_id_with_generator():
+    scope, messages, _ = _run_request_id_middleware([])
+
+    request_id = get_request_id(scope)
+    assert request_id is not None
+    assert ULIDTraceIdGenerator().validate(request_id) == request_id
+    assert (b"x-correlation-id", request_id.encode()) in scope["headers"]
+    assert (b"x-correlation-id", request_id.encode()) in messages[0]["headers"]
+
+
+def test__RequestIdMiddleware__rejects_request_id_in_wrong_format():
+    with pytest.raises(ValueError):
+        _ = _run_request_id_middleware([
+            (b"x-correlation-id", b"5fd5c1a4-1a3f-4a3f-9ccd-3d1d2a1b7a4e")
+        ])
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import pytest
+from connexion.spec import Specification
+from Ligare.web.specification import (
+    load_specification,
+    override_connexion_specification,
+    specification_cache_key,
+)
+from pytest_mock import MockerFixture
+
+_SPEC = """openapi: 3.0.3
+info:
+  title: "test"
+  version: 1.0.0
+servers:
+  - url: /api
+paths:
+  /:
+    get:
+      operationId: root.get
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema:
+                $ref: "#/components/schemas/Thing"
+components:
+  schemas:
+    Thing:
+      type: object
+"""
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> Path:
+    spec_file = tmp_path / "spec" / "openapi.yaml"
+    spec_file.parent.mkdir()
+    _ = spec_file.write_text(_SPEC)
+    return spec_file
+
+
+def test__specification_cache_key__changes_when_specification_files_change(
+    spec_file: Path,
+):
+    key = specification_cache_key(spec_file)
+    assert specification_cache_key(spec_file) == key
+
+    _ = (spec_file.parent / "schemas.yaml").write_text("Other: {}")
+    assert specification_cache_key(spec_file) != key
+
+
+def test__specification_cache_key__changes_when_specification_files_in_subdirectories_change(
+    spec_file: Path,
+):
+    schema_file = spec_file.parent / "schemas" / "thing.yaml"
+    schema_file.parent.mkdir()
+    _ = schema_file.write_text("type: object")
+    key = specification_cache_key(spec_file)
+
+    _ = schema_file.write_text("type: string")
+    assert specification_cache_key(spec_file) != key
+
+
+def test__load_specification__reuses_cached_specification(
+    spec_file: Path, tmp_path: Path, mocker: MockerFixture
+):
+    cache_dir = tmp_path / "cache"
+    specification = load_specification(spec_file, cache_dir)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    load_mock = mocker.patch.object(Specification, "load")
+    cached_specification = load_specification(spec_file, cache_dir)
+
+    load_mock.assert_not_called()
+    assert cached_specification.raw == specification.raw
+    assert dict(cached_specification) == dict(specification)
+
+
+def test__load_specification__reparses_changed_specification(
+    spec_file: Path, tmp_path: Path
+):
+    cache_dir = tmp_path / "cache"
+    _ = load_specification(spec_file, cache_dir)
+
+    _ = spec_file.write_text(_SPEC.replace('title: "test"', 'title: "changed"'))
+    specification = load_specification(spec_file, cache_dir)
+
+    assert specification["info"]["title"] == "changed"
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test__load_specification__ignores_unreadable_cache(spec_file: Path, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    _ = load_specification(spec_file, cache_dir)
+    for cache_file in cache_dir.glob("*.pickle"):
+        _ = cache_file.write_bytes(b"not a pickle")
+
+    specification = load_specification(spec_file, cache_dir)
+
+    assert specification["info"]["title"] == "test"
+
+
+def test__override_connexion_specification__clone_shares_nested_values(
+    spec_file: Path,
+):
+    override_connexion_specification()
+    specification = Specification.load(spec_file)
+
+    clone = specification.with_base_path("/prefix")
+
+    assert clone.base_path == "/prefix"
+    assert specification.base_path == "/api"
+    assert specification.raw["servers"] == [{"url": "/api"}]
+    assert clone["paths"] is specification["paths"]
+
+
+def test__override_connexion_specification__load_accepts_specification(
+    spec_file: Path,
+):
+    override_connexion_specification()
+    specification = Specification.load(spec_file)
+
+    assert Specification.load(specification) is specification